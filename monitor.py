@@ -3,21 +3,55 @@ monitor.py – Phase 2 backend script for Diffy.
 Uses Playwright to bypass aggressive bot detection (Cloudflare 403s).
 """
 
+import asyncio
 import difflib
+import hashlib
 import json
+import math
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
 import random
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from bs4 import BeautifulSoup
-import requests
-from playwright.sync_api import sync_playwright
-from playwright_stealth import Stealth  # Updated import
+# Playwright, playwright-stealth, BeautifulSoup and requests take hundreds of
+# milliseconds to import, so they are loaded on first use (see the loaders
+# below) and runs that never fetch a page or call the API start quickly.
+sync_playwright = None
+Stealth = None
+BeautifulSoup = None
+
+
+def _load_browser_modules() -> None:
+    """Import Playwright and playwright-stealth on first use."""
+    global sync_playwright, Stealth
+    if sync_playwright is None:
+        from playwright.sync_api import sync_playwright as _sync_playwright
+        sync_playwright = _sync_playwright
+    if Stealth is None:
+        from playwright_stealth import Stealth as _Stealth
+        Stealth = _Stealth
+
+
+def _get_beautiful_soup():
+    """Import and return ``bs4.BeautifulSoup`` on first use."""
+    global BeautifulSoup
+    if BeautifulSoup is None:
+        from bs4 import BeautifulSoup as _BeautifulSoup
+        BeautifulSoup = _BeautifulSoup
+    return BeautifulSoup
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -31,6 +65,7 @@ SNAPSHOTS_DIR = BASE_DIR / "data" / "snapshots"
 DATA_RESULTS_PATH = BASE_DIR / "data" / "results.json"
 PUBLIC_RESULTS_PATH = BASE_DIR / "public" / "data" / "results.json"
 TOS_DIR = BASE_DIR / "terms_of_service"
+AI_CACHE_DIR = BASE_DIR / "data" / "ai_cache"
 
 # ---------------------------------------------------------------------------
 # Hybrid substantive diff configuration
@@ -50,6 +85,33 @@ HOT_SECTION_KEYWORDS: dict[str, list[str]] = {
     "governing_law": [r"\bgoverning\s+law\b", r"\bjurisdiction\b"],
 }
 
+# All HOT_SECTION_KEYWORDS fused into one case-insensitive regex, so each
+# paragraph is scanned once instead of once per pattern.  Every section is a
+# named group inside a lookahead: matches are zero-width, so finditer tries
+# every position and a match for one section never consumes text another
+# section's pattern needs.  ``match.lastgroup`` names the matching section.
+_HOT_SECTION_UNION: re.Pattern = re.compile(
+    "|".join(
+        f"(?=(?P<{name}>{'|'.join(patterns)}))"
+        for name, patterns in HOT_SECTION_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Lowercase substrings at least one of which occurs in any text matched by a
+# HOT_SECTION_KEYWORDS pattern.  Paragraphs containing none of them – most of
+# a ToS – are skipped with cheap ``in`` checks before the regex runs.  Keep in
+# sync with HOT_SECTION_KEYWORDS when adding patterns.
+_HOT_SECTION_ANCHORS: tuple[str, ...] = (
+    "liabilit", "indemnif", "privac", "personal", "data", "arbitrat", "disput",
+    "class", "terminat", "suspend", "user", "artificial", "machine", "train",
+    "governing", "jurisdiction",
+)
+
+# re.IGNORECASE also lets "İ" and "ı" match "i", but str.casefold() keeps "ı"
+# and turns "İ" into "i" plus a combining dot, so both are mapped first.
+_ANCHOR_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
 # Similarity score below which a section change is considered substantive.
 # Applies to both spaCy vector similarity (when available) and the
 # SequenceMatcher fallback.  Range: 0.0 (totally different) – 1.0 (identical).
@@ -194,27 +256,114 @@ AI_TOS_SUMMARY_PROMPT = (
     "Return only the summary, no explanation or intro."
 )
 
+# ---------------------------------------------------------------------------
+# JSON serialisation
+# ---------------------------------------------------------------------------
+
+# orjson (Rust, SIMD UTF-8) parses and pretty-prints several times faster than
+# the stdlib json module.  It is optional: when it is not installed every
+# helper below falls back to json with identical output semantics.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str | bytes):
+    """Parse JSON text or UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes, pretty-printed with 2 spaces if *indent*."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _new_file_mode() -> int:
+    """Return the mode ``open()`` would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# mkstemp creates files as 0600; atomically written files get this mode instead
+# so they stay readable exactly as a plain write would leave them.  Read once at
+# import because os.umask() can only be queried by briefly changing it.
+_NEW_FILE_MODE = _new_file_mode()
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* atomically.
+
+    The bytes go to a temporary file in the same directory which is then
+    renamed over *path* with ``os.replace``, so readers (e.g. the frontend
+    dev server) see either the old file or the new one, never a partial write.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, _NEW_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _mirror_file(src: Path, dst: Path) -> None:
+    """Atomically make *dst* an identical copy of *src*.
+
+    A hard link is used when both paths are on the same filesystem, so the
+    second copy costs no extra serialisation or write bandwidth; otherwise the
+    file is copied with ``shutil.copyfile``, which copies in-kernel
+    (``sendfile`` on Linux, ``fcopyfile`` on macOS) without passing the bytes
+    through user space.  Either way the result is renamed into place.
+    """
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    with suppress(FileNotFoundError):
+        tmp.unlink()
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
 def ensure_dirs() -> None:
     SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
     TOS_DIR.mkdir(parents=True, exist_ok=True)
     PUBLIC_RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+
+# Accepted values for a company's optional "engine" key ("browser" if omitted).
+FETCH_ENGINES: tuple[str, ...] = ("browser", "http", "auto")
+
+
 def load_config() -> list[dict]:
-    with open(CONFIG_PATH, encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("companies", [])
+    data = _json_loads(CONFIG_PATH.read_bytes())
+    companies = data.get("companies", [])
+    for company in companies:
+        engine = company.get("engine", "browser")
+        if engine not in FETCH_ENGINES:
+            raise ValueError(
+                f"load_config: {company.get('name', '?')!r} has unknown engine {engine!r} "
+                f"(expected one of: {', '.join(FETCH_ENGINES)})"
+            )
+    return companies
 
 
 def load_cases() -> list[dict]:
     """Load the standardized case definitions from cases.json."""
     if CASES_PATH.exists():
         try:
-            with open(CASES_PATH, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(CASES_PATH.read_bytes())
             return data.get("cases", [])
         except (json.JSONDecodeError, OSError):
             pass
@@ -247,9 +396,185 @@ def calculate_score_from_cases(case_ids: list[str]) -> int:
             score += case.get("weight", 0)
     return max(0, min(100, score))
 
+# Characters not allowed in snapshot / archive file names.
+_SLUG_RE = re.compile(r"[^\w\-]")
+
+@lru_cache(maxsize=None)
+def company_slug(company_name: str) -> str:
+    """Return a filesystem-safe slug for a company name.
+
+    The path helpers below call this several times per company per run, so
+    the result is memoised; the set of company names is small and fixed.
+    """
+    return _SLUG_RE.sub("_", company_name)
+
 def snapshot_path(company_name: str) -> Path:
-    safe = re.sub(r"[^\w\-]", "_", company_name)
-    return SNAPSHOTS_DIR / f"{safe}.txt"
+    return SNAPSHOTS_DIR / f"{company_slug(company_name)}.txt"
+
+# Tags whose content is never part of the legal text.
+_NON_CONTENT_TAGS: list[str] = ["script", "style", "noscript", "header", "footer", "nav", "aside"]
+
+# Module-level cache for the optional selectolax (lexbor) HTML parser class.
+# None = not yet attempted; False = unavailable; class object = loaded.
+_html_parser_class: Optional[object] = None
+
+
+def _get_html_parser() -> Optional[object]:
+    """Lazily import and cache selectolax's lexbor parser.  Returns None if unavailable."""
+    global _html_parser_class
+    if _html_parser_class is None:
+        try:
+            from selectolax.lexbor import LexborHTMLParser  # type: ignore
+            _html_parser_class = LexborHTMLParser
+        except Exception:
+            _html_parser_class = False
+    return _html_parser_class if _html_parser_class is not False else None
+
+
+def html_to_text(html_content: str) -> str:
+    """Return the visible text of a rendered page, one stripped text node per line.
+
+    Scripts, styles, and common UI elements (header/footer/nav/aside) are
+    removed first to keep the legal text clean.  Uses selectolax's C parser
+    when installed – an order of magnitude faster than BeautifulSoup's
+    pure-Python ``html.parser`` on large pages – and BeautifulSoup otherwise.
+    Both paths produce the same output as
+    ``soup.get_text(separator="\\n", strip=True)``.
+    """
+    parser_class = _get_html_parser()
+    if parser_class is None:
+        soup = _get_beautiful_soup()(html_content, "html.parser")
+        for tag in soup(_NON_CONTENT_TAGS):
+            tag.decompose()
+        return soup.get_text(separator="\n", strip=True)
+
+    tree = parser_class(html_content)
+    tree.strip_tags(_NON_CONTENT_TAGS)
+    if tree.root is None:
+        return ""
+    # Let lexbor walk the tree and strip every text node in C.  NUL never
+    # survives HTML parsing, so it is a safe separator for splitting the
+    # nodes apart again; empty (whitespace-only) nodes are then dropped.
+    pieces = tree.root.text(separator="\x00", strip=True).split("\x00")
+    return "\n".join(filter(None, pieces))
+
+
+# Per-thread shared browser state.  Inside a ``shared_browser()`` block the
+# calling thread's ``fetch_text`` calls reuse one Chromium instance (opening a
+# fresh context per attempt) instead of launching a new browser per URL.
+# Playwright's sync API is bound to the thread that started it, hence the
+# thread-local rather than a module global.
+_browser_local = threading.local()
+
+
+def _launch_browser(p):
+    # Launch Chromium with HTTP/2 disabled to avoid
+    # ERR_HTTP2_PROTOCOL_ERROR on sites like Adobe, Ford, and
+    # United Airlines that have aggressive HTTP/2 configurations.
+    return p.chromium.launch(headless=True, args=["--disable-http2"])
+
+
+@contextmanager
+def shared_browser():
+    """Reuse a single headless browser for every ``fetch_text`` on this thread.
+
+    The browser is launched lazily on the first fetch and closed when the
+    block exits, so Chromium's cold-start cost is paid once per block rather
+    than once per URL.
+    """
+    state: dict = {}
+    _browser_local.state = state
+    try:
+        yield
+    finally:
+        del _browser_local.state
+        if state:
+            try:
+                browser = state.get("browser")
+                if browser is not None:
+                    browser.close()
+            finally:
+                state["playwright"].stop()
+
+
+@contextmanager
+def _browser_for_attempt():
+    """Yield a browser for one fetch attempt.
+
+    Inside ``shared_browser()`` this is the thread's shared browser (launched
+    on first use and relaunched if it has disconnected); otherwise a
+    throw-away browser is launched and closed around the attempt.
+    """
+    _load_browser_modules()
+    state = getattr(_browser_local, "state", None)
+    if state is None:
+        with sync_playwright() as p:
+            browser = _launch_browser(p)
+            try:
+                yield browser
+            finally:
+                browser.close()
+        return
+    if not state:
+        # Only publish a fully started pair: a failed launch must not leave
+        # a half-filled state behind for later fetches or the teardown.
+        playwright = sync_playwright().start()
+        try:
+            browser = _launch_browser(playwright)
+        except BaseException:
+            playwright.stop()
+            raise
+        state["playwright"] = playwright
+        state["browser"] = browser
+    elif not state["browser"].is_connected():
+        state["browser"] = _launch_browser(state["playwright"])
+    yield state["browser"]
+
+
+class NotModified(Exception):
+    """Raised by ``fetch_text_http`` when the server answers ``304 Not Modified``."""
+
+
+# HTTP cache validators per URL – ``{"etag": ..., "last_modified": ...}`` –
+# sent back as ``If-None-Match`` / ``If-Modified-Since`` on the next fetch.
+# monitor() seeds this from the per-company ``.meta.json`` sidecars (see
+# _seed_http_validators) and fetch_text_http records the validators of every
+# successful response.  Only plain-HTTP fetches use them.
+_http_validators: dict[str, dict] = {}
+
+
+# Realistic desktop user agent sent by both the browser and plain-HTTP fetchers.
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+
+
+def _record_validators(url: str, headers) -> None:
+    """Remember the ETag / Last-Modified of a successful response for *url*."""
+    validators = {
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+    }
+    _http_validators[url] = {k: v for k, v in validators.items() if v}
+
+
+def _conditional_headers(validators: dict) -> dict[str, str]:
+    """Return the conditional request headers for stored *validators*."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the back-off (seconds) before retrying after failed *attempt*.
+
+    Exponential – 5 s, 10 s, 20 s, … – plus up to 50 % random jitter, so that
+    concurrent fetch workers that failed together do not retry in lockstep.
+    """
+    base = 5 * (2 ** (attempt - 1))
+    return base + random.uniform(0, base / 2)
+
 
 def fetch_text(url: str, max_retries: int = 3) -> str:
     """Fetch URL using a headless browser with updated stealth patterns.
@@ -262,20 +587,20 @@ def fetch_text(url: str, max_retries: int = 3) -> str:
     - The timeout is raised to 90 000 ms to give slow-loading pages more room.
     - Up to ``max_retries`` attempts are made with exponential back-off so
       transient network blips don't cause a hard failure.
+
+    Each attempt runs in a fresh browser context; the browser itself is shared
+    when called inside ``shared_browser()``.
+
+    Requests are never conditional: a ``304`` would only vouch for the HTML
+    shell, not for text rendered by JavaScript, so validators are left to
+    ``fetch_text_http``.
     """
     last_exc: Exception = Exception(f"All {max_retries} attempts to fetch {url} failed.")
 
     for attempt in range(1, max_retries + 1):
-        with sync_playwright() as p:
-            # Launch Chromium with HTTP/2 disabled to avoid
-            # ERR_HTTP2_PROTOCOL_ERROR on sites like Adobe, Ford, and
-            # United Airlines that have aggressive HTTP/2 configurations.
-            browser = p.chromium.launch(headless=True, args=["--disable-http2"])
-
+        with _browser_for_attempt() as browser:
             # Set a realistic user agent
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-            )
+            context = browser.new_context(user_agent=BROWSER_USER_AGENT)
 
             page = context.new_page()
 
@@ -292,15 +617,8 @@ def fetch_text(url: str, max_retries: int = 3) -> str:
                 # external sites.  Timeout increased to 90 s for slow pages.
                 page.goto(url, wait_until="domcontentloaded", timeout=90000)
 
-                # Get rendered HTML
-                html_content = page.content()
-                soup = BeautifulSoup(html_content, "html.parser")
-
-                # Remove scripts, styles, and common UI elements to keep legal text clean
-                for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
-                    tag.decompose()
-
-                return soup.get_text(separator="\n", strip=True)
+                # Get rendered HTML and reduce it to the legal text
+                return html_to_text(page.content())
 
             except Exception as e:
                 last_exc = e
@@ -308,59 +626,431 @@ def fetch_text(url: str, max_retries: int = 3) -> str:
                     f"  [attempt {attempt}/{max_retries}] Failed to fetch {url}: {e}"
                 )
                 if attempt < max_retries:
-                    # Exponential back-off: 5 s, 10 s, 20 s, …
-                    backoff = 5 * (2 ** (attempt - 1))
-                    print(f"  Retrying in {backoff}s…")
+                    backoff = _retry_delay(attempt)
+                    print(f"  Retrying in {backoff:.1f}s…")
                     time.sleep(backoff)
             finally:
-                browser.close()
+                context.close()
 
     raise Exception(f"Playwright failed to fetch {url}: {last_exc}")
 
+
+def fetch_text_http(url: str) -> str:
+    """Fetch URL with a plain HTTP GET on the shared session – no browser.
+
+    For companies configured with ``"engine": "http"``: sites that serve
+    their ToS as static HTML and need neither JavaScript nor bot-check
+    evasion.  This skips the browser launch, page render and stealth delay
+    entirely.  Retries come from the session's ``Retry`` policy.
+
+    When validators from a previous fetch of *url* are known, the request is
+    made conditional; a ``304 Not Modified`` reply raises ``NotModified`` so
+    the caller can skip the parse and diff.
+    """
+    headers = {
+        "User-Agent": BROWSER_USER_AGENT,
+        **_conditional_headers(_http_validators.get(url, {})),
+    }
+    resp = _get_http_session().get(url, headers=headers, timeout=60)
+    if resp.status_code == 304:
+        raise NotModified(url)
+    resp.raise_for_status()
+    _record_validators(url, resp.headers)
+    if "charset" not in resp.headers.get("content-type", "").lower():
+        # requests assumes ISO-8859-1 for text/* without a charset, which
+        # garbles UTF-8 pages; sniff the body instead.
+        resp.encoding = resp.apparent_encoding
+    return html_to_text(resp.text)
+
+
+# Plain-HTTP results shorter than this are treated as a JavaScript shell or a
+# bot-check interstitial by ``fetch_text_auto``: real ToS pages are far longer.
+AUTO_MIN_TEXT_CHARS: int = 2000
+
+
+def fetch_text_auto(url: str) -> str:
+    """Fetch URL with a plain HTTP GET, falling back to the browser when needed.
+
+    For companies configured with ``"engine": "auto"``.  The page is first
+    requested with ``fetch_text_http``; only if that fails (e.g. a 403/503
+    bot wall) or yields fewer than ``AUTO_MIN_TEXT_CHARS`` characters of text
+    is it rendered with ``fetch_text``.  Since the worker's browser is
+    launched lazily, a run where every page is served statically never
+    starts Chromium at all.  ``NotModified`` is propagated as-is.
+    """
+    try:
+        text = fetch_text_http(url)
+        if len(text) >= AUTO_MIN_TEXT_CHARS:
+            return text
+    except NotModified:
+        raise
+    except Exception:
+        pass
+    # The plain response is not the real page, so its validators must not be
+    # sent with the next run's conditional request.
+    _http_validators.pop(url, None)
+    return fetch_text(url)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Return the positive integer in environment variable *name*, else *default*.
+
+    Lets CI tune the concurrency limits below to the runner's size without a
+    code change; unset, empty or invalid values fall back to *default*.
+    """
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Maximum number of ToS pages fetched at the same time.  Each fetch worker
+# drives its own headless Chromium instance, so this is kept well below the
+# CPU count of a typical CI runner.  Each limit below can be overridden with
+# the environment variable of the same name.
+FETCH_CONCURRENCY: int = _env_int("FETCH_CONCURRENCY", 4)
+
+# Maximum number of plain-HTTP (``"engine": "http"``) fetches at once.  These
+# cost a pooled connection rather than a browser, so more can run together.
+HTTP_FETCH_CONCURRENCY: int = _env_int("HTTP_FETCH_CONCURRENCY", 8)
+
+# Maximum number of fetched pages processed (compared, diffed and summarised
+# by the AI) at the same time.  This work is dominated by OpenAI latency, so
+# different companies' calls overlap on the pooled HTTP session.
+AI_CONCURRENCY: int = _env_int("AI_CONCURRENCY", 4)
+
+
+def _drain_jobs(jobs: deque, deliver) -> None:
+    """Run each ``(index, url, fetch)`` job in turn, passing the text (or exception) to ``deliver``."""
+    while True:
+        try:
+            index, url, fetch = jobs.popleft()
+        except IndexError:
+            return
+        try:
+            result = fetch(url)
+        except Exception as exc:
+            result = exc
+        deliver(index, result)
+
+
+def _fetch_worker(jobs: deque, deliver) -> None:
+    """Drain browser ``jobs`` on one thread, sharing a single browser."""
+    with shared_browser():
+        _drain_jobs(jobs, deliver)
+
+
+def fetch_and_process(urls: list[str], process, engines: list[str] | None = None) -> list:
+    """Fetch every URL and process each page as soon as it arrives.
+
+    Fetching and processing run as a producer/consumer pipeline: up to
+    ``FETCH_CONCURRENCY`` fetch workers push ``(index, fetch_result)`` onto an
+    ``asyncio.Queue`` while up to ``AI_CONCURRENCY`` consumers pull from it
+    and call ``process(index, fetch_result)`` on a worker thread.  AI calls
+    for early pages therefore run while later pages are still loading, so a
+    scan takes roughly the longer of the two phases rather than their sum.
+
+    *engines* gives each URL's fetch engine.  ``"http"`` URLs are fetched by
+    up to ``HTTP_FETCH_CONCURRENCY`` plain-HTTP workers (``fetch_text_http``)
+    alongside the browser workers, so static pages never queue behind
+    browser renders.  ``"auto"`` URLs go to the browser workers but try
+    ``fetch_text_auto``'s plain-HTTP path first; anything else (the default)
+    uses ``fetch_text``.
+
+    A URL listed more than once is fetched only once, and its result is
+    processed for each of its indices.  *fetch_result* is either the fetched
+    text or the exception raised while fetching it; fetch failures never
+    abort the batch.  The return values of
+    ``process`` are returned in input order, and the first exception raised
+    by ``process`` propagates.
+    """
+    if not urls:
+        return []
+    engines = engines or ["browser"] * len(urls)
+    fetchers_by_engine = {"browser": fetch_text, "http": fetch_text_http, "auto": fetch_text_auto}
+    # Companies sharing a ToS URL (e.g. subsidiaries) share one fetch: only the
+    # first occurrence is queued and its result is delivered to every index.
+    sharers: dict[str, list[int]] = {}
+    for i, url in enumerate(urls):
+        sharers.setdefault(url, []).append(i)
+    jobs = [
+        (indices[0], url, fetchers_by_engine[engines[indices[0]]])
+        for url, indices in sharers.items()
+    ]
+    browser_jobs: deque = deque(job for job in jobs if engines[job[0]] != "http")
+    http_jobs: deque = deque(job for job in jobs if engines[job[0]] == "http")
+    results: list = [None] * len(urls)
+
+    async def _pipeline() -> None:
+        loop = asyncio.get_running_loop()
+        fetchers = min(FETCH_CONCURRENCY, len(browser_jobs))
+        http_fetchers = min(HTTP_FETCH_CONCURRENCY, len(http_jobs))
+        consumers = min(AI_CONCURRENCY, len(urls))
+        # Dedicated pool so blocked fetch workers never starve the consumers.
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=fetchers + http_fetchers + consumers)
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def deliver(index: int, fetch_result) -> None:
+            for sharer in sharers[urls[index]]:
+                loop.call_soon_threadsafe(queue.put_nowait, (sharer, fetch_result))
+
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                index, fetch_result = item
+                results[index] = await asyncio.to_thread(process, index, fetch_result)
+
+        consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+        await asyncio.gather(
+            *(asyncio.to_thread(_fetch_worker, browser_jobs, deliver) for _ in range(fetchers)),
+            *(asyncio.to_thread(_drain_jobs, http_jobs, deliver) for _ in range(http_fetchers)),
+        )
+        for _ in consumer_tasks:
+            queue.put_nowait(None)
+        await asyncio.gather(*consumer_tasks)
+
+    asyncio.run(_pipeline())
+    return results
+
+
+def fetch_all_texts(urls: list[str]) -> list:
+    """Fetch every URL concurrently and return the results in input order.
+
+    Each element of the returned list is either the fetched text or the
+    exception raised while fetching that URL; failures never abort the batch.
+    See ``fetch_and_process`` for how the fetches are scheduled.
+    """
+    return fetch_and_process(urls, lambda index, fetch_result: fetch_result)
+
+
+# Module-level cache for the optional xxhash module.
+# None = not yet attempted; False = unavailable; module object = loaded.
+_xxhash = None
+
+def _get_xxhash() -> Optional[object]:
+    """Return the xxhash module, or None if it is not installed."""
+    global _xxhash
+    if _xxhash is None:
+        try:
+            import xxhash
+            _xxhash = xxhash
+        except ImportError:
+            _xxhash = False
+    return _xxhash or None
+
+def content_hash(text: str) -> str:
+    """Return a short hex digest used to detect snapshot changes.
+
+    This is an equality fingerprint, not a security primitive: comparing two
+    short digests is much cheaper than loading and comparing two
+    multi-megabyte ToS strings.  XXH3-64 is used when xxhash is installed
+    (an order of magnitude faster than BLAKE2b), otherwise BLAKE2b.  XXH3
+    digests carry an ``xxh3:`` prefix so that a digest written by one
+    algorithm can never match one computed by the other.
+    """
+    data = text.encode("utf-8")
+    xxhash = _get_xxhash()
+    if xxhash:
+        return f"xxh3:{xxhash.xxh3_64_hexdigest(data)}"
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def snapshot_hash_path(company_name: str) -> Path:
+    """Return the path of the content-hash sidecar stored next to a snapshot."""
+    return snapshot_path(company_name).with_suffix(".hash")
+
+# Module-level cache for the optional zstandard module used for snapshots.
+# None = not yet attempted; False = unavailable; module object = loaded.
+_zstd = None
+
+# Zstandard level for snapshots: level 3 shrinks ToS text 3-5x and
+# decompresses far faster than the disk could read the uncompressed file.
+SNAPSHOT_ZSTD_LEVEL: int = 3
+
+def _get_zstd() -> Optional[object]:
+    """Return the zstandard module, or None if it is not installed."""
+    global _zstd
+    if _zstd is None:
+        try:
+            import zstandard
+            _zstd = zstandard
+        except ImportError:
+            _zstd = False
+    return _zstd or None
+
+def compressed_snapshot_path(company_name: str) -> Path:
+    """Return the path of a company's Zstandard-compressed snapshot."""
+    return snapshot_path(company_name).with_suffix(".txt.zst")
+
+def _existing_snapshot_path(company_name: str) -> Path | None:
+    """Return the snapshot file on disk for a company, or None.
+
+    Compressed snapshots are preferred; plain ``.txt`` snapshots written
+    before compression was introduced (or without zstandard installed) are
+    still honoured.
+    """
+    compressed = compressed_snapshot_path(company_name)
+    if _get_zstd() and compressed.exists():
+        return compressed
+    plain = snapshot_path(company_name)
+    return plain if plain.exists() else None
+
 def read_snapshot(company_name: str) -> str | None:
-    path = snapshot_path(company_name)
-    if path.exists():
-        return path.read_text(encoding="utf-8")
+    """Return the stored snapshot text, migrating a legacy plain snapshot.
+
+    A plain ``.txt`` snapshot read while zstandard is available is rewritten
+    in compressed form so later reads take the fast path.
+    """
+    path = _existing_snapshot_path(company_name)
+    if path is None:
+        return None
+    if path.suffix == ".zst":
+        return _get_zstd().decompress(path.read_bytes()).decode("utf-8")
+    text = path.read_text(encoding="utf-8")
+    if _get_zstd():
+        write_snapshot(company_name, text)
+    return text
+
+def read_snapshot_hash(company_name: str) -> str | None:
+    """Return the stored content hash of a company's snapshot, or None.
+
+    Returns None when either the snapshot or its sidecar is missing (e.g.
+    snapshots written before sidecars existed), so callers fall back to
+    reading the full snapshot.
+    """
+    hash_path = snapshot_hash_path(company_name)
+    if hash_path.exists() and _existing_snapshot_path(company_name) is not None:
+        return hash_path.read_text(encoding="utf-8").strip()
     return None
 
-def write_snapshot(company_name: str, text: str) -> None:
-    snapshot_path(company_name).write_text(text, encoding="utf-8")
+def write_snapshot(company_name: str, text: str, digest: str | None = None) -> None:
+    data = text.encode("utf-8")
+    zstd = _get_zstd()
+    if zstd:
+        _atomic_write(compressed_snapshot_path(company_name), zstd.compress(data, SNAPSHOT_ZSTD_LEVEL))
+        snapshot_path(company_name).unlink(missing_ok=True)
+    else:
+        _atomic_write(snapshot_path(company_name), data)
+        compressed_snapshot_path(company_name).unlink(missing_ok=True)
+    _atomic_write(snapshot_hash_path(company_name), (digest or content_hash(text)).encode("utf-8"))
 
-def company_slug(company_name: str) -> str:
-    """Return a filesystem-safe slug for a company name."""
-    return re.sub(r"[^\w\-]", "_", company_name)
+def snapshot_meta_path(company_name: str) -> Path:
+    """Return the path of the HTTP validator sidecar stored next to a snapshot."""
+    return snapshot_path(company_name).with_suffix(".meta.json")
+
+def read_snapshot_meta(company_name: str) -> dict:
+    """Return the stored HTTP validators for a company's snapshot.
+
+    Returns an empty dict when either the snapshot or its sidecar is missing
+    (or the sidecar is unreadable): a conditional request is only safe when
+    the text a ``304`` would stand for is actually on disk.
+    """
+    meta_path = snapshot_meta_path(company_name)
+    if not (meta_path.exists() and _existing_snapshot_path(company_name) is not None):
+        return {}
+    try:
+        meta = _json_loads(meta_path.read_bytes())
+    except ValueError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+def write_snapshot_meta(company_name: str, meta: dict) -> None:
+    """Persist *meta* as the snapshot's HTTP validators, skipping no-op writes."""
+    meta_path = snapshot_meta_path(company_name)
+    if not meta:
+        meta_path.unlink(missing_ok=True)
+    elif read_snapshot_meta(company_name) != meta:
+        _atomic_write(meta_path, _json_dumps(meta))
 
 def tos_archive_dir(company_name: str) -> Path:
     """Return the archive directory for a company."""
     return TOS_DIR / company_slug(company_name)
 
-def get_latest_archived_tos(company_name: str) -> str | None:
-    """Return the text of the most recently archived ToS, or None if no archive exists."""
+def _dated_archive_files(company_name: str) -> list[Path]:
+    """Return a company's dated archive files, oldest first (empty if none exist)."""
     archive_dir = tos_archive_dir(company_name)
-    if not archive_dir.exists():
-        return None
-    dated_files = sorted(f for f in archive_dir.glob("*.txt") if f.name != "summary.txt")
+    # scandir yields names and file types from one readdir pass, without
+    # building a Path (or issuing a stat) per entry as glob() would.
+    try:
+        with os.scandir(archive_dir) as entries:
+            names = sorted(
+                e.name for e in entries
+                if e.name.endswith(".txt") and e.name != "summary.txt" and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [archive_dir / name for name in names]
+
+def _file_matches(path: Path, data: bytes) -> bool:
+    """Return True if *path* holds exactly *data*, skipping the read when sizes differ."""
+    return path.stat().st_size == len(data) and path.read_bytes() == data
+
+_LATEST_POINTER = ".latest"
+
+def _write_latest_pointer(archive_dir: Path, name: str, digest: str) -> None:
+    """Record *name* (hashing to *digest*) as the newest archive in *archive_dir*."""
+    _atomic_write(archive_dir / _LATEST_POINTER, f"{name}\n{digest}\n".encode("utf-8"))
+
+def _latest_archive_file(company_name: str) -> tuple[Path, str] | None:
+    """Return the newest dated archive file and its content hash, or None.
+
+    Both come from the ``.latest`` pointer, so the unchanged check never
+    reads the archive itself.  Archives written before the pointer existed
+    (or whose pointer has gone stale) fall back to listing the directory,
+    and the pointer is recorded for next time.
+    """
+    archive_dir = tos_archive_dir(company_name)
+    try:
+        name, _, digest = (archive_dir / _LATEST_POINTER).read_text(encoding="utf-8").partition("\n")
+    except OSError:
+        name = digest = ""
+    latest = archive_dir / name.strip()
+    if digest.strip() and latest.is_file():
+        return latest, digest.strip()
+    dated_files = _dated_archive_files(company_name)
     if not dated_files:
         return None
-    return dated_files[-1].read_text(encoding="utf-8")
+    latest = dated_files[-1]
+    digest = content_hash(latest.read_text(encoding="utf-8"))
+    _write_latest_pointer(archive_dir, latest.name, digest)
+    return latest, digest
+
+def get_latest_archived_tos(company_name: str) -> str | None:
+    """Return the text of the most recently archived ToS, or None if no archive exists."""
+    latest = _latest_archive_file(company_name)
+    if latest is None:
+        return None
+    return latest[0].read_text(encoding="utf-8")
 
-def archive_tos_if_changed(company_name: str, new_text: str) -> bool:
+def archive_tos_if_changed(
+    company_name: str, new_text: str, when: datetime | None = None, digest: str | None = None
+) -> bool:
     """Save new_text as a dated archive file if it differs from the latest archived version.
 
+    The archive file is named after the UTC date of *when* (default: now).
+    *digest* is ``content_hash(new_text)`` when the caller already has it.
     Returns True if a new archive file was written, False if the content is unchanged.
     """
+    # Comparing against the pointer's recorded hash avoids reading the archived copy.
+    digest = digest or content_hash(new_text)
+    latest = _latest_archive_file(company_name)
+    if latest is not None and latest[1] == digest:
+        return False
     archive_dir = tos_archive_dir(company_name)
-    archive_dir.mkdir(parents=True, exist_ok=True)
-    if get_latest_archived_tos(company_name) == new_text:
+    data = new_text.encode("utf-8")
+    # A differing digest may only mean the pointer was written by the other
+    # hasher (XXH3 vs BLAKE2b), so confirm against the archived bytes.
+    if latest is not None and _file_matches(latest[0], data):
+        _write_latest_pointer(archive_dir, latest[0].name, digest)
         return False
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    dated_files = _dated_archive_files(company_name)
+    date_str = (when or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
     # Find all existing dated files for today so that a new file always sorts
     # *after* them.  This prevents re-using a lower-numbered slot after
     # prune_old_tos_archives() deletes earlier versions.
-    existing_today = sorted(
-        f for f in archive_dir.glob("*.txt")
-        if f.name != "summary.txt" and f.stem.startswith(date_str)
-    )
+    existing_today = [f for f in dated_files if f.stem.startswith(date_str)]
     if not existing_today:
         archive_path = archive_dir / f"{date_str}.txt"
     else:
@@ -369,7 +1059,8 @@ def archive_tos_if_changed(company_name: str, new_text: str) -> bool:
         while archive_path.exists():
             suffix += 1
             archive_path = archive_dir / f"{date_str}_{suffix}.txt"
-    archive_path.write_text(new_text, encoding="utf-8")
+    _atomic_write(archive_path, data)
+    _write_latest_pointer(archive_dir, archive_path.name, digest)
     return True
 
 def prune_old_tos_archives(company_name: str) -> int:
@@ -381,10 +1072,7 @@ def prune_old_tos_archives(company_name: str) -> int:
     This is safe to call at any time; if there is only one snapshot (or
     none) the function is a no-op.
     """
-    archive_dir = tos_archive_dir(company_name)
-    if not archive_dir.exists():
-        return 0
-    dated_files = sorted(f for f in archive_dir.glob("*.txt") if f.name != "summary.txt")
+    dated_files = _dated_archive_files(company_name)
     if len(dated_files) <= 1:
         return 0
     to_delete = dated_files[:-1]  # all but the last (most recent)
@@ -404,18 +1092,225 @@ def write_tos_summary(company_name: str, summary: str) -> None:
     """Persist the summary text for a company."""
     archive_dir = tos_archive_dir(company_name)
     archive_dir.mkdir(parents=True, exist_ok=True)
-    (archive_dir / "summary.txt").write_text(summary, encoding="utf-8")
+    _atomic_write(archive_dir / "summary.txt", summary.encode("utf-8"))
+
+# Module-level cache for the optional diff-match-patch class.
+# None = not yet attempted; False = unavailable; class object = loaded.
+_dmp_class: Optional[object] = None
+
+# Upper bound (seconds) on the time diff-match-patch spends computing a diff.
+DIFF_TIMEOUT: float = 1.0
+
+# Documents larger than this (old + new, in characters) are only diffed over
+# their first and last DIFF_WINDOW_CHARS, where legal changes usually land.
+DIFF_MAX_INPUT_CHARS: int = 2_000_000
+DIFF_WINDOW_CHARS: int = 100_000
+
+
+def _get_diff_match_patch() -> Optional[object]:
+    """Lazily import and cache ``diff_match_patch``.  Returns None if unavailable."""
+    global _dmp_class
+    if _dmp_class is None:
+        try:
+            from diff_match_patch import diff_match_patch  # type: ignore
+            _dmp_class = diff_match_patch
+        except Exception:
+            _dmp_class = False
+    return _dmp_class if _dmp_class is not False else None
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Convert a half-open line range into unified-diff ``start,length`` form."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _dmp_line_opcodes(dmp_class, old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """Return SequenceMatcher-style opcodes for a line diff computed by diff-match-patch.
+
+    Each distinct line is mapped to a single character so that Myers' diff
+    runs over lines rather than characters, mirroring diff-match-patch's own
+    line mode while keeping ``str.splitlines`` semantics.
+    """
+    index: dict[str, int] = {}
+    old_chars = "".join(chr(index.setdefault(line, len(index))) for line in old_lines)
+    shared = len(index)
+    new_chars = "".join(chr(index.setdefault(line, len(index))) for line in new_lines)
+    if old_lines and new_lines and not any(ord(c) < shared for c in new_chars):
+        # No line in common (a full rewrite): Myers' worst case, and the
+        # answer is known without running it.
+        return [("replace", 0, len(old_lines), 0, len(new_lines))]
+    dmp = dmp_class()
+    dmp.Diff_Timeout = DIFF_TIMEOUT
+    diffs = dmp.diff_main(old_chars, new_chars, False)
+
+    opcodes: list[tuple] = []
+    i = j = 0
+    for op, chars in diffs:
+        n = len(chars)
+        if op == 0:
+            opcodes.append(("equal", i, i + n, j, j + n))
+            i += n
+            j += n
+        elif op == -1:
+            opcodes.append(("delete", i, i + n, j, j))
+            i += n
+        else:
+            last = opcodes[-1] if opcodes else None
+            if last is not None and last[0] == "delete" and last[2] == i and last[4] == j:
+                opcodes[-1] = ("replace", last[1], last[2], j, j + n)
+            else:
+                opcodes.append(("insert", i, i, j, j + n))
+            j += n
+    return opcodes
+
+
+def _common_affix_lengths(old_lines: list[str], new_lines: list[str]) -> tuple[int, int]:
+    """Return how many leading and trailing lines *old_lines* and *new_lines* share."""
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _line_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """Return SequenceMatcher-style opcodes for a line diff of *old_lines* → *new_lines*.
+
+    ToS edits are usually confined to one section, so the shared leading and
+    trailing lines are set aside as plain ``equal`` blocks and only the
+    differing middle is handed to the matcher.
+    """
+    prefix, suffix = _common_affix_lengths(old_lines, new_lines)
+    old_end = len(old_lines) - suffix
+    new_end = len(new_lines) - suffix
+    old_mid = old_lines[prefix:old_end]
+    new_mid = new_lines[prefix:new_end]
+    dmp_class = _get_diff_match_patch()
+    if dmp_class is not None:
+        # Myers diff (diff-match-patch) is near-linear on typical edits, unlike
+        # difflib's matcher which can go quadratic on large ToS pages.
+        middle = _dmp_line_opcodes(dmp_class, old_mid, new_mid)
+    else:
+        middle = difflib.SequenceMatcher(None, old_mid, new_mid).get_opcodes()
+    opcodes: list[tuple] = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    opcodes.extend(
+        (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in middle
+    )
+    if suffix:
+        opcodes.append(("equal", old_end, len(old_lines), new_end, len(new_lines)))
+    return opcodes
+
+
+def _unified_diff(
+    old_lines: list[str],
+    new_lines: list[str],
+    n: int = 3,
+    offsets: tuple[int, int] = (0, 0),
+    header: bool = True,
+):
+    """Yield unified-diff lines in the same format as ``difflib.unified_diff``.
+
+    *offsets* shifts the hunk line numbers when the inputs are a slice of a
+    larger document; *header* controls the ``---``/``+++`` file header.
+    """
+    matcher = difflib.SequenceMatcher(None, (), ())
+    # get_grouped_opcodes() reuses cached opcodes, so seeding them here lets
+    # difflib's hunk grouping run over the trimmed (and, when available,
+    # linear-time Myers) diff instead of its own matcher over whole documents.
+    matcher.opcodes = _line_opcodes(old_lines, new_lines)
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            if header:
+                yield "--- previous\n"
+                yield "+++ current\n"
+        first, last = group[0], group[-1]
+        file1_range = _format_range_unified(first[1] + offsets[0], last[2] + offsets[0])
+        file2_range = _format_range_unified(first[3] + offsets[1], last[4] + offsets[1])
+        yield f"@@ -{file1_range} +{file2_range} @@\n"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in old_lines[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in new_lines[j1:j2]:
+                    yield "+" + line
+
+
+def _lines_within(lines, budget: int) -> int:
+    """Return how many of *lines* fit, in order, within *budget* characters."""
+    used = 0
+    for count, line in enumerate(lines):
+        used += len(line)
+        if used > budget:
+            return count
+    return len(lines)
+
+
+def _windowed_diff(old_lines: list[str], new_lines: list[str]):
+    """Yield a one-line-context diff of only the first and last DIFF_WINDOW_CHARS of each side."""
+    # Both sides use the same line counts so the windows stay aligned.
+    head = min(_lines_within(old_lines, DIFF_WINDOW_CHARS), _lines_within(new_lines, DIFF_WINDOW_CHARS))
+    tail = min(
+        _lines_within(reversed(old_lines), DIFF_WINDOW_CHARS),
+        _lines_within(reversed(new_lines), DIFF_WINDOW_CHARS),
+        len(old_lines) - head,
+        len(new_lines) - head,
+    )
+    started = False
+    for line in _unified_diff(old_lines[:head], new_lines[:head], n=1):
+        started = True
+        yield line
+    old_start = len(old_lines) - tail
+    new_start = len(new_lines) - tail
+    yield from _unified_diff(
+        old_lines[old_start:], new_lines[new_start:], n=1,
+        offsets=(old_start, new_start), header=not started,
+    )
 
 def build_diff(old_text: str, new_text: str) -> str:
+    if old_text == new_text:
+        return ""
     old_lines = old_text.splitlines(keepends=True)
     new_lines = new_text.splitlines(keepends=True)
-    diff = list(difflib.unified_diff(old_lines, new_lines, fromfile="previous", tofile="current", n=3))
-    return "".join(diff[:1000])  # Increased limit for better AI context
+    if len(old_text) + len(new_text) > DIFF_MAX_INPUT_CHARS:
+        print(
+            f"  Diff input too large ({len(old_text) + len(new_text)} chars); "
+            f"diffing only the first/last {DIFF_WINDOW_CHARS} chars of each side"
+        )
+        diff = _windowed_diff(old_lines, new_lines)
+    else:
+        diff = _unified_diff(old_lines, new_lines, n=3)
+    # islice stops the lazy diff generator after the cap instead of
+    # materialising every diff line only to discard the tail.
+    return "".join(islice(diff, 1000))  # Increased limit for better AI context
 
 # ---------------------------------------------------------------------------
 # Hybrid substantive diff helpers
 # ---------------------------------------------------------------------------
 
+# Whitespace patterns for normalize_text / extract_hot_section_text, compiled once.
+_WS_RE = re.compile(r"[ \t]+")
+_BLANK_RE = re.compile(r"\n{3,}")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n{2,}")
+
 def normalize_text(text: str) -> str:
     """Normalize TOS text to reduce noise from formatting, whitespace, and case.
 
@@ -426,11 +1321,11 @@ def normalize_text(text: str) -> str:
     text = text.lower()
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     # Collapse runs of spaces/tabs within a line to a single space
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _WS_RE.sub(" ", text)
     # Strip each line and drop blank lines caused by stripping
     text = "\n".join(line.strip() for line in text.splitlines())
     # Collapse three or more consecutive blank lines to two
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -462,22 +1357,90 @@ def extract_core_content(text: str) -> str:
     return text
 
 
-def fallback_similarity(a: str, b: str) -> float:
-    """Return a similarity score (0–1) using difflib.SequenceMatcher.
+# Without diff-match-patch, inputs longer than this (a + b, in characters) are
+# compared line by line rather than character by character.
+SIMILARITY_CHAR_LEVEL_MAX: int = 10_000
 
-    This is the lightweight fallback used when spaCy is not installed.
+# Splits text into words, each with its leading whitespace, so that joining
+# the tokens gives back the original string.
+_SIMILARITY_TOKEN_RE = re.compile(r"\s*\S+|\s+")
+
+
+def _matched_chars(dmp_class, a: str, b: str) -> int:
+    """Return how many characters *a* and *b* have in common, via diff-match-patch.
+
+    The texts are first diffed word by word (each distinct word mapped to one
+    character, as in ``_dmp_line_opcodes``), which keeps Myers' diff fast on
+    whole documents; each changed run is then re-diffed character by
+    character so small edits such as punctuation still count as mostly equal.
+    """
+    index: dict[str, int] = {}
+    a_chars = "".join(chr(index.setdefault(t, len(index))) for t in _SIMILARITY_TOKEN_RE.findall(a))
+    b_chars = "".join(chr(index.setdefault(t, len(index))) for t in _SIMILARITY_TOKEN_RE.findall(b))
+    tokens = list(index)
+    dmp = dmp_class()
+    dmp.Diff_Timeout = DIFF_TIMEOUT
+    matched = 0
+    deleted = inserted = ""
+    for op, chars in dmp.diff_main(a_chars, b_chars, False) + [(0, "")]:
+        text = "".join(tokens[ord(c)] for c in chars)
+        if op == -1:
+            deleted += text
+        elif op == 1:
+            inserted += text
+        else:
+            if deleted and inserted:
+                matched += sum(len(t) for o, t in dmp.diff_main(deleted, inserted, False) if o == 0)
+            deleted = inserted = ""
+            matched += len(text)
+    return matched
+
+
+def fallback_similarity(a: str, b: str) -> float:
+    """Return a similarity score (0–1): matched characters × 2 / total length.
+
+    This is the lightweight fallback used when spaCy is not installed.  Uses
+    diff-match-patch when available.  Otherwise SequenceMatcher is used with
+    ``autojunk=False``: its default autojunk heuristic treats every character
+    frequent in a ≥200-character text (spaces, common letters) as junk, which
+    rates near-identical legal documents as barely similar (≈0.2 instead of
+    ≈1.0) and would flag every one of them as a substantive change.
     """
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    return difflib.SequenceMatcher(None, a, b).ratio()
+    dmp_class = _get_diff_match_patch()
+    if dmp_class is not None:
+        return 2 * _matched_chars(dmp_class, a, b) / (len(a) + len(b))
+    if len(a) + len(b) <= SIMILARITY_CHAR_LEVEL_MAX:
+        return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+    # Character-level SequenceMatcher is quadratic on whole documents; over a
+    # list of lines each element is far rarer, so matching is much cheaper.
+    # Matched lines are weighted by length to keep the same 2*M/T scale.
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, a_lines, b_lines, autojunk=False)
+    matched = sum(
+        len(line)
+        for block in matcher.get_matching_blocks()
+        for line in a_lines[block.a:block.a + block.size]
+    )
+    return 2 * matched / (len(a) + len(b))
 
 
 # Module-level cache for the spaCy NLP model.
 # None = not yet attempted; False = unavailable; model object = loaded.
 _spacy_nlp: Optional[object] = None
 
+SPACY_MODEL = "en_core_web_md"
+
+# semantic_similarity only uses document vectors, which come from the
+# tokenizer and the model's static word vectors.  The trained pipeline
+# components are excluded at load time: they are never run and never loaded,
+# which makes each nlp() call several times faster and saves their memory.
+SPACY_EXCLUDED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
 
 def _get_spacy_nlp() -> Optional[object]:
     """Lazily load and cache a spaCy model.  Returns None if unavailable."""
@@ -485,12 +1448,48 @@ def _get_spacy_nlp() -> Optional[object]:
     if _spacy_nlp is None:
         try:
             import spacy  # type: ignore
-            _spacy_nlp = spacy.load("en_core_web_md")
+            _spacy_nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_COMPONENTS)
         except Exception:
             _spacy_nlp = False
     return _spacy_nlp if _spacy_nlp is not False else None
 
 
+# Run-scoped spaCy vectors keyed by a digest of the model name and text; cleared
+# by monitor() at the start of every run.
+_doc_vector_cache: dict[bytes, array] = {}
+
+
+def _doc_vector_key(text: str) -> bytes:
+    """Return the ``_doc_vector_cache`` key for *text*."""
+    return hashlib.blake2b(f"{SPACY_MODEL}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+def _doc_vectors(nlp, texts: list[str]) -> list[array]:
+    """Return the spaCy document vectors of *texts*, reused within a run.
+
+    Embedding is by far the most expensive part of ``semantic_similarity``,
+    so a text embedded once in a run (e.g. by companies sharing a ToS URL)
+    is not embedded again.  The cache lives in memory only: CI runners are
+    ephemeral, so an on-disk copy would never be warm.  Texts not yet seen
+    are embedded together with ``nlp.pipe``, which batches them through
+    spaCy's pipeline instead of paying per-call overhead for each.
+    """
+    # Truncate to avoid excessive memory use on very long texts
+    keys = [_doc_vector_key(text[:25000]) for text in texts]
+    pending = {key: text[:25000] for key, text in zip(keys, texts) if key not in _doc_vector_cache}
+    for key, doc in zip(pending, nlp.pipe(list(pending.values()), batch_size=16)):  # type: ignore[attr-defined]
+        _doc_vector_cache[key] = array("f", doc.vector)
+    return [_doc_vector_cache[key] for key in keys]
+
+
+def _cosine_similarity(a, b) -> float:
+    """Cosine of two vectors – what spaCy's ``Doc.similarity`` computes (0 for empty vectors)."""
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if not norm:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / norm
+
+
 def semantic_similarity(a: str, b: str) -> float:
     """Return a semantic similarity score (0–1).
 
@@ -500,29 +1499,43 @@ def semantic_similarity(a: str, b: str) -> float:
     nlp = _get_spacy_nlp()
     if nlp is not None:
         try:
-            # Truncate to avoid excessive memory use on very long texts
-            doc_a = nlp(a[:25000])  # type: ignore[call-arg]
-            doc_b = nlp(b[:25000])  # type: ignore[call-arg]
-            return doc_a.similarity(doc_b)
+            return _cosine_similarity(*_doc_vectors(nlp, [a, b]))
         except Exception:
             pass
     return fallback_similarity(a, b)
 
 
+def _iter_paragraphs(text: str):
+    """Yield the non-blank paragraphs of *text* one at a time.
+
+    Slicing between paragraph breaks avoids building the full list that
+    ``re.split`` would materialise for a long document.
+    """
+    start = 0
+    for m in _PARAGRAPH_BREAK_RE.finditer(text):
+        para = text[start:m.start()]
+        if para.strip():
+            yield para
+        start = m.end()
+    para = text[start:]
+    if para.strip():
+        yield para
+
 def extract_hot_section_text(text: str) -> dict[str, str]:
     """Return a mapping of hot-section names to their relevant paragraphs.
 
     Splits *text* into paragraphs and assigns each paragraph to every
     hot-section whose keyword patterns it matches.
     """
-    paragraphs = [p for p in re.split(r"\n{2,}", text) if p.strip()]
     sections: dict[str, list[str]] = {k: [] for k in HOT_SECTION_KEYWORDS}
-    for para in paragraphs:
-        for section_name, patterns in HOT_SECTION_KEYWORDS.items():
-            for pattern in patterns:
-                if re.search(pattern, para, re.IGNORECASE):
-                    sections[section_name].append(para)
-                    break
+    for para in _iter_paragraphs(text):
+        # casefold (not lower) so the prefilter folds exactly what the
+        # IGNORECASE regex does, e.g. "ſuspend" or the Kelvin sign.
+        folded = para.translate(_ANCHOR_FOLD_TABLE).casefold()
+        if not any(anchor in folded for anchor in _HOT_SECTION_ANCHORS):
+            continue
+        for section_name in {m.lastgroup for m in _HOT_SECTION_UNION.finditer(para)}:
+            sections[section_name].append(para)
     return {k: "\n\n".join(v) for k, v in sections.items()}
 
 
@@ -551,10 +1564,24 @@ def detect_substantive_change(old_text: str, new_text: str) -> tuple[bool, str]:
     # --- Hot-section check ---
     old_sections = extract_hot_section_text(old_norm)
     new_sections = extract_hot_section_text(new_norm)
+    nlp = _get_spacy_nlp()
+    if nlp is not None:
+        # Embed every changed section in one batch up front; the per-section
+        # semantic_similarity calls below then read the cached vectors.
+        changed = [
+            text
+            for name in HOT_SECTION_KEYWORDS
+            if old_sections.get(name, "") != new_sections.get(name, "")
+            for text in (old_sections.get(name, ""), new_sections.get(name, ""))
+        ]
+        with suppress(Exception):
+            _doc_vectors(nlp, changed)
     for section_name in HOT_SECTION_KEYWORDS:
         old_sec = old_sections.get(section_name, "")
         new_sec = new_sections.get(section_name, "")
-        if old_sec or new_sec:
+        # Identical sections (the common case: most edits touch one section)
+        # are similar by definition, so skip the similarity computation.
+        if old_sec != new_sec:
             sim = semantic_similarity(old_sec, new_sec)
             if sim < SIMILARITY_THRESHOLD:
                 return True, f"change detected in hot section: {section_name}"
@@ -574,26 +1601,219 @@ def detect_substantive_change(old_text: str, new_text: str) -> tuple[bool, str]:
 
     return False, ""
 
-def call_openai(diff_text: str) -> str:
+
+# ---------------------------------------------------------------------------
+# Shared HTTP session
+# ---------------------------------------------------------------------------
+
+# Module-level cache for the requests.Session used for OpenAI calls.
+# Reusing one session keeps TCP/TLS connections alive between companies so
+# each request after the first skips the DNS lookup and TLS handshake.
+_http_session: Optional[object] = None
+
+
+def _get_http_session():
+    """Lazily create and cache a pooled ``requests.Session`` with retries.
+
+    Transient failures (429 and 5xx responses) are retried up to three times
+    with exponential back-off by the mounted ``HTTPAdapter``.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        session = requests.Session()
+        # Advertise every content coding urllib3 can decode here: gzip and
+        # deflate always, plus br / zstd when brotli / zstandard are installed.
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+# ---------------------------------------------------------------------------
+# AI response cache
+# ---------------------------------------------------------------------------
+
+# Identical inputs (e.g. the same rotating-footer diff seen run after run)
+# reuse the stored model reply instead of paying for another API round-trip.
+# Entries older than this are ignored and regenerated.  The age is taken from
+# the timestamp stored in each entry, not the file mtime: the directory is
+# committed by CI, and a fresh checkout resets every mtime to "now".
+AI_CACHE_MAX_AGE_SECONDS: int = 30 * 24 * 3600
+
+
+def _ai_cache_path(prompt: str, text: str) -> Path:
+    """Return the cache file for a (model, prompt, input text) combination."""
+    key = hashlib.blake2b(
+        f"{OPENAI_MODEL}\0{prompt}\0{text}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return AI_CACHE_DIR / f"{key}.json"
+
+
+def cached_ai_call(prompt: str, text: str, fn):
+    """Return ``fn(text)``, reusing a cached reply for identical input.
+
+    *prompt* is the system prompt ``fn`` sends; it is part of the cache key so
+    that editing a prompt invalidates its old replies.  Only successful calls
+    made with an API key are stored – exceptions propagate uncached, and the
+    "skipped" placeholder returned without a key is never persisted.
+    """
     if not OPENAI_API_KEY:
-        return "AI analysis skipped: OPENAI_API_KEY not set."
-    
+        return fn(text)
+    path = _ai_cache_path(prompt, text)
+    entry = _read_ai_cache_entry(path)
+    if entry is not None and not _ai_cache_entry_expired(entry):
+        return entry["result"]
+    result = fn(text)
+    AI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, _json_dumps({"storedAt": time.time(), "result": result}))
+    return result
+
+
+def _read_ai_cache_entry(path: Path) -> dict | None:
+    """Return the cache entry stored at *path*, or ``None`` if missing or unreadable."""
+    try:
+        entry = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "storedAt" not in entry or "result" not in entry:
+        return None
+    return entry
+
+
+def _ai_cache_entry_expired(entry: dict) -> bool:
+    """Return True if *entry* was stored more than ``AI_CACHE_MAX_AGE_SECONDS`` ago."""
+    try:
+        return time.time() - float(entry["storedAt"]) >= AI_CACHE_MAX_AGE_SECONDS
+    except (TypeError, ValueError):
+        return True
+
+
+def prune_ai_cache() -> int:
+    """Delete expired or unreadable AI cache entries and return how many were removed.
+
+    Without this the committed cache directory would only ever grow.
+    """
+    removed = 0
+    try:
+        entries = list(os.scandir(AI_CACHE_DIR))
+    except FileNotFoundError:
+        return 0
+    for dir_entry in entries:
+        if not dir_entry.name.endswith(".json"):
+            continue
+        entry = _read_ai_cache_entry(Path(dir_entry.path))
+        if entry is None or _ai_cache_entry_expired(entry):
+            try:
+                os.unlink(dir_entry.path)
+            except FileNotFoundError:
+                continue
+            removed += 1
+    return removed
+
+
+# Upper bound on OpenAI requests in flight at once across all worker threads,
+# independent of how many companies are being processed concurrently.
+OPENAI_MAX_IN_FLIGHT: int = _env_int("OPENAI_MAX_IN_FLIGHT", 4)
+_openai_slots = threading.BoundedSemaphore(OPENAI_MAX_IN_FLIGHT)
+
+# Proactive request/token budgets for the OpenAI account (per rolling minute).
+# Calls wait for capacity *before* sending instead of discovering the limit
+# through 429 responses.  Token use is estimated as request bytes / 4 plus the
+# completion budget.
+OPENAI_MAX_RPM: int = _env_int("OPENAI_MAX_RPM", 500)
+OPENAI_MAX_TPM: int = _env_int("OPENAI_MAX_TPM", 200_000)
+_openai_window: deque = deque()  # (monotonic send time, estimated tokens)
+_openai_window_lock = threading.Lock()
+
+
+def _reserve_openai_capacity(tokens: int) -> None:
+    """Block until a request of ~*tokens* fits the RPM/TPM budgets, then record it.
+
+    The budgets are checked against a sliding one-minute window of earlier
+    requests.  A single request larger than the whole TPM budget is let
+    through once the window is empty rather than blocking forever.
+    """
+    while True:
+        with _openai_window_lock:
+            now = time.monotonic()
+            while _openai_window and now - _openai_window[0][0] >= 60:
+                _openai_window.popleft()
+            used = sum(spent for _, spent in _openai_window)
+            if not _openai_window or (
+                len(_openai_window) < OPENAI_MAX_RPM and used + tokens <= OPENAI_MAX_TPM
+            ):
+                _openai_window.append((now, tokens))
+                return
+            wait = 60 - (now - _openai_window[0][0])
+        time.sleep(wait)
+
+
+# Successful replies to OpenAI requests made during the current run, keyed by a
+# digest of the request body, plus one lock per digest.  Companies that share a
+# ToS URL are processed concurrently with identical text, so without the lock
+# they would all miss the cache and post the same request.  Both are cleared
+# at the start of monitor().
+_openai_replies: dict[bytes, str] = {}
+_openai_key_locks: dict[bytes, threading.Lock] = {}
+
+
+def _openai_post(messages: list[dict], max_tokens: int = 512) -> str:
+    """POST a chat completion on the shared session and return the reply text.
+
+    Each call first waits for room in the ``OPENAI_MAX_RPM`` /
+    ``OPENAI_MAX_TPM`` budgets, and at most ``OPENAI_MAX_IN_FLIGHT`` requests
+    run at once; further callers block until a slot frees up, so raising the
+    processing concurrency never floods the API.  HTTP 429/5xx responses are retried with exponential
+    backoff (honouring ``Retry-After``) by the session's ``Retry`` policy.
+    Identical requests within a run are answered once; failures are not remembered.
+    """
     payload = {
         "model": OPENAI_MODEL,
-        "messages": [
-            {"role": "system", "content": AI_TOS_SUMMARY_PROMPT},
-            {"role": "user", "content": f"Here is the diff of the TOS changes:\n\n{diff_text}"},
-        ],
-        "max_tokens": 512,
+        "messages": messages,
+        "max_tokens": max_tokens,
         "temperature": 0.3,
     }
     headers = {
         "Authorization": f"Bearer {OPENAI_API_KEY}",
         "Content-Type": "application/json",
     }
-    resp = requests.post(OPENAI_URL, headers=headers, json=payload, timeout=60)
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"].strip()
+    body = _json_dumps(payload)
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    with suppress(KeyError):
+        return _openai_replies[key]
+    with _openai_key_locks.setdefault(key, threading.Lock()):
+        with suppress(KeyError):
+            return _openai_replies[key]
+        _reserve_openai_capacity(len(body) // 4 + max_tokens)
+        with _openai_slots:
+            resp = _get_http_session().post(OPENAI_URL, headers=headers, data=body, timeout=60)
+        resp.raise_for_status()
+        reply = resp.json()["choices"][0]["message"]["content"].strip()
+        _openai_replies[key] = reply
+    return reply
+
+
+def call_openai(diff_text: str) -> str:
+    if not OPENAI_API_KEY:
+        return "AI analysis skipped: OPENAI_API_KEY not set."
+
+    return _openai_post([
+        {"role": "system", "content": AI_TOS_SUMMARY_PROMPT},
+        {"role": "user", "content": f"Here is the diff of the TOS changes:\n\n{diff_text}"},
+    ])
 
 def call_openai_overview(tos_text: str) -> str:
     if not OPENAI_API_KEY:
@@ -601,22 +1821,29 @@ def call_openai_overview(tos_text: str) -> str:
 
     # Truncate to avoid exceeding token limits while preserving key content
     truncated = tos_text[:8000]
-    payload = {
-        "model": OPENAI_MODEL,
-        "messages": [
-            {"role": "system", "content": AI_TOS_SUMMARY_PROMPT},
-            {"role": "user", "content": f"Here is the Terms of Service text:\n\n{truncated}"},
-        ],
-        "max_tokens": 512,
-        "temperature": 0.3,
-    }
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    resp = requests.post(OPENAI_URL, headers=headers, json=payload, timeout=60)
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"].strip()
+    return _openai_post([
+        {"role": "system", "content": AI_TOS_SUMMARY_PROMPT},
+        {"role": "user", "content": f"Here is the Terms of Service text:\n\n{truncated}"},
+    ])
+
+
+def summarise_change(old_text: str | None, new_text: str) -> str:
+    """Return the AI summary for a substantive change, never raising.
+
+    A diff-focused summary is generated when a previous version exists;
+    otherwise (first version or missing snapshot) a full overview is produced.
+    API failures are reported in the returned string.
+    """
+    if old_text is not None and old_text != new_text:
+        diff_text = build_diff(old_text, new_text)
+        try:
+            return cached_ai_call(AI_TOS_SUMMARY_PROMPT, diff_text, call_openai)
+        except Exception as exc:
+            return f"Connection Error: AI analysis failed – {exc}"
+    try:
+        return call_openai_overview(new_text)
+    except Exception as exc:
+        return f"Connection Error: AI overview failed – {exc}"
 
 # ---------------------------------------------------------------------------
 # Trust score
@@ -711,149 +1938,199 @@ def calculate_trust_score(history_entry: dict) -> int:
 # Main monitoring loop
 # ---------------------------------------------------------------------------
 
-def monitor() -> dict:
-    ensure_dirs()
-    companies_config = load_config()
-    now = datetime.now(timezone.utc).isoformat()
-    company_results: list[dict] = []
+def _seed_http_validators(companies_config: list[dict]) -> None:
+    """Load the previous run's validators for URLs that may be fetched conditionally.
 
+    Validators are keyed by URL but stored per company, and a ``304`` vouches
+    for every company sharing that URL.  They are therefore only used when
+    every company on the URL fetches over plain HTTP and holds the same
+    validators for an existing snapshot (a newly added company has none).
+    """
+    _http_validators.clear()
+    by_url: dict[str, list[dict]] = {}
     for company in companies_config:
-        name: str = company.get("name", "")
-        tos_url: str = company.get("tosUrl", "")
-        category: str = company.get("category", "")
-        last_checked = datetime.now(timezone.utc).isoformat()
-
-        print(f"Scanning {name}...")
+        meta = read_snapshot_meta(company.get("name", ""))
+        if company.get("engine", "browser") == "browser":
+            meta = {}  # rendered pages are never fetched conditionally
+        by_url.setdefault(company.get("tosUrl", ""), []).append(meta)
+    for url, metas in by_url.items():
+        if metas[0] and all(meta == metas[0] for meta in metas):
+            _http_validators[url] = metas[0]
+
+def process_company(company: dict, fetch_result) -> dict:
+    """Compare one company's fetched ToS with its snapshot and build its result.
+
+    *fetch_result* is the page text, or the exception raised while fetching
+    it.  Called concurrently for different companies by ``fetch_and_process``;
+    every file it touches is specific to the company.
+    """
+    name: str = company.get("name", "")
+    tos_url: str = company.get("tosUrl", "")
+    category: str = company.get("category", "")
+    checked_at = datetime.now(timezone.utc)
+    last_checked = checked_at.isoformat()
 
-        try:
-            new_text = strip_navigation_preamble(fetch_text(tos_url))
-        except Exception as exc:
-            print(f"Error fetching {name}: {exc}")
-            company_results.append({
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "changed": False,
-                "changeIsSubstantial": False,
-                "changeReason": "",
-                "summary": read_tos_summary(name) or f"Connection Error: {exc}",
-            })
-            continue
+    print(f"Scanning {name}...")
 
+    try:
+        if isinstance(fetch_result, BaseException):
+            raise fetch_result
+        new_text = strip_navigation_preamble(fetch_result)
+    except NotModified:
+        # The server confirmed the page is unchanged (HTTP 304), so the
+        # snapshot is neither read nor compared.
+        return {
+            "name": name,
+            "category": category,
+            "tosUrl": tos_url,
+            "lastChecked": last_checked,
+            "changed": False,
+            "changeIsSubstantial": False,
+            "changeReason": "",
+            "summary": read_tos_summary(name) or "Initial snapshot created. Monitoring active.",
+        }
+    except Exception as exc:
+        print(f"Error fetching {name}: {exc}")
+        return {
+            "name": name,
+            "category": category,
+            "tosUrl": tos_url,
+            "lastChecked": last_checked,
+            "changed": False,
+            "changeIsSubstantial": False,
+            "changeReason": "",
+            "summary": read_tos_summary(name) or f"Connection Error: {exc}",
+        }
+
+    # Compare content hashes first: an unchanged page (the common case)
+    # never needs the previous snapshot loaded or rewritten.
+    # The digest is computed once and shared with the archive check.
+    new_hash = content_hash(new_text)
+    if read_snapshot_hash(name) == new_hash:
+        old_text = new_text
+    else:
         old_text = read_snapshot(name)
-        write_snapshot(name, new_text)
-
-        # Content-diff method: compare the newly fetched ToS against the most
-        # recently archived version.  `archived=True` means the raw text has
-        # changed; `archived=False` means it is byte-for-byte identical.
-        # Every new version is always archived; significance is determined
-        # separately by detect_substantive_change below.
-        archived = archive_tos_if_changed(name, new_text)
-
-        if not archived:
-            # ToS content is unchanged – reuse the persisted summary without
-            # calling the AI API.  This is the core of the content-diff method.
-            summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
-            company_results.append({
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "changed": False,
-                "changeIsSubstantial": False,
-                "changeReason": "",
-                "summary": summary,
-            })
-            continue
-
-        # Raw text changed – determine whether the change is *substantive*
-        # using the hybrid diff logic (hot sections, percent change, semantics).
-        if old_text is not None:
-            is_significant, change_reason = detect_substantive_change(old_text, new_text)
-        else:
-            # First version ever archived – always treat as significant.
-            is_significant = True
-            change_reason = "first version archived"
-
-        if not is_significant:
-            # Change is noise (formatting/whitespace/trivial wording) – archive
-            # was already written above; skip AI and keep the existing summary
-            # so the user is not alerted unnecessarily.
-            summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
-            company_results.append({
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "changed": False,
-                "changeIsSubstantial": False,
-                "changeReason": "",
-                "summary": summary,
-            })
-            continue
-
-        # Substantive change – generate a new AI summary and persist it.
-        if old_text is not None and old_text != new_text:
-            # Incremental change: generate a diff-focused summary.
-            diff_text = build_diff(old_text, new_text)
-            try:
-                summary = call_openai(diff_text)
-            except Exception as exc:
-                summary = f"Connection Error: AI analysis failed – {exc}"
-        else:
-            # First version or snapshot missing: generate a full overview summary.
-            try:
-                summary = call_openai_overview(new_text)
-            except Exception as exc:
-                summary = f"Connection Error: AI overview failed – {exc}"
-
-        write_tos_summary(name, summary)
+        write_snapshot(name, new_text, digest=new_hash)
+    write_snapshot_meta(name, _http_validators.get(tos_url, {}))
+
+    # Content-diff method: compare the newly fetched ToS against the most
+    # recently archived version.  `archived=True` means the raw text has
+    # changed; `archived=False` means it is byte-for-byte identical.
+    # Every new version is always archived; significance is determined
+    # separately by detect_substantive_change below.
+    archived = archive_tos_if_changed(name, new_text, when=checked_at, digest=new_hash)
+
+    if not archived:
+        # ToS content is unchanged – reuse the persisted summary without
+        # calling the AI API.  This is the core of the content-diff method.
+        summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
+        return {
+            "name": name,
+            "category": category,
+            "tosUrl": tos_url,
+            "lastChecked": last_checked,
+            "changed": False,
+            "changeIsSubstantial": False,
+            "changeReason": "",
+            "summary": summary,
+        }
 
-        company_results.append({
+    # Raw text changed – determine whether the change is *substantive*
+    # using the hybrid diff logic (hot sections, percent change, semantics).
+    if old_text is not None:
+        is_significant, change_reason = detect_substantive_change(old_text, new_text)
+    else:
+        # First version ever archived – always treat as significant.
+        is_significant = True
+        change_reason = "first version archived"
+
+    if not is_significant:
+        # Change is noise (formatting/whitespace/trivial wording) – archive
+        # was already written above; skip AI and keep the existing summary
+        # so the user is not alerted unnecessarily.
+        summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
+        return {
             "name": name,
             "category": category,
             "tosUrl": tos_url,
             "lastChecked": last_checked,
-            "changed": True,
-            "changeIsSubstantial": True,
-            "changeReason": change_reason,
+            "changed": False,
+            "changeIsSubstantial": False,
+            "changeReason": "",
             "summary": summary,
-        })
+        }
+
+    # Substantive change – generate a new AI summary and persist it.
+    summary = summarise_change(old_text, new_text)
+    write_tos_summary(name, summary)
+
+    return {
+        "name": name,
+        "category": category,
+        "tosUrl": tos_url,
+        "lastChecked": last_checked,
+        "changed": True,
+        "changeIsSubstantial": True,
+        "changeReason": change_reason,
+        "summary": summary,
+    }
+
+def monitor() -> dict:
+    ensure_dirs()
+    companies_config = load_config()
+    now = datetime.now(timezone.utc).isoformat()
+
+    _openai_replies.clear()
+    _openai_key_locks.clear()
+    _doc_vector_cache.clear()
+    prune_ai_cache()
+
+    _seed_http_validators(companies_config)
+
+    company_results = fetch_and_process(
+        [c.get("tosUrl", "") for c in companies_config],
+        lambda index, fetch_result: process_company(companies_config[index], fetch_result),
+        engines=[c.get("engine", "browser") for c in companies_config],
+    )
 
     results = {"updatedAt": now, "companies": company_results}
     return results
 
-def write_results(results: dict) -> None:
-    payload = json.dumps(results, indent=2, ensure_ascii=False)
-    # DEBUG: validate that the serialised payload is parseable JSON before writing,
-    # to catch any serialisation bugs early and prevent a corrupt results.json from
-    # reaching the front-end.  Remove this check once the root cause has been fixed.
+def write_results(results: dict) -> bytes:
+    """Write *results* to both results paths and return the serialised payload."""
+    payload = _json_dumps(results, indent=True)
+    # Parse the bytes once before writing so a corrupt results.json never
+    # reaches the front-end; validate_results() relies on this check.
     try:
-        json.loads(payload)
+        _json_loads(payload)
     except json.JSONDecodeError as exc:
         raise ValueError(
             f"write_results: serialised payload is not valid JSON – aborting write. "
             f"JSONDecodeError: {exc}"
         ) from exc
-    PUBLIC_RESULTS_PATH.write_text(payload, encoding="utf-8")
-    DATA_RESULTS_PATH.write_text(payload, encoding="utf-8")
+    # Serialise and write once; the second location is a hard link (or copy).
+    _atomic_write(PUBLIC_RESULTS_PATH, payload)
+    _mirror_file(PUBLIC_RESULTS_PATH, DATA_RESULTS_PATH)
+    return payload
 
-def validate_results(results: dict) -> None:
+def validate_results(results: dict, payload: bytes | None = None) -> None:
+    """Check the results structure and that it survives a JSON round trip.
+
+    Pass the *payload* returned by ``write_results``: it was already parsed
+    before being written, so the round trip is only done without one.
+    """
     assert isinstance(results, dict)
     assert "companies" in results
-    # DEBUG: round-trip the results through JSON to confirm the output is parseable.
-    # Remove this check once the root cause of the malformed results.json is confirmed.
-    try:
-        round_tripped = json.loads(json.dumps(results, ensure_ascii=False))
-        assert isinstance(round_tripped, dict)
-    except (json.JSONDecodeError, AssertionError) as exc:
-        raise ValueError(f"validate_results: JSON round-trip check failed – {exc}") from exc
+    if payload is None:
+        try:
+            _json_loads(_json_dumps(results))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"validate_results: JSON round-trip check failed – {exc}") from exc
     print("✅ Validation passed: results.json structure is correct.")
 
 if __name__ == "__main__":
     final_results = monitor()
-    write_results(final_results)
-    validate_results(final_results)
+    payload = write_results(final_results)
+    validate_results(final_results, payload)
     print(f"Done. Checked {len(final_results['companies'])} companies.")
     sys.exit(0)
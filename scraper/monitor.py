@@ -4,22 +4,53 @@ Uses Playwright to bypass aggressive bot detection (Cloudflare 403s).
 Outputs a versioned, verdict-tagged results.json with full history.
 """
 
+import asyncio
 import difflib
 import hashlib
 import json
+import math
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
 import random
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from bs4 import BeautifulSoup
-import requests
-from playwright.sync_api import sync_playwright
-from playwright_stealth import Stealth
+# Heavy third-party modules are imported on first use (see the loaders below).
+sync_playwright = None
+Stealth = None
+BeautifulSoup = None
+
+
+def _load_browser_modules() -> None:
+    """Import Playwright and playwright-stealth on first use."""
+    global sync_playwright, Stealth
+    if sync_playwright is None:
+        from playwright.sync_api import sync_playwright as _sync_playwright
+        sync_playwright = _sync_playwright
+    if Stealth is None:
+        from playwright_stealth import Stealth as _Stealth
+        Stealth = _Stealth
+
+
+def _get_beautiful_soup():
+    """Import and return ``bs4.BeautifulSoup`` on first use."""
+    global BeautifulSoup
+    if BeautifulSoup is None:
+        from bs4 import BeautifulSoup as _BeautifulSoup
+        BeautifulSoup = _BeautifulSoup
+    return BeautifulSoup
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -33,6 +64,7 @@ DATA_RESULTS_PATH = BASE_DIR / "data" / "results.json"
 # Also write to public/data so the Vite frontend picks it up during dev/build
 PUBLIC_RESULTS_PATH = BASE_DIR.parent / "public" / "data" / "results.json"
 TOS_DIR = BASE_DIR / "terms_of_service"
+AI_CACHE_DIR = BASE_DIR / "data" / "ai_cache"
 
 SCHEMA_VERSION = "2.2"
 
@@ -51,6 +83,30 @@ HOT_SECTION_KEYWORDS: dict[str, list[str]] = {
     "governing_law": [r"\bgoverning\s+law\b", r"\bjurisdiction\b"],
 }
 
+# All HOT_SECTION_KEYWORDS fused into one case-insensitive regex, so each
+# paragraph is scanned once instead of once per pattern.  Every section is a
+# named group inside a lookahead: matches are zero-width, so finditer tries
+# every position and a match for one section never consumes text another
+# section's pattern needs.  ``match.lastgroup`` names the matching section.
+_HOT_SECTION_UNION: re.Pattern = re.compile(
+    "|".join(
+        f"(?=(?P<{name}>{'|'.join(patterns)}))"
+        for name, patterns in HOT_SECTION_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# Substrings implied by every HOT_SECTION_KEYWORDS pattern (keep in sync);
+# paragraphs with none of them skip the regex.
+_HOT_SECTION_ANCHORS: tuple[str, ...] = (
+    "liabilit", "indemnif", "privac", "personal", "data", "arbitrat", "disput",
+    "class", "terminat", "suspend", "user", "artificial", "machine", "train",
+    "governing", "jurisdiction",
+)
+
+# Characters IGNORECASE matches to "i" that str.casefold() does not fold to a plain "i".
+_ANCHOR_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
 SIMILARITY_THRESHOLD: float = 0.95
 PERCENT_CHANGE_THRESHOLD: float = 0.04
 
@@ -218,10 +274,73 @@ def assign_verdict(change_reason: str, diff_summary: dict) -> str:
     return "Neutral"
 
 
+# ---------------------------------------------------------------------------
+# JSON serialisation
+# ---------------------------------------------------------------------------
+
+# Optional orjson fast path; falls back to the stdlib json module.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str | bytes):
+    """Parse JSON text or UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes, pretty-printed with 2 spaces if *indent*."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _new_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Mode for atomically written files: mkstemp's 0600 replaced by what open() would
+# give under the umask.  Queried once at import, since reading it briefly changes it.
+_NEW_FILE_MODE = _new_file_mode()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a same-directory temp file and ``os.replace``."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, _NEW_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _mirror_file(src: Path, dst: Path) -> None:
+    """Atomically make *dst* a copy of *src* – a hard link, else an in-kernel copy."""
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    with suppress(FileNotFoundError):
+        tmp.unlink()
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
 def ensure_dirs() -> None:
     SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
     TOS_DIR.mkdir(parents=True, exist_ok=True)
@@ -229,18 +348,28 @@ def ensure_dirs() -> None:
     DATA_RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Accepted values for a company's optional "engine" key ("browser" if omitted).
+FETCH_ENGINES: tuple[str, ...] = ("browser", "http", "auto")
+
+
 def load_config() -> list[dict]:
-    with open(CONFIG_PATH, encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("companies", [])
+    data = _json_loads(CONFIG_PATH.read_bytes())
+    companies = data.get("companies", [])
+    for company in companies:
+        engine = company.get("engine", "browser")
+        if engine not in FETCH_ENGINES:
+            raise ValueError(
+                f"load_config: {company.get('name', '?')!r} has unknown engine {engine!r} "
+                f"(expected one of: {', '.join(FETCH_ENGINES)})"
+            )
+    return companies
 
 
 def load_watchlist() -> list[str]:
     """Load high-risk keyword terms from watchlist.json."""
     if WATCHLIST_PATH.exists():
         try:
-            with open(WATCHLIST_PATH, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(WATCHLIST_PATH.read_bytes())
             return [str(t) for t in data.get("terms", [])]
         except (json.JSONDecodeError, OSError):
             pass
@@ -251,8 +380,7 @@ def load_cases() -> list[dict]:
     """Load the standardized case definitions from cases.json."""
     if CASES_PATH.exists():
         try:
-            with open(CASES_PATH, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(CASES_PATH.read_bytes())
             return data.get("cases", [])
         except (json.JSONDecodeError, OSError):
             pass
@@ -647,21 +775,157 @@ def compute_change_magnitude(old_text: str, new_text: str) -> float:
     return round((1.0 - ratio) * 100, 1)
 
 
+_SLUG_RE = re.compile(r"[^\w\-]")
+
+
+@lru_cache(maxsize=None)
+def company_slug(company_name: str) -> str:
+    """Return a filesystem-safe slug for a company name (memoised)."""
+    return _SLUG_RE.sub("_", company_name)
+
+
 def snapshot_path(company_name: str) -> Path:
-    safe = re.sub(r"[^\w\-]", "_", company_name)
-    return SNAPSHOTS_DIR / f"{safe}.txt"
+    return SNAPSHOTS_DIR / f"{company_slug(company_name)}.txt"
+
+
+_NON_CONTENT_TAGS: list[str] = ["script", "style", "noscript", "header", "footer", "nav", "aside"]
+
+# Cached optional selectolax lexbor parser class (None = not tried, False = unavailable).
+_html_parser_class: Optional[object] = None
+
+
+def _get_html_parser() -> Optional[object]:
+    global _html_parser_class
+    if _html_parser_class is None:
+        try:
+            from selectolax.lexbor import LexborHTMLParser  # type: ignore
+            _html_parser_class = LexborHTMLParser
+        except Exception:
+            _html_parser_class = False
+    return _html_parser_class if _html_parser_class is not False else None
+
+
+def html_to_text(html_content: str) -> str:
+    """Return visible page text (one stripped text node per line), via selectolax or BeautifulSoup."""
+    parser_class = _get_html_parser()
+    if parser_class is None:
+        soup = _get_beautiful_soup()(html_content, "html.parser")
+        for tag in soup(_NON_CONTENT_TAGS):
+            tag.decompose()
+        return soup.get_text(separator="\n", strip=True)
+
+    tree = parser_class(html_content)
+    tree.strip_tags(_NON_CONTENT_TAGS)
+    if tree.root is None:
+        return ""
+    # Text nodes are stripped and joined in C; NUL cannot survive HTML parsing.
+    pieces = tree.root.text(separator="\x00", strip=True).split("\x00")
+    return "\n".join(filter(None, pieces))
+
+
+# Per-thread shared browser state used by shared_browser(); Playwright's sync
+# API is bound to the thread that started it.
+_browser_local = threading.local()
+
+
+def _launch_browser(p):
+    return p.chromium.launch(headless=True, args=["--disable-http2"])
+
+
+@contextmanager
+def shared_browser():
+    """Reuse one lazily-launched browser for every fetch_text call on this thread."""
+    state: dict = {}
+    _browser_local.state = state
+    try:
+        yield
+    finally:
+        del _browser_local.state
+        if state:
+            try:
+                browser = state.get("browser")
+                if browser is not None:
+                    browser.close()
+            finally:
+                state["playwright"].stop()
+
+
+@contextmanager
+def _browser_for_attempt():
+    """Yield the thread's shared browser, or a throw-away one outside shared_browser()."""
+    _load_browser_modules()
+    state = getattr(_browser_local, "state", None)
+    if state is None:
+        with sync_playwright() as p:
+            browser = _launch_browser(p)
+            try:
+                yield browser
+            finally:
+                browser.close()
+        return
+    if not state:
+        # Only publish a fully started pair: a failed launch must not leave
+        # a half-filled state behind for later fetches or the teardown.
+        playwright = sync_playwright().start()
+        try:
+            browser = _launch_browser(playwright)
+        except BaseException:
+            playwright.stop()
+            raise
+        state["playwright"] = playwright
+        state["browser"] = browser
+    elif not state["browser"].is_connected():
+        state["browser"] = _launch_browser(state["playwright"])
+    yield state["browser"]
+
+
+class NotModified(Exception):
+    """Raised by ``fetch_text_http`` when the server answers ``304 Not Modified``."""
+
+
+# Per-URL HTTP cache validators, seeded from the snapshot ``.meta.json`` sidecars.
+_http_validators: dict[str, dict] = {}
+
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+
+
+def _record_validators(url: str, headers) -> None:
+    """Remember the ETag / Last-Modified of a successful response for *url*."""
+    validators = {
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified"),
+    }
+    _http_validators[url] = {k: v for k, v in validators.items() if v}
+
+
+def _conditional_headers(validators: dict) -> dict[str, str]:
+    """Return the conditional request headers for stored *validators*."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential back-off (5 s, 10 s, 20 s, …) plus up to 50% jitter so workers don't retry in lockstep."""
+    base = 5 * (2 ** (attempt - 1))
+    return base + random.uniform(0, base / 2)
 
 
 def fetch_text(url: str, max_retries: int = 3) -> str:
-    """Fetch URL using a headless browser with stealth patterns."""
+    """Fetch URL using a headless browser with stealth patterns (never conditionally).
+
+    A ``304`` would only vouch for the HTML shell, not for JS-rendered text,
+    so validators are left to ``fetch_text_http``.
+    """
     last_exc: Exception = Exception(f"All {max_retries} attempts to fetch {url} failed.")
 
     for attempt in range(1, max_retries + 1):
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=["--disable-http2"])
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-            )
+        with _browser_for_attempt() as browser:
+            context = browser.new_context(user_agent=BROWSER_USER_AGENT)
             page = context.new_page()
             stealth = Stealth()
             stealth.apply_stealth_sync(page)
@@ -669,65 +933,364 @@ def fetch_text(url: str, max_retries: int = 3) -> str:
             try:
                 time.sleep(random.uniform(1, 3))
                 page.goto(url, wait_until="domcontentloaded", timeout=90000)
-                html_content = page.content()
-                soup = BeautifulSoup(html_content, "html.parser")
-                for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
-                    tag.decompose()
-                return soup.get_text(separator="\n", strip=True)
+                return html_to_text(page.content())
 
             except Exception as e:
                 last_exc = e
                 print(f"  [attempt {attempt}/{max_retries}] Failed to fetch {url}: {e}")
                 if attempt < max_retries:
-                    backoff = 5 * (2 ** (attempt - 1))
-                    print(f"  Retrying in {backoff}s…")
+                    backoff = _retry_delay(attempt)
+                    print(f"  Retrying in {backoff:.1f}s…")
                     time.sleep(backoff)
             finally:
-                browser.close()
+                context.close()
 
     raise Exception(f"Playwright failed to fetch {url}: {last_exc}")
 
 
+def fetch_text_http(url: str) -> str:
+    """Fetch a static-HTML ToS page with a plain GET on the shared session (no browser)."""
+    headers = {
+        "User-Agent": BROWSER_USER_AGENT,
+        **_conditional_headers(_http_validators.get(url, {})),
+    }
+    resp = _get_http_session().get(url, headers=headers, timeout=60)
+    if resp.status_code == 304:
+        raise NotModified(url)
+    resp.raise_for_status()
+    _record_validators(url, resp.headers)
+    if "charset" not in resp.headers.get("content-type", "").lower():
+        # requests assumes ISO-8859-1 for text/* without a charset, which
+        # garbles UTF-8 pages; sniff the body instead.
+        resp.encoding = resp.apparent_encoding
+    return html_to_text(resp.text)
+
+
+# Shorter plain-HTTP results are taken to be a JS shell or bot check by fetch_text_auto.
+AUTO_MIN_TEXT_CHARS: int = 2000
+
+
+def fetch_text_auto(url: str) -> str:
+    """Try ``fetch_text_http`` first and render with ``fetch_text`` only if it fails or is too short."""
+    try:
+        text = fetch_text_http(url)
+        if len(text) >= AUTO_MIN_TEXT_CHARS:
+            return text
+    except NotModified:
+        raise
+    except Exception:
+        pass
+    # Never send the validators of a page we did not use.
+    _http_validators.pop(url, None)
+    return fetch_text(url)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Return the positive integer in environment variable *name*, else *default*."""
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Maximum number of ToS pages fetched at the same time (one Chromium per worker).
+# Each limit below can be overridden with the environment variable of the same name.
+FETCH_CONCURRENCY: int = _env_int("FETCH_CONCURRENCY", 4)
+
+# Maximum number of plain-HTTP (``"engine": "http"``) fetches at once.
+HTTP_FETCH_CONCURRENCY: int = _env_int("HTTP_FETCH_CONCURRENCY", 8)
+
+# Maximum number of fetched pages processed at once.  Each company's OpenAI calls
+# are independent of every other company's, so they overlap on the pooled session.
+AI_CONCURRENCY: int = _env_int("AI_CONCURRENCY", 4)
+
+
+def _drain_jobs(jobs: deque, deliver) -> None:
+    """Run ``(index, url, fetch)`` jobs one by one, delivering texts or exceptions."""
+    while True:
+        try:
+            index, url, fetch = jobs.popleft()
+        except IndexError:
+            return
+        try:
+            result = fetch(url)
+        except Exception as exc:
+            result = exc
+        deliver(index, result)
+
+
+def _fetch_worker(jobs: deque, deliver) -> None:
+    """Drain browser jobs on one thread with a shared browser."""
+    with shared_browser():
+        _drain_jobs(jobs, deliver)
+
+
+def fetch_and_process(urls: list[str], process, engines: list[str] | None = None) -> list:
+    """Fetch URLs and run ``process(index, fetch_result)`` on each as soon as it arrives.
+
+    Fetch workers feed an ``asyncio.Queue`` drained by ``AI_CONCURRENCY``
+    consumers, so AI calls for early pages overlap the fetching of later ones.
+    URLs whose *engines* entry is ``"http"`` use ``fetch_text_http`` workers
+    instead of the browser, and ``"auto"`` URLs use ``fetch_text_auto`` on the
+    browser workers.  Duplicate URLs are fetched once and processed per
+    index.  Results are returned in input order.
+    """
+    if not urls:
+        return []
+    engines = engines or ["browser"] * len(urls)
+    fetchers_by_engine = {"browser": fetch_text, "http": fetch_text_http, "auto": fetch_text_auto}
+    # Companies sharing a ToS URL (e.g. subsidiaries) share one fetch: only the
+    # first occurrence is queued and its result is delivered to every index.
+    sharers: dict[str, list[int]] = {}
+    for i, url in enumerate(urls):
+        sharers.setdefault(url, []).append(i)
+    jobs = [
+        (indices[0], url, fetchers_by_engine[engines[indices[0]]])
+        for url, indices in sharers.items()
+    ]
+    browser_jobs: deque = deque(job for job in jobs if engines[job[0]] != "http")
+    http_jobs: deque = deque(job for job in jobs if engines[job[0]] == "http")
+    results: list = [None] * len(urls)
+
+    async def _pipeline() -> None:
+        loop = asyncio.get_running_loop()
+        fetchers = min(FETCH_CONCURRENCY, len(browser_jobs))
+        http_fetchers = min(HTTP_FETCH_CONCURRENCY, len(http_jobs))
+        consumers = min(AI_CONCURRENCY, len(urls))
+        # Dedicated pool so blocked fetch workers never starve the consumers.
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=fetchers + http_fetchers + consumers)
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def deliver(index: int, fetch_result) -> None:
+            for sharer in sharers[urls[index]]:
+                loop.call_soon_threadsafe(queue.put_nowait, (sharer, fetch_result))
+
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                index, fetch_result = item
+                results[index] = await asyncio.to_thread(process, index, fetch_result)
+
+        consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+        await asyncio.gather(
+            *(asyncio.to_thread(_fetch_worker, browser_jobs, deliver) for _ in range(fetchers)),
+            *(asyncio.to_thread(_drain_jobs, http_jobs, deliver) for _ in range(http_fetchers)),
+        )
+        for _ in consumer_tasks:
+            queue.put_nowait(None)
+        await asyncio.gather(*consumer_tasks)
+
+    asyncio.run(_pipeline())
+    return results
+
+
+def fetch_all_texts(urls: list[str]) -> list:
+    """Fetch every URL concurrently; return texts (or raised exceptions) in input order."""
+    return fetch_and_process(urls, lambda index, fetch_result: fetch_result)
+
+
+# Optional xxhash module: None = not tried; False = unavailable.
+_xxhash = None
+
+
+def _get_xxhash() -> Optional[object]:
+    """Return the xxhash module, or None if it is not installed."""
+    global _xxhash
+    if _xxhash is None:
+        try:
+            import xxhash
+            _xxhash = xxhash
+        except ImportError:
+            _xxhash = False
+    return _xxhash or None
+
+
+def content_hash(text: str) -> str:
+    """Return a fast change-detection digest: XXH3-64 if available, else BLAKE2b."""
+    data = text.encode("utf-8")
+    xxhash = _get_xxhash()
+    if xxhash:
+        return f"xxh3:{xxhash.xxh3_64_hexdigest(data)}"
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def snapshot_hash_path(company_name: str) -> Path:
+    return snapshot_path(company_name).with_suffix(".hash")
+
+
+# Optional zstandard module for snapshots: None = not tried; False = unavailable.
+_zstd = None
+SNAPSHOT_ZSTD_LEVEL: int = 3
+
+
+def _get_zstd() -> Optional[object]:
+    """Return the zstandard module, or None if it is not installed."""
+    global _zstd
+    if _zstd is None:
+        try:
+            import zstandard
+            _zstd = zstandard
+        except ImportError:
+            _zstd = False
+    return _zstd or None
+
+
+def compressed_snapshot_path(company_name: str) -> Path:
+    return snapshot_path(company_name).with_suffix(".txt.zst")
+
+
+def _existing_snapshot_path(company_name: str) -> Path | None:
+    """Return the snapshot file on disk (compressed preferred, legacy .txt honoured), or None."""
+    compressed = compressed_snapshot_path(company_name)
+    if _get_zstd() and compressed.exists():
+        return compressed
+    plain = snapshot_path(company_name)
+    return plain if plain.exists() else None
+
+
 def read_snapshot(company_name: str) -> str | None:
-    path = snapshot_path(company_name)
-    if path.exists():
-        return path.read_text(encoding="utf-8")
+    """Return the stored snapshot text; legacy plain snapshots are migrated to zstd."""
+    path = _existing_snapshot_path(company_name)
+    if path is None:
+        return None
+    if path.suffix == ".zst":
+        return _get_zstd().decompress(path.read_bytes()).decode("utf-8")
+    text = path.read_text(encoding="utf-8")
+    if _get_zstd():
+        write_snapshot(company_name, text)
+    return text
+
+
+def read_snapshot_hash(company_name: str) -> str | None:
+    """Return the stored snapshot content hash, or None if snapshot or sidecar is missing."""
+    hash_path = snapshot_hash_path(company_name)
+    if hash_path.exists() and _existing_snapshot_path(company_name) is not None:
+        return hash_path.read_text(encoding="utf-8").strip()
     return None
 
 
-def write_snapshot(company_name: str, text: str) -> None:
-    snapshot_path(company_name).write_text(text, encoding="utf-8")
+def write_snapshot(company_name: str, text: str, digest: str | None = None) -> None:
+    data = text.encode("utf-8")
+    zstd = _get_zstd()
+    if zstd:
+        _atomic_write(compressed_snapshot_path(company_name), zstd.compress(data, SNAPSHOT_ZSTD_LEVEL))
+        snapshot_path(company_name).unlink(missing_ok=True)
+    else:
+        _atomic_write(snapshot_path(company_name), data)
+        compressed_snapshot_path(company_name).unlink(missing_ok=True)
+    _atomic_write(snapshot_hash_path(company_name), (digest or content_hash(text)).encode("utf-8"))
 
 
-def company_slug(company_name: str) -> str:
-    return re.sub(r"[^\w\-]", "_", company_name)
+def snapshot_meta_path(company_name: str) -> Path:
+    """Return the path of the HTTP validator sidecar stored next to a snapshot."""
+    return snapshot_path(company_name).with_suffix(".meta.json")
+
+
+def read_snapshot_meta(company_name: str) -> dict:
+    """Return the stored HTTP validators, or {} unless both sidecar and snapshot exist."""
+    meta_path = snapshot_meta_path(company_name)
+    if not (meta_path.exists() and _existing_snapshot_path(company_name) is not None):
+        return {}
+    try:
+        meta = _json_loads(meta_path.read_bytes())
+    except ValueError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def write_snapshot_meta(company_name: str, meta: dict) -> None:
+    """Persist *meta* as the snapshot's HTTP validators, skipping no-op writes."""
+    meta_path = snapshot_meta_path(company_name)
+    if not meta:
+        meta_path.unlink(missing_ok=True)
+    elif read_snapshot_meta(company_name) != meta:
+        _atomic_write(meta_path, _json_dumps(meta))
 
 
 def tos_archive_dir(company_name: str) -> Path:
     return TOS_DIR / company_slug(company_name)
 
 
-def get_latest_archived_tos(company_name: str) -> str | None:
+def _dated_archive_files(company_name: str) -> list[Path]:
+    """Return a company's dated archive files, oldest first (empty if none exist)."""
     archive_dir = tos_archive_dir(company_name)
-    if not archive_dir.exists():
-        return None
-    dated_files = sorted(f for f in archive_dir.glob("*.txt") if f.name != "summary.txt")
+    # scandir yields names and file types from one readdir pass, without
+    # building a Path (or issuing a stat) per entry as glob() would.
+    try:
+        with os.scandir(archive_dir) as entries:
+            names = sorted(
+                e.name for e in entries
+                if e.name.endswith(".txt") and e.name != "summary.txt" and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [archive_dir / name for name in names]
+
+
+def _file_matches(path: Path, data: bytes) -> bool:
+    """Return True if *path* holds exactly *data*, skipping the read when sizes differ."""
+    return path.stat().st_size == len(data) and path.read_bytes() == data
+
+
+_LATEST_POINTER = ".latest"
+
+
+def _write_latest_pointer(archive_dir: Path, name: str, digest: str) -> None:
+    """Record *name* (hashing to *digest*) as the newest archive in *archive_dir*."""
+    _atomic_write(archive_dir / _LATEST_POINTER, f"{name}\n{digest}\n".encode("utf-8"))
+
+
+def _latest_archive_file(company_name: str) -> tuple[Path, str] | None:
+    """Return the newest dated archive and its content hash from the ``.latest`` pointer, falling back to a listing."""
+    archive_dir = tos_archive_dir(company_name)
+    try:
+        name, _, digest = (archive_dir / _LATEST_POINTER).read_text(encoding="utf-8").partition("\n")
+    except OSError:
+        name = digest = ""
+    latest = archive_dir / name.strip()
+    if digest.strip() and latest.is_file():
+        return latest, digest.strip()
+    dated_files = _dated_archive_files(company_name)
     if not dated_files:
         return None
-    return dated_files[-1].read_text(encoding="utf-8")
+    latest = dated_files[-1]
+    digest = content_hash(latest.read_text(encoding="utf-8"))
+    _write_latest_pointer(archive_dir, latest.name, digest)
+    return latest, digest
+
+
+def get_latest_archived_tos(company_name: str) -> str | None:
+    latest = _latest_archive_file(company_name)
+    if latest is None:
+        return None
+    return latest[0].read_text(encoding="utf-8")
+
 
+def archive_tos_if_changed(
+    company_name: str, new_text: str, when: datetime | None = None, digest: str | None = None
+) -> bool:
+    """Save new_text as a file dated *when* (default: now) if it differs from the latest archived version.
 
-def archive_tos_if_changed(company_name: str, new_text: str) -> bool:
-    """Save new_text as a dated archive file if it differs from the latest archived version."""
+    *digest* is ``content_hash(new_text)`` when the caller already has it.
+    """
+    # Comparing against the pointer's recorded hash avoids reading the archived copy.
+    digest = digest or content_hash(new_text)
+    latest = _latest_archive_file(company_name)
+    if latest is not None and latest[1] == digest:
+        return False
     archive_dir = tos_archive_dir(company_name)
-    archive_dir.mkdir(parents=True, exist_ok=True)
-    if get_latest_archived_tos(company_name) == new_text:
+    data = new_text.encode("utf-8")
+    # A differing digest may only mean the pointer was written by the other
+    # hasher (XXH3 vs BLAKE2b), so confirm against the archived bytes.
+    if latest is not None and _file_matches(latest[0], data):
+        _write_latest_pointer(archive_dir, latest[0].name, digest)
         return False
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    existing_today = sorted(
-        f for f in archive_dir.glob("*.txt")
-        if f.name != "summary.txt" and f.stem.startswith(date_str)
-    )
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    dated_files = _dated_archive_files(company_name)
+    date_str = (when or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+    existing_today = [f for f in dated_files if f.stem.startswith(date_str)]
     if not existing_today:
         archive_path = archive_dir / f"{date_str}.txt"
     else:
@@ -736,16 +1299,14 @@ def archive_tos_if_changed(company_name: str, new_text: str) -> bool:
         while archive_path.exists():
             suffix += 1
             archive_path = archive_dir / f"{date_str}_{suffix}.txt"
-    archive_path.write_text(new_text, encoding="utf-8")
+    _atomic_write(archive_path, data)
+    _write_latest_pointer(archive_dir, archive_path.name, digest)
     return True
 
 
 def prune_old_tos_archives(company_name: str) -> int:
     """Delete all but the most-recent dated snapshot for a company."""
-    archive_dir = tos_archive_dir(company_name)
-    if not archive_dir.exists():
-        return 0
-    dated_files = sorted(f for f in archive_dir.glob("*.txt") if f.name != "summary.txt")
+    dated_files = _dated_archive_files(company_name)
     if len(dated_files) <= 1:
         return 0
     to_delete = dated_files[:-1]
@@ -764,26 +1325,234 @@ def read_tos_summary(company_name: str) -> str | None:
 def write_tos_summary(company_name: str, summary: str) -> None:
     archive_dir = tos_archive_dir(company_name)
     archive_dir.mkdir(parents=True, exist_ok=True)
-    (archive_dir / "summary.txt").write_text(summary, encoding="utf-8")
+    _atomic_write(archive_dir / "summary.txt", summary.encode("utf-8"))
+
+
+# Cached optional diff_match_patch class (None = not tried, False = unavailable).
+_dmp_class: Optional[object] = None
+
+# Upper bound (seconds) on the time diff-match-patch spends computing a diff.
+DIFF_TIMEOUT: float = 1.0
+
+# Documents larger than this (old + new, in characters) are only diffed over
+# their first and last DIFF_WINDOW_CHARS, where legal changes usually land.
+DIFF_MAX_INPUT_CHARS: int = 2_000_000
+DIFF_WINDOW_CHARS: int = 100_000
+
+
+def _get_diff_match_patch() -> Optional[object]:
+    """Lazily import and cache ``diff_match_patch``.  Returns None if unavailable."""
+    global _dmp_class
+    if _dmp_class is None:
+        try:
+            from diff_match_patch import diff_match_patch  # type: ignore
+            _dmp_class = diff_match_patch
+        except Exception:
+            _dmp_class = False
+    return _dmp_class if _dmp_class is not False else None
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Convert a half-open line range into unified-diff ``start,length`` form."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _dmp_line_opcodes(dmp_class, old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """Return SequenceMatcher-style opcodes for a line diff computed by diff-match-patch.
+
+    Each distinct line is mapped to a single character so that Myers' diff
+    runs over lines rather than characters, mirroring diff-match-patch's own
+    line mode while keeping ``str.splitlines`` semantics.
+    """
+    index: dict[str, int] = {}
+    old_chars = "".join(chr(index.setdefault(line, len(index))) for line in old_lines)
+    shared = len(index)
+    new_chars = "".join(chr(index.setdefault(line, len(index))) for line in new_lines)
+    if old_lines and new_lines and not any(ord(c) < shared for c in new_chars):
+        # No line in common (a full rewrite): Myers' worst case, and the
+        # answer is known without running it.
+        return [("replace", 0, len(old_lines), 0, len(new_lines))]
+    dmp = dmp_class()
+    dmp.Diff_Timeout = DIFF_TIMEOUT
+    diffs = dmp.diff_main(old_chars, new_chars, False)
+
+    opcodes: list[tuple] = []
+    i = j = 0
+    for op, chars in diffs:
+        n = len(chars)
+        if op == 0:
+            opcodes.append(("equal", i, i + n, j, j + n))
+            i += n
+            j += n
+        elif op == -1:
+            opcodes.append(("delete", i, i + n, j, j))
+            i += n
+        else:
+            last = opcodes[-1] if opcodes else None
+            if last is not None and last[0] == "delete" and last[2] == i and last[4] == j:
+                opcodes[-1] = ("replace", last[1], last[2], j, j + n)
+            else:
+                opcodes.append(("insert", i, i, j, j + n))
+            j += n
+    return opcodes
+
+
+def _common_affix_lengths(old_lines: list[str], new_lines: list[str]) -> tuple[int, int]:
+    """Return how many leading and trailing lines *old_lines* and *new_lines* share."""
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _line_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """Return SequenceMatcher-style opcodes for a line diff of *old_lines* → *new_lines*.
+
+    ToS edits are usually confined to one section, so the shared leading and
+    trailing lines are set aside as plain ``equal`` blocks and only the
+    differing middle is handed to the matcher.
+    """
+    prefix, suffix = _common_affix_lengths(old_lines, new_lines)
+    old_end = len(old_lines) - suffix
+    new_end = len(new_lines) - suffix
+    old_mid = old_lines[prefix:old_end]
+    new_mid = new_lines[prefix:new_end]
+    dmp_class = _get_diff_match_patch()
+    if dmp_class is not None:
+        # Myers diff (diff-match-patch) is near-linear on typical edits, unlike
+        # difflib's matcher which can go quadratic on large ToS pages.
+        middle = _dmp_line_opcodes(dmp_class, old_mid, new_mid)
+    else:
+        middle = difflib.SequenceMatcher(None, old_mid, new_mid).get_opcodes()
+    opcodes: list[tuple] = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    opcodes.extend(
+        (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in middle
+    )
+    if suffix:
+        opcodes.append(("equal", old_end, len(old_lines), new_end, len(new_lines)))
+    return opcodes
+
+
+def _unified_diff(
+    old_lines: list[str],
+    new_lines: list[str],
+    n: int = 3,
+    offsets: tuple[int, int] = (0, 0),
+    header: bool = True,
+):
+    """Yield unified-diff lines in the same format as ``difflib.unified_diff``.
+
+    *offsets* shifts the hunk line numbers when the inputs are a slice of a
+    larger document; *header* controls the ``---``/``+++`` file header.
+    """
+    matcher = difflib.SequenceMatcher(None, (), ())
+    # get_grouped_opcodes() reuses cached opcodes, so seeding them here lets
+    # difflib's hunk grouping run over the trimmed (and, when available,
+    # linear-time Myers) diff instead of its own matcher over whole documents.
+    matcher.opcodes = _line_opcodes(old_lines, new_lines)
+    started = False
+    for group in matcher.get_grouped_opcodes(n):
+        if not started:
+            started = True
+            if header:
+                yield "--- previous\n"
+                yield "+++ current\n"
+        first, last = group[0], group[-1]
+        file1_range = _format_range_unified(first[1] + offsets[0], last[2] + offsets[0])
+        file2_range = _format_range_unified(first[3] + offsets[1], last[4] + offsets[1])
+        yield f"@@ -{file1_range} +{file2_range} @@\n"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in old_lines[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in new_lines[j1:j2]:
+                    yield "+" + line
+
+
+def _lines_within(lines, budget: int) -> int:
+    """Return how many of *lines* fit, in order, within *budget* characters."""
+    used = 0
+    for count, line in enumerate(lines):
+        used += len(line)
+        if used > budget:
+            return count
+    return len(lines)
+
+
+def _windowed_diff(old_lines: list[str], new_lines: list[str]):
+    """Yield a one-line-context diff of only the first and last DIFF_WINDOW_CHARS of each side."""
+    # Both sides use the same line counts so the windows stay aligned.
+    head = min(_lines_within(old_lines, DIFF_WINDOW_CHARS), _lines_within(new_lines, DIFF_WINDOW_CHARS))
+    tail = min(
+        _lines_within(reversed(old_lines), DIFF_WINDOW_CHARS),
+        _lines_within(reversed(new_lines), DIFF_WINDOW_CHARS),
+        len(old_lines) - head,
+        len(new_lines) - head,
+    )
+    started = False
+    for line in _unified_diff(old_lines[:head], new_lines[:head], n=1):
+        started = True
+        yield line
+    old_start = len(old_lines) - tail
+    new_start = len(new_lines) - tail
+    yield from _unified_diff(
+        old_lines[old_start:], new_lines[new_start:], n=1,
+        offsets=(old_start, new_start), header=not started,
+    )
 
 
 def build_diff(old_text: str, new_text: str) -> str:
+    if old_text == new_text:
+        return ""
     old_lines = old_text.splitlines(keepends=True)
     new_lines = new_text.splitlines(keepends=True)
-    diff = list(difflib.unified_diff(old_lines, new_lines, fromfile="previous", tofile="current", n=3))
-    return "".join(diff[:1000])
+    if len(old_text) + len(new_text) > DIFF_MAX_INPUT_CHARS:
+        print(
+            f"  Diff input too large ({len(old_text) + len(new_text)} chars); "
+            f"diffing only the first/last {DIFF_WINDOW_CHARS} chars of each side"
+        )
+        diff = _windowed_diff(old_lines, new_lines)
+    else:
+        diff = _unified_diff(old_lines, new_lines, n=3)
+    # islice stops the lazy diff generator after the cap instead of
+    # materialising every diff line only to discard the tail.
+    return "".join(islice(diff, 1000))
 
 
 # ---------------------------------------------------------------------------
 # Hybrid substantive diff helpers
 # ---------------------------------------------------------------------------
 
+# Whitespace patterns for normalize_text / extract_hot_section_text, compiled once.
+_WS_RE = re.compile(r"[ \t]+")
+_BLANK_RE = re.compile(r"\n{3,}")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n{2,}")
+
+
 def normalize_text(text: str) -> str:
     text = text.lower()
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _WS_RE.sub(" ", text)
     text = "\n".join(line.strip() for line in text.splitlines())
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -804,49 +1573,137 @@ def extract_core_content(text: str) -> str:
     return text
 
 
+# Without diff-match-patch, longer inputs are compared line by line.
+SIMILARITY_CHAR_LEVEL_MAX: int = 10_000
+
+# Words with their leading whitespace; the tokens join back to the original text.
+_SIMILARITY_TOKEN_RE = re.compile(r"\s*\S+|\s+")
+
+
+def _matched_chars(dmp_class, a: str, b: str) -> int:
+    """Count characters shared by *a* and *b*: word-level Myers diff, changed runs re-diffed by character."""
+    index: dict[str, int] = {}
+    a_chars = "".join(chr(index.setdefault(t, len(index))) for t in _SIMILARITY_TOKEN_RE.findall(a))
+    b_chars = "".join(chr(index.setdefault(t, len(index))) for t in _SIMILARITY_TOKEN_RE.findall(b))
+    tokens = list(index)
+    dmp = dmp_class()
+    dmp.Diff_Timeout = DIFF_TIMEOUT
+    matched = 0
+    deleted = inserted = ""
+    for op, chars in dmp.diff_main(a_chars, b_chars, False) + [(0, "")]:
+        text = "".join(tokens[ord(c)] for c in chars)
+        if op == -1:
+            deleted += text
+        elif op == 1:
+            inserted += text
+        else:
+            if deleted and inserted:
+                matched += sum(len(t) for o, t in dmp.diff_main(deleted, inserted, False) if o == 0)
+            deleted = inserted = ""
+            matched += len(text)
+    return matched
+
+
 def fallback_similarity(a: str, b: str) -> float:
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    return difflib.SequenceMatcher(None, a, b).ratio()
+    dmp_class = _get_diff_match_patch()
+    if dmp_class is not None:
+        return 2 * _matched_chars(dmp_class, a, b) / (len(a) + len(b))
+    # autojunk would treat frequent characters in long legal text as junk
+    # and score near-identical documents around 0.2.
+    if len(a) + len(b) <= SIMILARITY_CHAR_LEVEL_MAX:
+        return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+    # Line-level matching avoids the quadratic character-level case; matched
+    # lines are weighted by length to keep the 2*M/T scale.
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, a_lines, b_lines, autojunk=False)
+    matched = sum(
+        len(line)
+        for block in matcher.get_matching_blocks()
+        for line in a_lines[block.a:block.a + block.size]
+    )
+    return 2 * matched / (len(a) + len(b))
 
 
 _spacy_nlp: Optional[object] = None
 
+SPACY_MODEL = "en_core_web_md"
+
+# Only tokenizer + static vectors are needed for document vectors.
+SPACY_EXCLUDED_COMPONENTS = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
 
 def _get_spacy_nlp() -> Optional[object]:
     global _spacy_nlp
     if _spacy_nlp is None:
         try:
             import spacy  # type: ignore
-            _spacy_nlp = spacy.load("en_core_web_md")
+            _spacy_nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_COMPONENTS)
         except Exception:
             _spacy_nlp = False
     return _spacy_nlp if _spacy_nlp is not False else None
 
 
+# Run-scoped spaCy vectors keyed by a digest of model and text (cleared by monitor()).
+_doc_vector_cache: dict[bytes, array] = {}
+
+
+def _doc_vector_key(text: str) -> bytes:
+    return hashlib.blake2b(f"{SPACY_MODEL}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+def _doc_vectors(nlp, texts: list[str]) -> list[array]:
+    """Return spaCy vectors of *texts* (first 25 000 chars), reused within a run; new ones are batched via ``nlp.pipe``."""
+    keys = [_doc_vector_key(text[:25000]) for text in texts]
+    pending = {key: text[:25000] for key, text in zip(keys, texts) if key not in _doc_vector_cache}
+    for key, doc in zip(pending, nlp.pipe(list(pending.values()), batch_size=16)):  # type: ignore[attr-defined]
+        _doc_vector_cache[key] = array("f", doc.vector)
+    return [_doc_vector_cache[key] for key in keys]
+
+
+def _cosine_similarity(a, b) -> float:
+    """Cosine of two vectors, as spaCy's ``Doc.similarity`` computes it (0 for empty vectors)."""
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if not norm:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / norm
+
+
 def semantic_similarity(a: str, b: str) -> float:
     nlp = _get_spacy_nlp()
     if nlp is not None:
         try:
-            doc_a = nlp(a[:25000])  # type: ignore[call-arg]
-            doc_b = nlp(b[:25000])  # type: ignore[call-arg]
-            return doc_a.similarity(doc_b)
+            return _cosine_similarity(*_doc_vectors(nlp, [a, b]))
         except Exception:
             pass
     return fallback_similarity(a, b)
 
 
+def _iter_paragraphs(text: str):
+    """Yield the non-blank paragraphs of *text* without building the full split list."""
+    start = 0
+    for m in _PARAGRAPH_BREAK_RE.finditer(text):
+        para = text[start:m.start()]
+        if para.strip():
+            yield para
+        start = m.end()
+    para = text[start:]
+    if para.strip():
+        yield para
+
+
 def extract_hot_section_text(text: str) -> dict[str, str]:
-    paragraphs = [p for p in re.split(r"\n{2,}", text) if p.strip()]
     sections: dict[str, list[str]] = {k: [] for k in HOT_SECTION_KEYWORDS}
-    for para in paragraphs:
-        for section_name, patterns in HOT_SECTION_KEYWORDS.items():
-            for pattern in patterns:
-                if re.search(pattern, para, re.IGNORECASE):
-                    sections[section_name].append(para)
-                    break
+    for para in _iter_paragraphs(text):
+        folded = para.translate(_ANCHOR_FOLD_TABLE).casefold()  # agrees with IGNORECASE, unlike lower()
+        if not any(anchor in folded for anchor in _HOT_SECTION_ANCHORS):
+            continue
+        for section_name in {m.lastgroup for m in _HOT_SECTION_UNION.finditer(para)}:
+            sections[section_name].append(para)
     return {k: "\n\n".join(v) for k, v in sections.items()}
 
 
@@ -859,10 +1716,21 @@ def detect_substantive_change(old_text: str, new_text: str) -> tuple[bool, str]:
 
     old_sections = extract_hot_section_text(old_norm)
     new_sections = extract_hot_section_text(new_norm)
+    nlp = _get_spacy_nlp()
+    if nlp is not None:
+        # Batch-embed all changed sections; semantic_similarity then hits the cache.
+        changed = [
+            text
+            for name in HOT_SECTION_KEYWORDS
+            if old_sections.get(name, "") != new_sections.get(name, "")
+            for text in (old_sections.get(name, ""), new_sections.get(name, ""))
+        ]
+        with suppress(Exception):
+            _doc_vectors(nlp, changed)
     for section_name in HOT_SECTION_KEYWORDS:
         old_sec = old_sections.get(section_name, "")
         new_sec = new_sections.get(section_name, "")
-        if old_sec or new_sec:
+        if old_sec != new_sec:  # identical sections need no similarity pass
             sim = semantic_similarity(old_sec, new_sec)
             if sim < SIMILARITY_THRESHOLD:
                 return True, f"change detected in hot section: {section_name}"
@@ -880,12 +1748,84 @@ def detect_substantive_change(old_text: str, new_text: str) -> tuple[bool, str]:
     return False, ""
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP session
+# ---------------------------------------------------------------------------
+
+# Cached requests.Session reused for OpenAI and favicon requests (keep-alive).
+_http_session: Optional[object] = None
+
+
+def _get_http_session():
+    """Lazily create and cache a pooled ``requests.Session`` that retries 429/5xx."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        session = requests.Session()
+        # gzip/deflate, plus br/zstd when brotli/zstandard are installed.
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
 # ---------------------------------------------------------------------------
 # OpenAI helpers
 # ---------------------------------------------------------------------------
 
+# Upper bound on OpenAI requests in flight at once across all worker threads.
+OPENAI_MAX_IN_FLIGHT: int = _env_int("OPENAI_MAX_IN_FLIGHT", 4)
+_openai_slots = threading.BoundedSemaphore(OPENAI_MAX_IN_FLIGHT)
+
+# Per-minute request/token budgets; calls wait for capacity before sending.
+OPENAI_MAX_RPM: int = _env_int("OPENAI_MAX_RPM", 500)
+OPENAI_MAX_TPM: int = _env_int("OPENAI_MAX_TPM", 200_000)
+_openai_window: deque = deque()  # (monotonic send time, estimated tokens)
+_openai_window_lock = threading.Lock()
+
+
+def _reserve_openai_capacity(tokens: int) -> None:
+    """Block until ~*tokens* fit the sliding one-minute RPM/TPM window, then record them."""
+    while True:
+        with _openai_window_lock:
+            now = time.monotonic()
+            while _openai_window and now - _openai_window[0][0] >= 60:
+                _openai_window.popleft()
+            used = sum(spent for _, spent in _openai_window)
+            # An oversized request still goes through once the window is empty.
+            if not _openai_window or (
+                len(_openai_window) < OPENAI_MAX_RPM and used + tokens <= OPENAI_MAX_TPM
+            ):
+                _openai_window.append((now, tokens))
+                return
+            wait = 60 - (now - _openai_window[0][0])
+        time.sleep(wait)
+
+# Successful replies to OpenAI requests made during the current run, keyed by a
+# digest of the request body.  A first-seen company needs the same full-text
+# overview and points for its history entry and its current* fields, so
+# identical requests are answered once.  Cleared at the start of monitor().
+_openai_replies: dict[bytes, str] = {}
+# One lock per request digest, so concurrent identical requests (e.g. companies
+# sharing a ToS URL, delivered together) wait for the first reply instead of
+# all missing the cache and posting.  Cleared alongside _openai_replies.
+_openai_key_locks: dict[bytes, threading.Lock] = {}
+
+
 def _openai_post(messages: list[dict], max_tokens: int = 512) -> str:
-    """POST to OpenAI and return the assistant message content."""
+    """POST to OpenAI and return the reply (deduplicated per run, ≤ OPENAI_MAX_IN_FLIGHT at once)."""
     if not OPENAI_API_KEY:
         return ""
     payload = {
@@ -894,13 +1834,24 @@ def _openai_post(messages: list[dict], max_tokens: int = 512) -> str:
         "max_tokens": max_tokens,
         "temperature": 0.3,
     }
+    body = _json_dumps(payload)
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    with suppress(KeyError):
+        return _openai_replies[key]
     headers = {
         "Authorization": f"Bearer {OPENAI_API_KEY}",
         "Content-Type": "application/json",
     }
-    resp = requests.post(OPENAI_URL, headers=headers, json=payload, timeout=60)
-    resp.raise_for_status()
-    return resp.json()["choices"][0]["message"]["content"].strip()
+    with _openai_key_locks.setdefault(key, threading.Lock()):
+        with suppress(KeyError):
+            return _openai_replies[key]
+        _reserve_openai_capacity(len(body) // 4 + max_tokens)
+        with _openai_slots:
+            resp = _get_http_session().post(OPENAI_URL, headers=headers, data=body, timeout=60)
+        resp.raise_for_status()
+        reply = resp.json()["choices"][0]["message"]["content"].strip()
+        _openai_replies[key] = reply
+    return reply
 
 
 def call_openai_overview(tos_text: str) -> str:
@@ -917,11 +1868,26 @@ def call_openai_overview(tos_text: str) -> str:
         return f"Connection Error: AI overview failed – {exc}"
 
 
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*", re.IGNORECASE)
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Remove a surrounding markdown code fence from a model reply."""
+    cleaned = _FENCE_OPEN_RE.sub("", raw.strip())
+    return _FENCE_CLOSE_RE.sub("", cleaned.strip())
+
+
+# Prefix of every diff-summary value produced without a usable model reply.
+AI_FAILURE_PREFIX = "AI analysis failed"
+
+
 def call_openai_diff_summary(diff_text: str) -> dict:
     """Generate a structured diff summary broken down by Privacy/DataOwnership/UserRights.
 
     Returns a dict with keys: Privacy, DataOwnership, UserRights.
-    Falls back to plain strings if OpenAI is unavailable or JSON parsing fails.
+    Falls back to ``AI_FAILURE_PREFIX`` strings if the request fails or the
+    reply is not a JSON object (see ``_ai_summary_cacheable``).
     """
     empty = {"Privacy": "No significant changes detected", "DataOwnership": "No significant changes detected", "UserRights": "No significant changes detected"}
     if not OPENAI_API_KEY:
@@ -934,22 +1900,26 @@ def call_openai_diff_summary(diff_text: str) -> dict:
         ], max_tokens=256)
     except Exception as exc:
         print(f"  [OpenAI diff summary error] {exc}")
-        return {k: f"AI analysis failed: {exc}" for k in empty}
+        return {k: f"{AI_FAILURE_PREFIX}: {exc}" for k in empty}
 
     # Strip markdown fences if model wrapped output anyway
-    cleaned = re.sub(r"^```(?:json)?\s*", "", raw.strip(), flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*```$", "", cleaned.strip())
+    cleaned = _strip_code_fences(raw)
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = _json_loads(cleaned)
         return {
             "Privacy": str(parsed.get("Privacy", empty["Privacy"])),
             "DataOwnership": str(parsed.get("DataOwnership", empty["DataOwnership"])),
             "UserRights": str(parsed.get("UserRights", empty["UserRights"])),
         }
-    except json.JSONDecodeError:
-        # If the model didn't return valid JSON, use the raw text for all keys
-        return {k: raw[:120] for k in empty}
+    except (json.JSONDecodeError, AttributeError):
+        # Keep the raw text for all keys, marked so it is never cached as a summary
+        return {k: f"{AI_FAILURE_PREFIX} (unparseable reply): {raw[:120]}" for k in empty}
+
+
+def _ai_summary_cacheable(summary: dict) -> bool:
+    """Return False for summaries built from a failed or unparseable model reply."""
+    return not any(str(v).startswith(AI_FAILURE_PREFIX) for v in summary.values())
 
 
 def call_openai_first_summary(tos_text: str) -> dict:
@@ -986,11 +1956,10 @@ def call_openai_points_summary(text: str) -> list[dict]:
         return []
 
     # Strip markdown fences if the model wrapped the output
-    cleaned = re.sub(r"^```(?:json)?\s*", "", raw.strip(), flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*```$", "", cleaned.strip())
+    cleaned = _strip_code_fences(raw)
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = _json_loads(cleaned)
         if isinstance(parsed, list):
             valid_impacts = {"positive", "negative", "neutral"}
             return [
@@ -1010,6 +1979,80 @@ def call_openai_points_summary(text: str) -> list[dict]:
     return []
 
 
+# ---------------------------------------------------------------------------
+# AI response cache
+# ---------------------------------------------------------------------------
+
+# Cached replies older than this are ignored, regenerated and pruned.  Age comes
+# from the timestamp inside each entry: CI commits the directory, and a fresh
+# checkout resets file mtimes.
+AI_CACHE_MAX_AGE_SECONDS: int = 30 * 24 * 3600
+
+
+def _ai_cache_path(prompt: str, text: str) -> Path:
+    key = hashlib.blake2b(
+        f"{OPENAI_MODEL}\0{prompt}\0{text}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return AI_CACHE_DIR / f"{key}.json"
+
+
+def cached_ai_call(prompt: str, text: str, fn, should_cache=lambda result: True):
+    """Return ``fn(text)``, reusing a cached reply keyed by model, prompt and input.
+
+    Nothing is cached without an API key or when ``should_cache(result)`` is
+    false (e.g. the helper swallowed an API error into its return value).
+    """
+    if not OPENAI_API_KEY:
+        return fn(text)
+    path = _ai_cache_path(prompt, text)
+    entry = _read_ai_cache_entry(path)
+    if entry is not None and not _ai_cache_entry_expired(entry):
+        return entry["result"]
+    result = fn(text)
+    if should_cache(result):
+        AI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, _json_dumps({"storedAt": time.time(), "result": result}))
+    return result
+
+
+def _read_ai_cache_entry(path: Path) -> dict | None:
+    """Return the ``{"storedAt", "result"}`` entry at *path*, or None if missing or unreadable."""
+    try:
+        entry = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "storedAt" not in entry or "result" not in entry:
+        return None
+    return entry
+
+
+def _ai_cache_entry_expired(entry: dict) -> bool:
+    try:
+        return time.time() - float(entry["storedAt"]) >= AI_CACHE_MAX_AGE_SECONDS
+    except (TypeError, ValueError):
+        return True
+
+
+def prune_ai_cache() -> int:
+    """Delete expired or unreadable AI cache entries; return how many were removed."""
+    removed = 0
+    try:
+        entries = list(os.scandir(AI_CACHE_DIR))
+    except FileNotFoundError:
+        return 0
+    for dir_entry in entries:
+        if not dir_entry.name.endswith(".json"):
+            continue
+        entry = _read_ai_cache_entry(Path(dir_entry.path))
+        if entry is None or _ai_cache_entry_expired(entry):
+            try:
+                os.unlink(dir_entry.path)
+            except FileNotFoundError:
+                continue
+            removed += 1
+    return removed
+
+
 # ---------------------------------------------------------------------------
 # History management
 # ---------------------------------------------------------------------------
@@ -1019,7 +2062,7 @@ def load_existing_results() -> dict:
     for path in (DATA_RESULTS_PATH, PUBLIC_RESULTS_PATH):
         if path.exists():
             try:
-                return json.loads(path.read_text(encoding="utf-8"))
+                return _json_loads(path.read_bytes())
             except (json.JSONDecodeError, OSError):
                 pass
     return {}
@@ -1113,158 +2156,104 @@ def get_company_current_fields(existing_results: dict, company_name: str) -> dic
 # Main monitoring loop
 # ---------------------------------------------------------------------------
 
-def monitor() -> dict:
-    ensure_dirs()
-    companies_config = load_config()
-    now = datetime.now(timezone.utc).isoformat()
-    existing_results = load_existing_results()
-    company_results: list[dict] = []
-    watchlist = load_watchlist()
+def process_company(company: dict, fetch_result, existing_results: dict, watchlist: list[str]) -> dict:
+    """Compare one company's fetched ToS with its snapshot and build its result entry.
 
-    for company in companies_config:
-        name: str = company.get("name", "")
-        tos_url: str = company.get("tosUrl", "")
-        category: str = company.get("category", "")
-        last_checked = datetime.now(timezone.utc).isoformat()
+    *fetch_result* is the page text, or the exception raised while fetching it.
+    """
+    name: str = company.get("name", "")
+    tos_url: str = company.get("tosUrl", "")
+    category: str = company.get("category", "")
+    checked_at = datetime.now(timezone.utc)
+    last_checked = checked_at.isoformat()
 
-        print(f"Scanning {name}...")
+    print(f"Scanning {name}...")
 
-        # Load existing history for this company so we can append to it
-        history: list[dict] = get_company_history(existing_results, name)
+    # Load existing history for this company so we can append to it
+    history: list[dict] = get_company_history(existing_results, name)
 
-        try:
-            new_text = strip_navigation_preamble(fetch_text(tos_url))
-        except Exception as exc:
-            print(f"Error fetching {name}: {exc}")
-            latest_summary = read_tos_summary(name) or f"Connection Error: {exc}"
-            company_score = calculate_score(history[-1]) if history else 100
-            # Preserve previously-computed current* fields so the schema block
-            # is always present even when the network request fails.
-            current_fields = get_company_current_fields(existing_results, name)
-            company_entry: dict = {
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "latestSummary": latest_summary,
-                "score": company_score,
-                "scores": calculate_diversified_scores({"score": company_score, "history": history}),
-                "history": history,
-                **current_fields,
-            }
-            company_results.append(company_entry)
-            continue
+    try:
+        if isinstance(fetch_result, BaseException):
+            raise fetch_result
+        new_text = strip_navigation_preamble(fetch_result)
+    except NotModified:
+        # HTTP 304 – the page is unchanged, so the snapshot is not read.
+        new_text = None
+    except Exception as exc:
+        print(f"Error fetching {name}: {exc}")
+        latest_summary = read_tos_summary(name) or f"Connection Error: {exc}"
+        company_score = calculate_score(history[-1]) if history else 100
+        # Preserve previously-computed current* fields so the schema block
+        # is always present even when the network request fails.
+        current_fields = get_company_current_fields(existing_results, name)
+        company_entry: dict = {
+            "name": name,
+            "category": category,
+            "tosUrl": tos_url,
+            "lastChecked": last_checked,
+            "latestSummary": latest_summary,
+            "score": company_score,
+            "scores": calculate_diversified_scores({"score": company_score, "history": history}),
+            "history": history,
+            **current_fields,
+        }
+        return company_entry
 
+    if new_text is None:
+        archived = False
+    else:
         current_hash = sha256_hash(new_text)
-        old_text = read_snapshot(name)
-        previous_hash = sha256_hash(old_text) if old_text is not None else None
-        write_snapshot(name, new_text)
-
-        archived = archive_tos_if_changed(name, new_text)
-
-        if not archived:
-            # Content unchanged – no new history entry needed.
-            # Re-use cached current* fields; compute fresh if not yet stored.
-            latest_summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
-            company_score = calculate_score(history[-1]) if history else 100
-            current_fields = get_company_current_fields(existing_results, name)
-            if not current_fields:
-                current_fields = compute_current_fields(new_text, watchlist)
-            company_entry = {
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "latestSummary": latest_summary,
-                "score": company_score,
-                "scores": calculate_diversified_scores({"score": company_score, "history": history}),
-                "history": history,
-                **current_fields,
-            }
-            company_results.append(company_entry)
-            continue
-
-        # Raw text changed – determine substantive change
-        if old_text is not None:
-            is_significant, change_reason = detect_substantive_change(old_text, new_text)
+        # Unchanged snapshot (matching content hash) – skip reading/rewriting it.
+        new_hash = content_hash(new_text)
+        if read_snapshot_hash(name) == new_hash:
+            old_text = new_text
+            previous_hash = current_hash
         else:
-            is_significant = True
-            change_reason = "first version archived"
-
-        # Text changed (even non-substantively) – always refresh current* fields
-        # so they stay in sync with the live ToS.
-        current_fields = compute_current_fields(new_text, watchlist)
-
-        if not is_significant:
-            # Non-substantive change (whitespace / cosmetic) – archive written,
-            # but we do NOT add a history entry or regenerate the diff summary.
-            latest_summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
-            company_score = calculate_score(history[-1]) if history else 100
-            company_entry = {
-                "name": name,
-                "category": category,
-                "tosUrl": tos_url,
-                "lastChecked": last_checked,
-                "latestSummary": latest_summary,
-                "score": company_score,
-                "scores": calculate_diversified_scores({"score": company_score, "history": history}),
-                "history": history,
-                **current_fields,
-            }
-            company_results.append(company_entry)
-            continue
-
-        # Substantive change – generate structured diff summary
-        if old_text is not None and old_text != new_text:
-            diff_text = build_diff(old_text, new_text)
-            diff_summary = call_openai_diff_summary(diff_text)
-        else:
-            diff_text = ""
-            diff_summary = call_openai_first_summary(new_text)
-
-        verdict = assign_verdict(change_reason, diff_summary)
-
-        # Flatten diff_summary to a plain-text string for latestSummary
-        latest_summary = " | ".join(
-            f"[{k}]: {v}" for k, v in diff_summary.items()
-            if v and v != "No significant change"
-        ) or "No significant change detected."
+            old_text = read_snapshot(name)
+            previous_hash = sha256_hash(old_text) if old_text is not None else None
+            write_snapshot(name, new_text, digest=new_hash)
+        write_snapshot_meta(name, _http_validators.get(tos_url, {}))
 
-        write_tos_summary(name, latest_summary)
+        archived = archive_tos_if_changed(name, new_text, when=checked_at, digest=new_hash)
 
-        # Compute change magnitude (percentage difference between versions)
-        change_magnitude = compute_change_magnitude(old_text or "", new_text)
+    if not archived:
+        # Content unchanged – no new history entry needed.
+        # Re-use cached current* fields; compute fresh if not yet stored.
+        latest_summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
+        company_score = calculate_score(history[-1]) if history else 100
+        current_fields = get_company_current_fields(existing_results, name)
+        if not current_fields:
+            if new_text is None:
+                new_text = read_snapshot(name) or ""
+            current_fields = compute_current_fields(new_text, watchlist)
+        company_entry = {
+            "name": name,
+            "category": category,
+            "tosUrl": tos_url,
+            "lastChecked": last_checked,
+            "latestSummary": latest_summary,
+            "score": company_score,
+            "scores": calculate_diversified_scores({"score": company_score, "history": history}),
+            "history": history,
+            **current_fields,
+        }
+        return company_entry
 
-        # Scan for high-risk watchlist terms in the diff (or full text for first version)
-        scan_target = diff_text if diff_text else new_text
-        watchlist_hits = scan_watchlist(scan_target, watchlist)
+    # Raw text changed – determine substantive change
+    if old_text is not None:
+        is_significant, change_reason = detect_substantive_change(old_text, new_text)
+    else:
+        is_significant = True
+        change_reason = "first version archived"
 
-        trust_score = calculate_trust_score({
-            "verdict": verdict,
-            "watchlist_hits": watchlist_hits,
-        })
-        letter_grade = get_letter_grade(trust_score)
-
-        # Generate point-based summary for the card UI (diff-focused)
-        summary_points = call_openai_points_summary(scan_target)
-
-        # Append new history entry (chronological; oldest first)
-        new_entry: dict = {
-            "previous_hash": previous_hash,
-            "current_hash": current_hash,
-            "timestamp": last_checked,
-            "verdict": verdict,
-            "diffSummary": diff_summary,
-            "changeIsSubstantial": True,
-            "changeReason": change_reason,
-            "changeMagnitude": change_magnitude,
-            "watchlist_hits": watchlist_hits,
-            "trustScore": trust_score,
-            "letterGrade": letter_grade,
-            "summaryPoints": summary_points,
-        }
-        history.append(new_entry)
+    # Text changed (even non-substantively) – always refresh current* fields
+    # so they stay in sync with the live ToS.
+    current_fields = compute_current_fields(new_text, watchlist)
 
+    if not is_significant:
+        # Non-substantive change (whitespace / cosmetic) – archive written,
+        # but we do NOT add a history entry or regenerate the diff summary.
+        latest_summary = read_tos_summary(name) or "Initial snapshot created. Monitoring active."
         company_score = calculate_score(history[-1]) if history else 100
         company_entry = {
             "name": name,
@@ -1272,17 +2261,128 @@ def monitor() -> dict:
             "tosUrl": tos_url,
             "lastChecked": last_checked,
             "latestSummary": latest_summary,
-            "summaryPoints": summary_points,
             "score": company_score,
-            "scores": calculate_diversified_scores({
-                "score": company_score,
-                "history": history,
-                "summaryPoints": summary_points,
-            }),
+            "scores": calculate_diversified_scores({"score": company_score, "history": history}),
             "history": history,
             **current_fields,
         }
-        company_results.append(company_entry)
+        return company_entry
+
+    # Substantive change – generate structured diff summary
+    if old_text is not None and old_text != new_text:
+        diff_text = build_diff(old_text, new_text)
+        diff_summary = cached_ai_call(
+            AI_DIFF_SUMMARY_PROMPT, diff_text, call_openai_diff_summary,
+            should_cache=_ai_summary_cacheable,
+        )
+    else:
+        diff_text = ""
+        diff_summary = call_openai_first_summary(new_text)
+
+    verdict = assign_verdict(change_reason, diff_summary)
+
+    # Flatten diff_summary to a plain-text string for latestSummary
+    latest_summary = " | ".join(
+        f"[{k}]: {v}" for k, v in diff_summary.items()
+        if v and v != "No significant change"
+    ) or "No significant change detected."
+
+    write_tos_summary(name, latest_summary)
+
+    # Compute change magnitude (percentage difference between versions)
+    change_magnitude = compute_change_magnitude(old_text or "", new_text)
+
+    # Scan for high-risk watchlist terms in the diff (or full text for first version)
+    scan_target = diff_text if diff_text else new_text
+    watchlist_hits = scan_watchlist(scan_target, watchlist)
+
+    trust_score = calculate_trust_score({
+        "verdict": verdict,
+        "watchlist_hits": watchlist_hits,
+    })
+    letter_grade = get_letter_grade(trust_score)
+
+    # Generate point-based summary for the card UI (diff-focused)
+    summary_points = call_openai_points_summary(scan_target)
+
+    # Append new history entry (chronological; oldest first)
+    new_entry: dict = {
+        "previous_hash": previous_hash,
+        "current_hash": current_hash,
+        "timestamp": last_checked,
+        "verdict": verdict,
+        "diffSummary": diff_summary,
+        "changeIsSubstantial": True,
+        "changeReason": change_reason,
+        "changeMagnitude": change_magnitude,
+        "watchlist_hits": watchlist_hits,
+        "trustScore": trust_score,
+        "letterGrade": letter_grade,
+        "summaryPoints": summary_points,
+    }
+    history.append(new_entry)
+
+    company_score = calculate_score(history[-1]) if history else 100
+    company_entry = {
+        "name": name,
+        "category": category,
+        "tosUrl": tos_url,
+        "lastChecked": last_checked,
+        "latestSummary": latest_summary,
+        "summaryPoints": summary_points,
+        "score": company_score,
+        "scores": calculate_diversified_scores({
+            "score": company_score,
+            "history": history,
+            "summaryPoints": summary_points,
+        }),
+        "history": history,
+        **current_fields,
+    }
+    return company_entry
+
+
+def _seed_http_validators(companies_config: list[dict]) -> None:
+    """Seed ``_http_validators`` for URLs that every company sharing them can revalidate.
+
+    A ``304`` vouches for every company sharing the URL, so a newly added
+    company (no snapshot yet) or a browser-rendered one disables it.
+    """
+    _http_validators.clear()
+    by_url: dict[str, list[dict]] = {}
+    for company in companies_config:
+        meta = read_snapshot_meta(company.get("name", ""))
+        if company.get("engine", "browser") == "browser":
+            meta = {}
+        by_url.setdefault(company.get("tosUrl", ""), []).append(meta)
+    for url, metas in by_url.items():
+        if metas[0] and all(meta == metas[0] for meta in metas):
+            _http_validators[url] = metas[0]
+
+
+def monitor() -> dict:
+    ensure_dirs()
+    companies_config = load_config()
+    now = datetime.now(timezone.utc).isoformat()
+    existing_results = load_existing_results()
+    watchlist = load_watchlist()
+
+    _openai_replies.clear()
+    _openai_key_locks.clear()
+    _doc_vector_cache.clear()
+    prune_ai_cache()
+
+    _seed_http_validators(companies_config)
+
+    # Each company is processed as soon as its page arrives, so OpenAI calls
+    # overlap the remaining fetches.
+    company_results = fetch_and_process(
+        [c.get("tosUrl", "") for c in companies_config],
+        lambda index, fetch_result: process_company(
+            companies_config[index], fetch_result, existing_results, watchlist
+        ),
+        engines=[c.get("engine", "browser") for c in companies_config],
+    )
 
     results = {
         "schemaVersion": SCHEMA_VERSION,
@@ -1333,17 +2433,19 @@ def re_rate_existing_results() -> dict:
     return existing
 
 
-def write_results(results: dict) -> None:
-    payload = json.dumps(results, indent=2, ensure_ascii=False)
+def write_results(results: dict) -> bytes:
+    """Write *results* to both results paths and return the serialised payload."""
+    payload = _json_dumps(results, indent=True)
     try:
-        json.loads(payload)
+        _json_loads(payload)
     except json.JSONDecodeError as exc:
         raise ValueError(
             f"write_results: serialised payload is not valid JSON – aborting write. "
             f"JSONDecodeError: {exc}"
         ) from exc
-    DATA_RESULTS_PATH.write_text(payload, encoding="utf-8")
-    PUBLIC_RESULTS_PATH.write_text(payload, encoding="utf-8")
+    _atomic_write(DATA_RESULTS_PATH, payload)
+    _mirror_file(DATA_RESULTS_PATH, PUBLIC_RESULTS_PATH)
+    return payload
 
 
 # ---------------------------------------------------------------------------
@@ -1407,11 +2509,11 @@ def write_summary_index(results: dict) -> None:
         "updatedAt": results.get("updatedAt"),
         "companies": summary_companies,
     }
-    payload = json.dumps(index, indent=2, ensure_ascii=False)
+    payload = _json_dumps(index, indent=True)
     SUMMARY_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SUMMARY_INDEX_PATH.write_text(payload, encoding="utf-8")
+    _atomic_write(SUMMARY_INDEX_PATH, payload)
     PUBLIC_SUMMARY_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-    PUBLIC_SUMMARY_INDEX_PATH.write_text(payload, encoding="utf-8")
+    _mirror_file(SUMMARY_INDEX_PATH, PUBLIC_SUMMARY_INDEX_PATH)
     print(f"Summary index written ({len(summary_companies)} companies).")
 
 
@@ -1440,7 +2542,7 @@ def fetch_and_store_favicons(companies_config: list[dict]) -> None:
             if dest.exists():
                 continue  # already cached
             favicon_url = f"https://www.google.com/s2/favicons?sz=32&domain={domain}"
-            resp = requests.get(favicon_url, timeout=10)
+            resp = _get_http_session().get(favicon_url, timeout=10)
             if resp.status_code == 200:
                 dest.write_bytes(resp.content)
                 print(f"  Saved favicon for {domain}")
@@ -1448,27 +2550,31 @@ def fetch_and_store_favicons(companies_config: list[dict]) -> None:
             print(f"  [favicon] Could not fetch for {company.get('name')}: {exc}")
 
 
-def validate_results(results: dict) -> None:
+_VALID_SCHEMA_VERSIONS = frozenset({"2.0", "2.1", "2.2"})
+_VALID_VERDICTS = frozenset({"Good", "Neutral", "Caution"})
+_REQUIRED_COMPANY_KEYS = ("name", "history", "latestSummary")
+_REQUIRED_ENTRY_KEYS = ("current_hash", "timestamp", "verdict", "diffSummary")
+
+
+def validate_results(results: dict, payload: bytes | None = None) -> None:
+    """Check the results schema; a *payload* from ``write_results`` was already parsed, so skips the round trip."""
     assert isinstance(results, dict), "results must be a dict"
     assert "companies" in results, "results must have 'companies' key"
-    assert results.get("schemaVersion") in ("2.0", "2.1", "2.2"), \
+    assert results.get("schemaVersion") in _VALID_SCHEMA_VERSIONS, \
         f"schemaVersion must be '2.0', '2.1', or '2.2', got: {results.get('schemaVersion')!r}"
     for company in results["companies"]:
-        assert "name" in company, f"company missing 'name': {company}"
-        assert "history" in company, f"company '{company.get('name')}' missing 'history'"
-        assert "latestSummary" in company, f"company '{company.get('name')}' missing 'latestSummary'"
+        missing = [key for key in _REQUIRED_COMPANY_KEYS if key not in company]
+        assert not missing, f"company '{company.get('name')}' missing {missing[0]!r}: {company}"
         for entry in company["history"]:
-            assert "current_hash" in entry, f"history entry missing 'current_hash'"
-            assert "timestamp" in entry, f"history entry missing 'timestamp'"
-            assert "verdict" in entry, f"history entry missing 'verdict'"
-            assert entry["verdict"] in ("Good", "Neutral", "Caution"), \
+            missing = [key for key in _REQUIRED_ENTRY_KEYS if key not in entry]
+            assert not missing, f"history entry missing {missing[0]!r}"
+            assert entry["verdict"] in _VALID_VERDICTS, \
                 f"verdict must be Good/Neutral/Caution, got: {entry['verdict']}"
-            assert "diffSummary" in entry, f"history entry missing 'diffSummary'"
-    try:
-        round_tripped = json.loads(json.dumps(results, ensure_ascii=False))
-        assert isinstance(round_tripped, dict)
-    except (json.JSONDecodeError, AssertionError) as exc:
-        raise ValueError(f"validate_results: JSON round-trip check failed – {exc}") from exc
+    if payload is None:
+        try:
+            _json_loads(_json_dumps(results))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"validate_results: JSON round-trip check failed – {exc}") from exc
     print("✅ Validation passed: results.json structure is correct.")
 
 
@@ -1477,9 +2583,9 @@ if __name__ == "__main__":
         re_rate_existing_results()
         sys.exit(0)
     final_results = monitor()
-    write_results(final_results)
+    payload = write_results(final_results)
     write_summary_index(final_results)
-    validate_results(final_results)
+    validate_results(final_results, payload)
     fetch_and_store_favicons(load_config())
     print(f"Done. Checked {len(final_results['companies'])} companies.")
     sys.exit(0)
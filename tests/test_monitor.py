@@ -1,9 +1,11 @@
 """Tests for the ToS archiving and summarization helpers in monitor.py."""
-import importlib
+import re
 import sys
+import threading
+import time
 import types
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -46,10 +48,31 @@ def tmp_env(tmp_path, monkeypatch):
     monkeypatch.setattr(monitor, "DATA_RESULTS_PATH", tmp_path / "data" / "results.json")
     monkeypatch.setattr(monitor, "PUBLIC_RESULTS_PATH", tmp_path / "public" / "data" / "results.json")
     monkeypatch.setattr(monitor, "TOS_DIR", tmp_path / "terms_of_service")
+    monkeypatch.setattr(monitor, "AI_CACHE_DIR", tmp_path / "data" / "ai_cache")
     monitor.ensure_dirs()
     return tmp_path
 
 
+def _use_fake_company(monkeypatch, **overrides) -> dict:
+    """Make monitor.load_config() return a single fake company and return its config."""
+    company = {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech", **overrides}
+    monkeypatch.setattr(monitor, "load_config", lambda: [company])
+    return company
+
+
+@pytest.fixture()
+def fake_company(monkeypatch):
+    """Configure monitor with the single fake company used by the end-to-end tests."""
+    return _use_fake_company(monkeypatch)
+
+
+def _raising(exc: BaseException):
+    """Return a stub that raises *exc* whenever it is called."""
+    def stub(*args, **kwargs):
+        raise exc
+    return stub
+
+
 # ---------------------------------------------------------------------------
 # ToS archiving tests
 # ---------------------------------------------------------------------------
@@ -73,6 +96,33 @@ class TestArchiveTosIfChanged:
         ]
         assert len(dated_files) == 1  # Still only one file
 
+    def test_archive_not_read_when_hash_matches_or_size_differs(self, tmp_env, monkeypatch):
+        monitor.archive_tos_if_changed("Acme", "Version 1")
+        real_read_text = Path.read_text
+
+        def guarded_read_text(self, *args, **kwargs):
+            if self.suffix == ".txt":
+                pytest.fail("archive read despite hash pointer")
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(monitor.Path, "read_text", guarded_read_text)
+        monkeypatch.setattr(
+            monitor.Path, "read_bytes",
+            lambda self: pytest.fail("archive read despite hash pointer"),
+        )
+        assert monitor.archive_tos_if_changed("Acme", "Version 1") is False
+        assert monitor.archive_tos_if_changed("Acme", "Version 10") is True
+
+    def test_pointer_from_other_hasher_does_not_rearchive(self, tmp_env):
+        monitor.archive_tos_if_changed("Acme", "Hello ToS")
+        archive_dir = monitor.tos_archive_dir("Acme")
+        name = (archive_dir / ".latest").read_text().splitlines()[0]
+        # Simulate a pointer written by the other content_hash algorithm.
+        (archive_dir / ".latest").write_text(f"{name}\nblake2b-digest\n")
+        assert monitor.archive_tos_if_changed("Acme", "Hello ToS") is False
+        assert [f.name for f in archive_dir.glob("*.txt")] == [name]
+        assert (archive_dir / ".latest").read_text() == f"{name}\n{monitor.content_hash('Hello ToS')}\n"
+
     def test_changed_content_creates_second_file(self, tmp_env):
         monitor.archive_tos_if_changed("Acme", "Version 1")
         archived = monitor.archive_tos_if_changed("Acme", "Version 2")
@@ -84,27 +134,29 @@ class TestArchiveTosIfChanged:
         assert len(dated_files) == 2
         assert dated_files[-1].read_text() == "Version 2"
 
-    def test_same_day_collision_adds_suffix(self, tmp_env, monkeypatch):
+    def test_same_day_collision_adds_suffix(self, tmp_env):
         """Two distinct versions on the same date get suffixed filenames."""
-        from datetime import timezone
+        from datetime import datetime, timezone
         fixed_date = "2026-01-01"
 
-        # Patch datetime in monitor to return a fixed date
-        mock_dt = MagicMock()
-        mock_dt.now.return_value.strftime.return_value = fixed_date
-        monkeypatch.setattr(monitor, "datetime", mock_dt)
-
-        # Also make timezone available (it's used in monitor directly)
-        monkeypatch.setattr(mock_dt, "timezone", timezone)
-
-        monitor.archive_tos_if_changed("Acme", "Version A")
-        monitor.archive_tos_if_changed("Acme", "Version B")
+        monitor.archive_tos_if_changed(
+            "Acme", "Version A", when=datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+        )
+        monitor.archive_tos_if_changed(
+            "Acme", "Version B", when=datetime(2026, 1, 1, 17, tzinfo=timezone.utc)
+        )
 
         archive_dir = monitor.tos_archive_dir("Acme")
-        dated_files = sorted(f.name for f in archive_dir.glob("*.txt") if f.name != "summary.txt")
+        dated_files = {f.name for f in archive_dir.glob("*.txt") if f.name != "summary.txt"}
         assert f"{fixed_date}.txt" in dated_files
         assert f"{fixed_date}_1.txt" in dated_files
 
+    def test_archive_named_after_given_time(self, tmp_env):
+        from datetime import datetime, timezone
+        when = datetime(2025, 3, 4, 23, 59, tzinfo=timezone.utc)
+        monitor.archive_tos_if_changed("Acme", "Hello ToS", when=when)
+        assert (monitor.tos_archive_dir("Acme") / "2025-03-04.txt").exists()
+
     def test_previous_versions_are_retained(self, tmp_env):
         """Archiving multiple changes must keep all previous files."""
         for i in range(1, 4):
@@ -116,6 +168,31 @@ class TestArchiveTosIfChanged:
         ]
         assert len(dated_files) == 3
 
+    def test_latest_pointer_avoids_directory_listing(self, tmp_env, monkeypatch):
+        from datetime import datetime, timezone
+        when = datetime(2025, 3, 4, tzinfo=timezone.utc)
+        monitor.archive_tos_if_changed("Acme", "Version 1", when=when)
+        pointer = monitor.tos_archive_dir("Acme") / ".latest"
+        assert pointer.read_text() == f"2025-03-04.txt\n{monitor.content_hash('Version 1')}\n"
+        monkeypatch.setattr(
+            monitor, "_dated_archive_files",
+            lambda name: pytest.fail("archive directory listed despite pointer"),
+        )
+        assert monitor.archive_tos_if_changed("Acme", "Version 1") is False
+        assert monitor.get_latest_archived_tos("Acme") == "Version 1"
+
+    def test_missing_or_stale_pointer_falls_back_to_listing(self, tmp_env):
+        archive_dir = monitor.tos_archive_dir("Acme")
+        archive_dir.mkdir(parents=True)
+        (archive_dir / "2025-01-01.txt").write_text("Old")
+        (archive_dir / "2025-02-01.txt").write_text("New")
+        assert monitor.get_latest_archived_tos("Acme") == "New"
+        assert (archive_dir / ".latest").read_text().splitlines()[0] == "2025-02-01.txt"
+        (archive_dir / ".latest").write_text("2024-12-31.txt\nstale\n")
+        assert monitor.archive_tos_if_changed("Acme", "New") is False
+        (archive_dir / ".latest").write_text("2025-02-01.txt\n")  # name-only pointer
+        assert monitor.archive_tos_if_changed("Acme", "New") is False
+
 
 # ---------------------------------------------------------------------------
 # Summary persistence tests
@@ -151,9 +228,7 @@ class TestMonitorSummaryFallback:
     def _run_monitor_single(self, tmp_env, monkeypatch, tos_text, openai_return=None):
         """Run monitor() for a single fake company and return the result dict."""
         monkeypatch.setattr(monitor, "CONFIG_PATH", None)  # unused – we patch load_config
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
+        _use_fake_company(monkeypatch)
         monkeypatch.setattr(monitor, "fetch_text", lambda url: tos_text)
 
         if openai_return is not None:
@@ -203,7 +278,7 @@ class TestMonitorSummaryFallback:
         # summary.txt should be updated
         assert monitor.read_tos_summary("TestCo") == "Diff summary"
 
-    def test_no_regeneration_when_tos_unchanged_and_summary_missing(self, tmp_env, monkeypatch):
+    def test_no_regeneration_when_tos_unchanged_and_summary_missing(self, tmp_env, fake_company, monkeypatch):
         """Summary stability principle: AI must not be called when ToS is unchanged, even if summary.txt is missing."""
         # Seed an archive for "ToS text v1" so archived=False on next run with same text
         monitor.archive_tos_if_changed("TestCo", "ToS text v1")
@@ -217,9 +292,6 @@ class TestMonitorSummaryFallback:
             call_count["n"] += 1
             return "Should not be called"
 
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
         monkeypatch.setattr(monitor, "fetch_text", lambda url: "ToS text v1")
         monkeypatch.setattr(monitor, "call_openai_overview", counting_overview)
 
@@ -228,20 +300,17 @@ class TestMonitorSummaryFallback:
         assert call_count["n"] == 0, "AI must not be called when ToS is unchanged"
         assert company["changed"] is False
 
-    def test_fetch_error_uses_persisted_summary(self, tmp_env, monkeypatch):
+    def test_fetch_error_uses_persisted_summary(self, tmp_env, fake_company, monkeypatch):
         """When fetching fails, return the previously persisted summary."""
         # Pre-seed a summary
         monitor.write_tos_summary("TestCo", "Cached summary from before.")
 
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
-        monkeypatch.setattr(monitor, "fetch_text", lambda url: (_ for _ in ()).throw(RuntimeError("timeout")))
+        monkeypatch.setattr(monitor, "fetch_text", _raising(RuntimeError("timeout")))
 
         results = monitor.monitor()
         assert results["companies"][0]["summary"] == "Cached summary from before."
 
-    def test_content_diff_is_sole_trigger_for_regeneration(self, tmp_env, monkeypatch):
+    def test_content_diff_is_sole_trigger_for_regeneration(self, tmp_env, fake_company, monkeypatch):
         """Content-diff method: AI is called if and only if the ToS raw text changes.
 
         Verifies four cases:
@@ -260,9 +329,6 @@ class TestMonitorSummaryFallback:
             ai_call_count["n"] += 1
             return "AI diff summary"
 
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
         monkeypatch.setattr(monitor, "call_openai_overview", counting_overview)
         monkeypatch.setattr(monitor, "call_openai", counting_diff)
 
@@ -300,14 +366,11 @@ class TestSummaryFormat:
     def _word_count(self, text: str) -> int:
         return len(text.split())
 
-    def test_summary_on_change_is_at_most_30_words(self, tmp_env, monkeypatch):
+    def test_summary_on_change_is_at_most_30_words(self, tmp_env, fake_company, monkeypatch):
         """When a ToS changes, the resulting summary must be <=30 words."""
         short_summary = "Data: Company collects browsing data and trains AI on content. Users cannot opt out."
         assert self._word_count(short_summary) <= 30
 
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
 
         # First run: establish initial snapshot
         call_count = {"index": 0}
@@ -331,9 +394,7 @@ class TestSummaryFormat:
         short_summary = "AI: Trains models on user data; broad liability waiver; no opt-out for data collection."
         assert self._word_count(short_summary) <= 30
 
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "AI"}
-        ])
+        _use_fake_company(monkeypatch, category="AI")
         monkeypatch.setattr(monitor, "fetch_text", lambda url: "Some ToS text")
         monkeypatch.setattr(monitor, "call_openai_overview", lambda text: short_summary)
 
@@ -394,8 +455,92 @@ class TestFallbackSimilarity:
         b = "The user agrees to arbitration for all disputes!"
         assert monitor.fallback_similarity(a, b) > 0.97
 
+    def _repetitive_pair(self, words: int):
+        vocab = ["the", "user", "agrees", "to", "arbitration", "of", "all", "disputes"]
+        rng = monitor.random.Random(0)
+        a = " ".join(rng.choice(vocab) for _ in range(words))
+        return a, a[:500] + " a newly inserted clause " + a[500:]
+
+    def test_repetitive_legal_text_not_scored_as_junk(self, monkeypatch):
+        monkeypatch.setattr(monitor, "_dmp_class", False)
+        a, b = self._repetitive_pair(400)
+        assert monitor.fallback_similarity(a, b) > 0.95
+
+    def test_long_text_without_diff_match_patch_compared_by_line(self, monkeypatch):
+        monkeypatch.setattr(monitor, "_dmp_class", False)
+        monkeypatch.setattr(monitor, "SIMILARITY_CHAR_LEVEL_MAX", 100)
+        a = "".join(f"Section {i}: the user agrees to these terms.\n" for i in range(50))
+        b = a.replace("Section 7:", "Section seven:")
+        score = monitor.fallback_similarity(a, b)
+        line = "Section 7: the user agrees to these terms.\n"
+        assert score == pytest.approx(2 * (len(a) - len(line)) / (len(a) + len(b)))
+
+    def test_diff_match_patch_similarity_on_long_text(self):
+        pytest.importorskip("diff_match_patch")
+        a, b = self._repetitive_pair(20000)
+        assert monitor.fallback_similarity(a, b) > 0.99
+
+    def test_diff_match_patch_counts_partial_word_edits(self):
+        pytest.importorskip("diff_match_patch")
+        a = "The user agrees to arbitration for all disputes."
+        b = "The user agrees to arbitration for all disputes!"
+        expected = monitor.difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+        assert monitor.fallback_similarity(a, b) == pytest.approx(expected)
+
+
+class TestSemanticSimilarityVectors:
+    def _fake_nlp(self, batches):
+        def pipe(texts, batch_size=None):
+            batches.append(list(texts))
+            return [types.SimpleNamespace(vector=[float(len(t)), 1.0, 0.0]) for t in texts]
+
+        return types.SimpleNamespace(pipe=pipe)
+
+    def test_vectors_reused_within_a_run(self, tmp_env, monkeypatch):
+        batches = []
+        monkeypatch.setattr(monitor, "_spacy_nlp", self._fake_nlp(batches))
+        monkeypatch.setattr(monitor, "_doc_vector_cache", {})
+        first = monitor.semantic_similarity("abc", "abcd")
+        assert batches == [["abc", "abcd"]]
+        assert monitor.semantic_similarity("abc", "abcd") == pytest.approx(first)
+        assert batches == [["abc", "abcd"], []]
+        assert not (monitor.SNAPSHOTS_DIR / ".vec_cache").exists()
+
+    def test_changed_sections_embedded_in_one_batch(self, tmp_env, monkeypatch):
+        batches = []
+        monkeypatch.setattr(monitor, "_spacy_nlp", self._fake_nlp(batches))
+        monkeypatch.setattr(monitor, "_doc_vector_cache", {})
+        old = "we limit our liability.\n\nall disputes go to arbitration."
+        new = "we limit all liability.\n\nall disputes go to binding arbitration."
+        monitor.detect_substantive_change(old, new)
+        assert sorted(batches[0]) == sorted([
+            "we limit our liability.", "we limit all liability.",
+            "all disputes go to arbitration.", "all disputes go to binding arbitration.",
+        ])
+
+    def test_model_loaded_without_pipeline_components(self, monkeypatch):
+        spacy = types.ModuleType("spacy")
+        spacy.load = MagicMock()
+        monkeypatch.setitem(sys.modules, "spacy", spacy)
+        monkeypatch.setattr(monitor, "_spacy_nlp", None)
+        assert monitor._get_spacy_nlp() is spacy.load.return_value
+        spacy.load.assert_called_once_with(
+            monitor.SPACY_MODEL, exclude=monitor.SPACY_EXCLUDED_COMPONENTS
+        )
+        assert "parser" in monitor.SPACY_EXCLUDED_COMPONENTS
+
+    def test_cosine_matches_doc_similarity(self):
+        assert monitor._cosine_similarity([1.0, 0.0], [1.0, 0.0]) == pytest.approx(1.0)
+        assert monitor._cosine_similarity([1.0, 0.0], [0.0, 2.0]) == pytest.approx(0.0)
+        assert monitor._cosine_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+
 
 class TestExtractHotSectionText:
+    def test_iter_paragraphs_matches_split(self):
+        text = "\n\nfirst\nline\n\n\n  \n\nsecond\n\nthird\n\n"
+        expected = [p for p in re.split(r"\n{2,}", text) if p.strip()]
+        assert list(monitor._iter_paragraphs(text)) == expected
+
     def test_privacy_keyword(self):
         text = "we collect personal data from users\n\nunrelated paragraph here"
         sections = monitor.extract_hot_section_text(text)
@@ -419,6 +564,77 @@ class TestExtractHotSectionText:
         assert text in sections["liability"]
         assert text in sections["privacy"]
 
+    def test_overlapping_matches_from_different_sections(self):
+        # "your data" (user_data) and "data collection" (privacy) share "data".
+        text = "we describe your data collection practices"
+        sections = monitor.extract_hot_section_text(text)
+        assert sections["user_data"] == text
+        assert sections["privacy"] == text
+
+    def test_matches_per_pattern_search(self):
+        paragraphs = [
+            "Termination: we may suspend accounts. Governing law is Delaware.",
+            "Class-action waiver; disputes go to binding arbitration.",
+            "We use machine learning and AI-training on user content.",
+            "Indemnification and limitation of liability.",
+            "Nothing relevant in this paragraph at all.",
+        ]
+        sections = monitor.extract_hot_section_text("\n\n".join(paragraphs))
+        for name, patterns in monitor.HOT_SECTION_KEYWORDS.items():
+            expected = [
+                p for p in paragraphs
+                if any(monitor.re.search(pat, p, monitor.re.IGNORECASE) for pat in patterns)
+            ]
+            assert sections[name] == "\n\n".join(expected)
+
+    def test_anchor_prefilter_skips_regex(self, monkeypatch):
+        union = MagicMock()
+        union.finditer.return_value = []
+        monkeypatch.setattr(monitor, "_HOT_SECTION_UNION", union)
+        monitor.extract_hot_section_text("welcome to our service\n\nenjoy your stay")
+        union.finditer.assert_not_called()
+
+    def test_every_pattern_implies_an_anchor(self):
+        examples = {
+            "liability": ["liabilities", "indemnify"],
+            "privacy": ["privacy", "personal data", "data collection"],
+            "arbitration": ["arbitrate"],
+            "dispute": ["disputes", "class-action"],
+            "termination": ["terminated", "suspended"],
+            "user_data": ["user data", "your data", "user content"],
+            "ai": ["artificial intelligence", "machine learning", "ai-training"],
+            "governing_law": ["governing law", "jurisdiction"],
+        }
+        for name, phrases in examples.items():
+            for phrase in phrases:
+                assert monitor.extract_hot_section_text(phrase.upper())[name] == phrase.upper()
+
+    def test_anchor_prefilter_never_changes_the_result(self):
+        # Every character IGNORECASE matches to an ASCII letter, including the
+        # non-ASCII ones ("ſ", Kelvin sign, "İ", "ı") that str.lower() misses.
+        candidates = [*map(chr, range(0x180)), "\u212a"]
+        variants = {
+            letter: [c for c in candidates if monitor.re.fullmatch(letter, c, monitor.re.IGNORECASE)]
+            for letter in "abcdefghijklmnopqrstuvwxyz"
+        }
+        phrases = [
+            "liability", "indemnify", "privacy", "personal data", "data collection",
+            "arbitration", "dispute", "class action", "termination", "suspend",
+            "user data", "your data", "user content", "artificial intelligence",
+            "machine learning", "ai training", "governing law", "jurisdiction",
+        ]
+        paragraphs = []
+        for phrase in phrases:
+            for i, char in enumerate(phrase):
+                for variant in variants.get(char, []):
+                    paragraphs.append(f"we may {phrase[:i]}{variant}{phrase[i + 1:]} at any time")
+        sections = monitor.extract_hot_section_text("\n\n".join(paragraphs))
+        expected: dict[str, list[str]] = {name: [] for name in monitor.HOT_SECTION_KEYWORDS}
+        for para in paragraphs:
+            for name in {m.lastgroup for m in monitor._HOT_SECTION_UNION.finditer(para)}:
+                expected[name].append(para)
+        assert sections == {name: "\n\n".join(paras) for name, paras in expected.items()}
+
 
 class TestDetectSubstantiveChange:
     def test_identical_texts_not_significant(self):
@@ -440,6 +656,22 @@ class TestDetectSubstantiveChange:
         assert is_sig is True
         assert "document changed by" in reason
 
+    def test_unchanged_hot_sections_skip_similarity(self, monkeypatch):
+        compared = []
+
+        def similarity(a, b):
+            compared.append((a, b))
+            return 1.0
+
+        monkeypatch.setattr(monitor, "semantic_similarity", similarity)
+        body = "we limit our liability.\n\nall disputes go to arbitration."
+        filler = "\n\n" + "welcome to our service. " * 20
+        old = body + filler
+        new = body + filler.replace("our service", "our great service", 1)
+        monitor.detect_substantive_change(old, new)
+        # Only the whole-document comparison runs; no hot section changed.
+        assert len(compared) == 1
+
     def test_hot_section_change_is_significant(self):
         old = "You waive all rights to arbitration for minor disputes."
         new = "You agree to binding arbitration and waive all class action rights."
@@ -496,9 +728,7 @@ class TestHybridDiffMonitorIntegration:
     """Verify that monitor() correctly uses hybrid diff logic."""
 
     def _run(self, tmp_env, monkeypatch, tos_text, ai_return="AI summary"):
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
+        _use_fake_company(monkeypatch)
         monkeypatch.setattr(monitor, "fetch_text", lambda url: tos_text)
         monkeypatch.setattr(monitor, "call_openai_overview", lambda text: ai_return)
         monkeypatch.setattr(monitor, "call_openai", lambda diff: ai_return)
@@ -669,9 +899,7 @@ class TestDetectSubstantiveChangeAppendix:
 
 class TestChangeIsSubstantialField:
     def _run(self, tmp_env, monkeypatch, tos_text, ai_return="AI summary"):
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
+        _use_fake_company(monkeypatch)
         monkeypatch.setattr(monitor, "fetch_text", lambda url: tos_text)
         monkeypatch.setattr(monitor, "call_openai_overview", lambda text: ai_return)
         monkeypatch.setattr(monitor, "call_openai", lambda diff: ai_return)
@@ -693,11 +921,8 @@ class TestChangeIsSubstantialField:
         assert result["changed"] is True
         assert result["changeIsSubstantial"] is True
 
-    def test_field_false_on_fetch_error(self, tmp_env, monkeypatch):
+    def test_field_false_on_fetch_error(self, tmp_env, fake_company, monkeypatch):
         monitor.write_tos_summary("TestCo", "Cached summary.")
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
 
         def fetch_fail(url):
             raise RuntimeError("timeout")
@@ -917,9 +1142,7 @@ class TestMonitorKeepsAllSnapshots:
     """monitor() must retain all distinct ToS snapshots per company."""
 
     def _run(self, tmp_env, monkeypatch, tos_text, ai_return="AI summary"):
-        monkeypatch.setattr(monitor, "load_config", lambda: [
-            {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Tech"}
-        ])
+        _use_fake_company(monkeypatch)
         monkeypatch.setattr(monitor, "fetch_text", lambda url: tos_text)
         monkeypatch.setattr(monitor, "call_openai_overview", lambda text: ai_return)
         monkeypatch.setattr(monitor, "call_openai", lambda diff: ai_return)
@@ -1128,3 +1351,792 @@ class TestLoadCases:
             assert "weight" in case
             assert case["rating"] in ("Good", "Neutral", "Bad", "Blocker")
             assert isinstance(case["weight"], int)
+
+
+# ---------------------------------------------------------------------------
+# fetch_all_texts tests
+# ---------------------------------------------------------------------------
+
+class TestFetchAllTexts:
+    def test_results_returned_in_input_order(self, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: f"text for {url}")
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        assert monitor.fetch_all_texts(urls) == [f"text for {u}" for u in urls]
+
+    def test_failure_returned_in_place_of_text(self, monkeypatch):
+        def fetch(url):
+            if url.endswith("bad"):
+                raise RuntimeError("timeout")
+            return "ok"
+
+        monkeypatch.setattr(monitor, "fetch_text", fetch)
+        results = monitor.fetch_all_texts(["https://a/good", "https://a/bad", "https://a/good"])
+        assert results[0] == "ok"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "ok"
+
+    def test_empty_url_list(self):
+        assert monitor.fetch_all_texts([]) == []
+
+
+# ---------------------------------------------------------------------------
+# shared_browser tests
+# ---------------------------------------------------------------------------
+
+class TestLazyImports:
+    def test_browser_modules_loaded_on_first_use(self, monkeypatch):
+        monkeypatch.setattr(monitor, "sync_playwright", None)
+        monkeypatch.setattr(monitor, "Stealth", None)
+        monitor._load_browser_modules()
+        assert monitor.sync_playwright is sys.modules["playwright.sync_api"].sync_playwright
+        assert monitor.Stealth is sys.modules["playwright_stealth"].Stealth
+
+    def test_patched_names_are_kept(self, monkeypatch):
+        fake = MagicMock()
+        monkeypatch.setattr(monitor, "sync_playwright", fake)
+        monitor._load_browser_modules()
+        assert monitor.sync_playwright is fake
+
+    def test_beautiful_soup_loaded_on_first_use(self, monkeypatch):
+        monkeypatch.setattr(monitor, "BeautifulSoup", None)
+        assert monitor._get_beautiful_soup() is sys.modules["bs4"].BeautifulSoup
+
+
+class TestRetryDelay:
+    def test_exponential_with_bounded_jitter(self, monkeypatch):
+        monkeypatch.setattr(monitor.random, "uniform", lambda low, high: high)
+        assert [monitor._retry_delay(a) for a in (1, 2, 3)] == [7.5, 15.0, 30.0]
+        monkeypatch.setattr(monitor.random, "uniform", lambda low, high: low)
+        assert [monitor._retry_delay(a) for a in (1, 2, 3)] == [5, 10, 20]
+
+
+class TestSharedBrowser:
+    def _patch_playwright(self, monkeypatch):
+        playwright = MagicMock()
+        soup = MagicMock()
+        soup.return_value.get_text.return_value = "page text"
+        monkeypatch.setattr(monitor, "sync_playwright", playwright)
+        monkeypatch.setattr(monitor, "Stealth", MagicMock())
+        monkeypatch.setattr(monitor, "BeautifulSoup", soup)
+        monkeypatch.setattr(monitor, "_html_parser_class", False)
+        monkeypatch.setattr(monitor.time, "sleep", lambda seconds: None)
+        return playwright
+
+    def test_browser_launched_once_inside_shared_block(self, monkeypatch):
+        playwright = self._patch_playwright(monkeypatch)
+        with monitor.shared_browser():
+            for i in range(3):
+                assert monitor.fetch_text(f"https://example.com/{i}") == "page text"
+        launch = playwright.return_value.start.return_value.chromium.launch
+        assert launch.call_count == 1
+        assert launch.return_value.new_context.call_count == 3
+        launch.return_value.close.assert_called_once()
+
+    def test_browser_launched_per_fetch_outside_shared_block(self, monkeypatch):
+        playwright = self._patch_playwright(monkeypatch)
+        for i in range(2):
+            monitor.fetch_text(f"https://example.com/{i}")
+        launch = playwright.return_value.__enter__.return_value.chromium.launch
+        assert launch.call_count == 2
+
+    def test_failed_launch_is_reported_per_company(self, monkeypatch):
+        playwright = self._patch_playwright(monkeypatch)
+        started = playwright.return_value.start.return_value
+        started.chromium.launch.side_effect = RuntimeError("chromium missing")
+        results = monitor.fetch_and_process(
+            ["https://a.example", "https://b.example"],
+            lambda index, fetch_result: fetch_result,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # Every failed launch stops the Playwright instance it started.
+        assert started.stop.call_count == started.chromium.launch.call_count
+
+
+# ---------------------------------------------------------------------------
+# Snapshot content-hash sidecar tests
+# ---------------------------------------------------------------------------
+
+class TestSnapshotHash:
+    def test_write_snapshot_writes_hash_sidecar(self, tmp_env):
+        monitor.write_snapshot("Acme", "Hello ToS")
+        assert monitor.read_snapshot_hash("Acme") == monitor.content_hash("Hello ToS")
+
+    def test_snapshot_files_written_atomically(self, tmp_env, monkeypatch):
+        written = []
+        real_atomic_write = monitor._atomic_write
+
+        def recording_atomic_write(path, data):
+            written.append(path)
+            real_atomic_write(path, data)
+
+        monkeypatch.setattr(monitor, "_atomic_write", recording_atomic_write)
+        monitor.write_snapshot("Acme", "Hello ToS")
+        monitor.write_tos_summary("Acme", "Summary")
+        monitor.archive_tos_if_changed("Acme", "Hello ToS")
+        assert monitor.snapshot_hash_path("Acme") in written
+        assert monitor.tos_archive_dir("Acme") / "summary.txt" in written
+        assert monitor.tos_archive_dir("Acme") / ".latest" in written
+        assert len(written) == 5
+        assert not list(monitor.SNAPSHOTS_DIR.glob("*.tmp"))
+        assert monitor.read_snapshot("Acme") == "Hello ToS"
+
+    def test_atomic_write_honours_umask(self, tmp_path, monkeypatch):
+        # mkstemp would otherwise leave every written file at 0600.
+        monkeypatch.setattr(monitor, "_NEW_FILE_MODE", 0o644)
+        path = tmp_path / "results.json"
+        monitor._atomic_write(path, b"{}")
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_process_company_hashes_page_once(self, tmp_env, monkeypatch):
+        company = {"name": "Acme", "tosUrl": "https://acme.example/tos"}
+        monitor.process_company(company, "Hello ToS")
+        calls = []
+        real_content_hash = monitor.content_hash
+
+        def counting_content_hash(text):
+            calls.append(text)
+            return real_content_hash(text)
+
+        monkeypatch.setattr(monitor, "content_hash", counting_content_hash)
+        result = monitor.process_company(company, "Hello ToS")
+        assert result["changed"] is False
+        assert len(calls) == 1
+
+    def test_missing_sidecar_returns_none(self, tmp_env):
+        monitor.snapshot_path("Acme").write_text("legacy snapshot", encoding="utf-8")
+        assert monitor.read_snapshot_hash("Acme") is None
+
+    def test_different_text_different_hash(self):
+        assert monitor.content_hash("Version 1") != monitor.content_hash("Version 2")
+
+    def test_xxh3_used_when_available(self):
+        xxhash = pytest.importorskip("xxhash")
+        assert monitor.content_hash("ToS") == f"xxh3:{xxhash.xxh3_64_hexdigest(b'ToS')}"
+
+    def test_blake2b_fallback_never_matches_xxh3(self, monkeypatch):
+        pytest.importorskip("xxhash")
+        fast = monitor.content_hash("ToS")
+        monkeypatch.setattr(monitor, "_xxhash", False)
+        assert monitor.content_hash("ToS") != fast
+        assert len(monitor.content_hash("ToS")) == 32
+
+    def test_snapshot_written_compressed(self, tmp_env):
+        pytest.importorskip("zstandard")
+        monitor.write_snapshot("Acme", "Hello ToS " * 100)
+        assert monitor.compressed_snapshot_path("Acme").exists()
+        assert not monitor.snapshot_path("Acme").exists()
+        assert monitor.compressed_snapshot_path("Acme").stat().st_size < 1000
+        assert monitor.read_snapshot("Acme") == "Hello ToS " * 100
+
+    def test_legacy_plain_snapshot_is_read_and_migrated(self, tmp_env):
+        pytest.importorskip("zstandard")
+        monitor.snapshot_path("Acme").write_text("legacy snapshot", encoding="utf-8")
+        assert monitor.read_snapshot("Acme") == "legacy snapshot"
+        assert not monitor.snapshot_path("Acme").exists()
+        assert monitor.read_snapshot("Acme") == "legacy snapshot"
+
+    def test_plain_snapshot_without_zstandard(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "_zstd", False)
+        monitor.write_snapshot("Acme", "Hello ToS")
+        assert monitor.snapshot_path("Acme").read_text(encoding="utf-8") == "Hello ToS"
+        assert monitor.read_snapshot("Acme") == "Hello ToS"
+
+    def test_unchanged_page_skips_snapshot_read(self, tmp_env, fake_company, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: "Same ToS")
+        monkeypatch.setattr(monitor, "call_openai_overview", lambda text: "Overview")
+        monitor.monitor()
+
+        def fail_read(name):
+            raise AssertionError("snapshot should not be read when unchanged")
+
+        monkeypatch.setattr(monitor, "read_snapshot", fail_read)
+        result = monitor.monitor()["companies"][0]
+        assert result["changed"] is False
+        assert result["summary"] == "Overview"
+
+
+# ---------------------------------------------------------------------------
+# build_diff tests
+# ---------------------------------------------------------------------------
+
+class TestBuildDiff:
+    def test_unified_diff_of_changed_line(self):
+        diff = monitor.build_diff("a\nb\nc\n", "a\nB\nc\n")
+        assert "-b\n" in diff
+        assert "+B\n" in diff
+
+    def test_identical_texts_produce_empty_diff(self):
+        assert monitor.build_diff("same\n", "same\n") == ""
+
+    def test_diff_capped_at_1000_lines(self):
+        old = "".join(f"old {i}\n" for i in range(2000))
+        new = "".join(f"new {i}\n" for i in range(2000))
+        assert len(monitor.build_diff(old, new).splitlines()) == 1000
+
+    def test_difflib_fallback_when_diff_match_patch_missing(self, monkeypatch):
+        monkeypatch.setattr(monitor, "_dmp_class", False)
+        diff = monitor.build_diff("a\nb\nc\n", "a\nB\nc\n")
+        assert diff == "--- previous\n+++ current\n@@ -1,3 +1,3 @@\n a\n-b\n+B\n c\n"
+
+    def test_diff_match_patch_output_matches_difflib_format(self, monkeypatch):
+        pytest.importorskip("diff_match_patch")
+        monkeypatch.setattr(monitor, "_dmp_class", None)
+        old = "".join(f"line {i}\n" for i in range(20))
+        new = old.replace("line 5\n", "line five\n").replace("line 15\n", "")
+        expected = "".join(monitor.difflib.unified_diff(
+            old.splitlines(keepends=True), new.splitlines(keepends=True),
+            fromfile="previous", tofile="current", n=3,
+        ))
+        assert monitor.build_diff(old, new) == expected
+
+    def test_only_differing_middle_reaches_matcher(self, monkeypatch):
+        monkeypatch.setattr(monitor, "_dmp_class", False)
+        seen = []
+        real_matcher = monitor.difflib.SequenceMatcher
+
+        def recording_matcher(isjunk, a, b):
+            seen.append((len(a), len(b)))
+            return real_matcher(isjunk, a, b)
+
+        monkeypatch.setattr(monitor.difflib, "SequenceMatcher", recording_matcher)
+        old = "".join(f"line {i}\n" for i in range(500))
+        new = old.replace("line 250\n", "line two-fifty\n")
+        diff = monitor.build_diff(old, new)
+        assert (1, 1) in seen
+        assert "@@ -248,7 +248,7 @@\n" in diff
+        assert "-line 250\n+line two-fifty\n" in diff
+
+    def test_trimmed_fallback_matches_difflib(self, monkeypatch):
+        monkeypatch.setattr(monitor, "_dmp_class", False)
+        old = "".join(f"line {i}\n" for i in range(40))
+        new = old.replace("line 2\n", "").replace("line 37\n", "line 37b\n") + "tail\n"
+        expected = "".join(monitor.difflib.unified_diff(
+            old.splitlines(keepends=True), new.splitlines(keepends=True),
+            fromfile="previous", tofile="current", n=3,
+        ))
+        assert monitor.build_diff(old, new) == expected
+
+    def test_oversized_inputs_diff_only_head_and_tail_windows(self, monkeypatch):
+        monkeypatch.setattr(monitor, "DIFF_MAX_INPUT_CHARS", 100)
+        monkeypatch.setattr(monitor, "DIFF_WINDOW_CHARS", 30)
+        old = "".join(f"line {i:02}\n" for i in range(40))
+        new = (
+            old.replace("line 01\n", "line one\n")
+            .replace("line 20\n", "line twenty\n")
+            .replace("line 38\n", "line thirty-eight\n")
+        )
+        diff = monitor.build_diff(old, new)
+        assert diff.startswith("--- previous\n+++ current\n")
+        assert diff.count("--- previous") == 1
+        assert "-line 01\n+line one\n" in diff
+        assert "-line 38\n+line thirty-eight\n" in diff
+        assert "twenty" not in diff
+        assert "@@ -39,2 +39,2 @@\n-line 38\n" in diff
+
+
+# ---------------------------------------------------------------------------
+# html_to_text tests
+# ---------------------------------------------------------------------------
+
+class TestHtmlToText:
+    def test_selectolax_strips_ui_elements_and_joins_text_nodes(self, monkeypatch):
+        pytest.importorskip("selectolax.lexbor")
+        monkeypatch.setattr(monitor, "_html_parser_class", None)
+        html = (
+            "<html><head><title>Legal</title><style>p {}</style></head><body>"
+            "<nav>Menu</nav><h1>Terms of Service</h1>"
+            "<p>Hello <b>bold</b> world</p><p>  </p><script>var a;</script>"
+            "<footer>Footer</footer><p>a &amp; b</p></body></html>"
+        )
+        assert monitor.html_to_text(html) == "Legal\nTerms of Service\nHello\nbold\nworld\na & b"
+
+    def test_selectolax_keeps_line_breaks_inside_text_nodes(self, monkeypatch):
+        pytest.importorskip("selectolax.lexbor")
+        monkeypatch.setattr(monitor, "_html_parser_class", None)
+        html = "<body><pre>  line 1\n\n  line 2  </pre><span> </span><p>end</p></body>"
+        assert monitor.html_to_text(html) == "line 1\n\n  line 2\nend"
+
+    def test_falls_back_to_beautifulsoup(self, monkeypatch):
+        soup = MagicMock()
+        soup.return_value.get_text.return_value = "soup text"
+        monkeypatch.setattr(monitor, "BeautifulSoup", soup)
+        monkeypatch.setattr(monitor, "_html_parser_class", False)
+        assert monitor.html_to_text("<p>x</p>") == "soup text"
+        soup.assert_called_once_with("<p>x</p>", "html.parser")
+
+
+# ---------------------------------------------------------------------------
+# JSON serialisation helper tests
+# ---------------------------------------------------------------------------
+
+class TestJsonHelpers:
+    _SAMPLE = {"updatedAt": "2026-01-01", "companies": [{"name": "Café", "score": 90, "tags": []}]}
+
+    def test_round_trip(self):
+        assert monitor._json_loads(monitor._json_dumps(self._SAMPLE)) == self._SAMPLE
+
+    def test_indented_output_matches_stdlib_fallback(self, monkeypatch):
+        fast = monitor._json_dumps(self._SAMPLE, indent=True)
+        monkeypatch.setattr(monitor, "orjson", None)
+        assert monitor._json_dumps(self._SAMPLE, indent=True) == fast
+
+    def test_write_results_writes_both_paths(self, tmp_env):
+        monitor.write_results(self._SAMPLE)
+        for path in (monitor.DATA_RESULTS_PATH, monitor.PUBLIC_RESULTS_PATH):
+            assert monitor._json_loads(path.read_bytes()) == self._SAMPLE
+
+    def test_write_results_links_second_copy_and_leaves_no_temp_files(self, tmp_env):
+        monitor.write_results(self._SAMPLE)
+        monitor.write_results(self._SAMPLE)
+        data_stat = monitor.DATA_RESULTS_PATH.stat()
+        public_stat = monitor.PUBLIC_RESULTS_PATH.stat()
+        assert (data_stat.st_dev, data_stat.st_ino) == (public_stat.st_dev, public_stat.st_ino)
+        for directory in (monitor.DATA_RESULTS_PATH.parent, monitor.PUBLIC_RESULTS_PATH.parent):
+            assert not [p for p in directory.iterdir() if p.name.endswith(".tmp")]
+
+    def test_written_payload_is_parsed_once(self, tmp_env, monkeypatch):
+        parsed = []
+        real_loads = monitor._json_loads
+
+        def counting_loads(data):
+            parsed.append(data)
+            return real_loads(data)
+
+        monkeypatch.setattr(monitor, "_json_loads", counting_loads)
+        payload = monitor.write_results(self._SAMPLE)
+        monitor.validate_results(self._SAMPLE, payload)
+        assert parsed == [payload]
+
+
+# ---------------------------------------------------------------------------
+# AI response cache tests
+# ---------------------------------------------------------------------------
+
+class TestCachedAiCall:
+    def _counting(self, reply="AI summary"):
+        calls = {"n": 0}
+
+        def fn(text):
+            calls["n"] += 1
+            return reply
+
+        return fn, calls
+
+    def test_identical_input_served_from_cache(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "test-key")
+        fn, calls = self._counting()
+        assert monitor.cached_ai_call("prompt", "same diff", fn) == "AI summary"
+        assert monitor.cached_ai_call("prompt", "same diff", fn) == "AI summary"
+        assert calls["n"] == 1
+
+    def test_prompt_change_misses_cache(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "test-key")
+        fn, calls = self._counting()
+        monitor.cached_ai_call("prompt v1", "same diff", fn)
+        monitor.cached_ai_call("prompt v2", "same diff", fn)
+        assert calls["n"] == 2
+
+    def test_nothing_cached_without_api_key(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "")
+        fn, calls = self._counting()
+        monitor.cached_ai_call("prompt", "diff", fn)
+        monitor.cached_ai_call("prompt", "diff", fn)
+        assert calls["n"] == 2
+        assert not monitor.AI_CACHE_DIR.exists()
+
+    def test_failures_are_not_cached(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "test-key")
+
+        def fail(text):
+            raise RuntimeError("rate limited")
+
+        with pytest.raises(RuntimeError):
+            monitor.cached_ai_call("prompt", "diff", fail)
+        fn, calls = self._counting()
+        assert monitor.cached_ai_call("prompt", "diff", fn) == "AI summary"
+        assert calls["n"] == 1
+
+    def test_age_comes_from_entry_not_file_mtime(self, tmp_env, monkeypatch):
+        # A fresh checkout gives every committed entry a brand-new mtime.
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "test-key")
+        fn, calls = self._counting()
+        monitor.cached_ai_call("prompt", "diff", fn)
+        later = time.time() + monitor.AI_CACHE_MAX_AGE_SECONDS + 1
+        monkeypatch.setattr(monitor.time, "time", lambda: later)
+        monitor._ai_cache_path("prompt", "diff").touch()
+        monitor.cached_ai_call("prompt", "diff", fn)
+        assert calls["n"] == 2
+
+    def test_prune_removes_expired_and_unreadable_entries(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(monitor, "OPENAI_API_KEY", "test-key")
+        fn, _ = self._counting()
+        monitor.cached_ai_call("prompt", "old diff", fn)
+        stale = monitor._ai_cache_path("prompt", "old diff")
+        stale.write_bytes(monitor._json_dumps({"storedAt": 0, "result": "AI summary"}))
+        legacy = monitor.AI_CACHE_DIR / "legacy.json"
+        legacy.write_bytes(monitor._json_dumps("bare reply"))
+        monitor.cached_ai_call("prompt", "new diff", fn)
+        assert monitor.prune_ai_cache() == 2
+        assert [p.name for p in monitor.AI_CACHE_DIR.iterdir()] == [
+            monitor._ai_cache_path("prompt", "new diff").name
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Fetch / process pipeline
+# ---------------------------------------------------------------------------
+
+class TestFetchAndProcess:
+    def test_empty_input_returns_empty_list(self):
+        assert monitor.fetch_and_process([], lambda index, result: result) == []
+
+    def test_results_keep_input_order(self, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: url)
+
+        def process(index, text):
+            time.sleep(0.01 * (3 - index))
+            return f"processed {text}"
+
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        assert monitor.fetch_and_process(urls, process) == [f"processed {u}" for u in urls]
+
+    def test_processing_overlaps_fetching(self, monkeypatch):
+        monkeypatch.setattr(monitor, "FETCH_CONCURRENCY", 2)
+        first_processed = threading.Event()
+
+        def fetch(url):
+            # The slow page only finishes once the fast one has been processed.
+            if url == "slow":
+                assert first_processed.wait(timeout=5)
+            return url
+
+        def process(index, text):
+            if text == "fast":
+                first_processed.set()
+            return text
+
+        monkeypatch.setattr(monitor, "fetch_text", fetch)
+        assert monitor.fetch_and_process(["slow", "fast"], process) == ["slow", "fast"]
+
+    def test_concurrency_limits_read_from_environment(self, monkeypatch):
+        monkeypatch.setenv("AI_CONCURRENCY", "12")
+        assert monitor._env_int("AI_CONCURRENCY", 4) == 12
+        for bad in ("", "zero", "0", "-3"):
+            monkeypatch.setenv("AI_CONCURRENCY", bad)
+            assert monitor._env_int("AI_CONCURRENCY", 4) == 4
+
+    def test_http_engine_skips_browser(self, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: f"browser {url}")
+        monkeypatch.setattr(monitor, "fetch_text_http", lambda url: f"http {url}")
+        results = monitor.fetch_and_process(
+            ["a", "b", "c"], lambda index, text: text, engines=["http", "browser", "http"]
+        )
+        assert results == ["http a", "browser b", "http c"]
+
+    def test_duplicate_urls_fetched_once(self, monkeypatch):
+        fetched = []
+
+        def fetch(url):
+            fetched.append(url)
+            return f"text {url}"
+
+        monkeypatch.setattr(monitor, "fetch_text", fetch)
+        results = monitor.fetch_and_process(
+            ["a", "b", "a", "a"], lambda index, text: (index, text)
+        )
+        assert sorted(fetched) == ["a", "b"]
+        assert results == [(0, "text a"), (1, "text b"), (2, "text a"), (3, "text a")]
+
+    def test_process_exception_propagates(self, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: url)
+
+        def process(index, text):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            monitor.fetch_and_process(["https://example.com"], process)
+
+    def test_monitor_summarises_changed_companies_concurrently(self, tmp_env, monkeypatch):
+        companies = [
+            {"name": f"Co{i}", "tosUrl": f"https://example.com/{i}", "category": "Tech"}
+            for i in range(3)
+        ]
+        monkeypatch.setattr(monitor, "load_config", lambda: companies)
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: f"ToS for {url}")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def overview(text):
+            barrier.wait()
+            return f"Summary of {text}"
+
+        monkeypatch.setattr(monitor, "call_openai_overview", overview)
+        results = monitor.monitor()
+        summaries = [c["summary"] for c in results["companies"]]
+        assert summaries == [f"Summary of ToS for https://example.com/{i}" for i in range(3)]
+        assert monitor.read_tos_summary("Co1") == summaries[1]
+
+
+# ---------------------------------------------------------------------------
+# Conditional (ETag / Last-Modified) fetch tests
+# ---------------------------------------------------------------------------
+
+class TestConditionalFetch:
+    def _patch_playwright(self, monkeypatch, status=200, headers=None):
+        playwright = MagicMock()
+        page = (playwright.return_value.__enter__.return_value
+                .chromium.launch.return_value.new_context.return_value.new_page.return_value)
+        page.goto.return_value.status = status
+        page.goto.return_value.headers = headers or {}
+        page.content.return_value = "<p>page text</p>"
+        soup = MagicMock()
+        soup.return_value.get_text.return_value = "page text"
+        monkeypatch.setattr(monitor, "sync_playwright", playwright)
+        monkeypatch.setattr(monitor, "Stealth", MagicMock())
+        monkeypatch.setattr(monitor, "BeautifulSoup", soup)
+        monkeypatch.setattr(monitor, "_html_parser_class", False)
+        monkeypatch.setattr(monitor.time, "sleep", lambda seconds: None)
+        monkeypatch.setattr(monitor, "_http_validators", {})
+        return page
+
+    def test_browser_fetch_is_never_conditional(self, monkeypatch):
+        # A 304 would only vouch for the HTML shell, not the rendered page.
+        page = self._patch_playwright(monkeypatch, headers={"etag": '"v2"'})
+        monitor._http_validators["https://example.com/tos"] = {"etag": '"v1"'}
+        assert monitor.fetch_text("https://example.com/tos") == "page text"
+        assert monitor._http_validators["https://example.com/tos"] == {"etag": '"v1"'}
+        page.route.assert_not_called()
+
+    def test_validators_seeded_only_for_http_engines(self, tmp_env):
+        for name, engine in (("Http", "http"), ("Rendered", "browser")):
+            monitor.write_snapshot(name, "Hello ToS")
+            monitor.write_snapshot_meta(name, {"etag": '"v1"'})
+        monitor._seed_http_validators([
+            {"name": "Http", "tosUrl": "https://a.example/tos", "engine": "http"},
+            {"name": "Rendered", "tosUrl": "https://b.example/tos"},
+        ])
+        assert monitor._http_validators == {"https://a.example/tos": {"etag": '"v1"'}}
+
+    def test_new_company_on_shared_url_disables_validators(self, tmp_env):
+        monitor.write_snapshot("Parent", "Hello ToS")
+        monitor.write_snapshot_meta("Parent", {"etag": '"v1"'})
+        url = "https://example.com/tos"
+        monitor._seed_http_validators([
+            {"name": "Parent", "tosUrl": url, "engine": "http"},
+            {"name": "NewSub", "tosUrl": url, "engine": "http"},
+        ])
+        assert url not in monitor._http_validators
+
+    def test_meta_ignored_without_snapshot(self, tmp_env):
+        monitor.write_snapshot("Acme", "Hello ToS")
+        monitor.write_snapshot_meta("Acme", {"etag": '"v1"'})
+        assert monitor.read_snapshot_meta("Acme") == {"etag": '"v1"'}
+        monitor._existing_snapshot_path("Acme").unlink()
+        assert monitor.read_snapshot_meta("Acme") == {}
+
+    def test_monitor_persists_validators_and_handles_not_modified(self, tmp_env, monkeypatch):
+        url = "https://example.com/tos"
+        _use_fake_company(monkeypatch, tosUrl=url, engine="http")
+        monkeypatch.setattr(monitor, "call_openai_overview", lambda text: "Overview")
+
+        def fetch(url):
+            monitor._http_validators[url] = {"etag": '"v1"'}
+            return "ToS v1"
+
+        monkeypatch.setattr(monitor, "fetch_text_http", fetch)
+        monitor.monitor()
+        assert monitor.read_snapshot_meta("TestCo") == {"etag": '"v1"'}
+
+        seen = []
+
+        def not_modified(url):
+            seen.append(monitor._http_validators.get(url))
+            raise monitor.NotModified(url)
+
+        def fail_read(name):
+            raise AssertionError("snapshot should not be read on HTTP 304")
+
+        monkeypatch.setattr(monitor, "fetch_text_http", not_modified)
+        monkeypatch.setattr(monitor, "read_snapshot", fail_read)
+        result = monitor.monitor()["companies"][0]
+        assert result["changed"] is False
+        assert result["summary"] == "Overview"
+        assert seen == [{"etag": '"v1"'}]
+
+
+class TestFetchTextHttp:
+    def _patch_session(self, monkeypatch, status_code=200, text="", headers=None):
+        session = MagicMock()
+        session.get.return_value.status_code = status_code
+        session.get.return_value.text = text
+        session.get.return_value.headers = headers or {}
+        monkeypatch.setattr(monitor, "_http_session", session)
+        monkeypatch.setattr(monitor, "_html_parser_class", False)
+        monkeypatch.setattr(monitor, "_http_validators", {})
+        return session
+
+    def test_returns_page_text_and_records_validators(self, monkeypatch):
+        pytest.importorskip("selectolax.lexbor")
+        self._patch_session(monkeypatch, text="<p>Terms</p><script>x()</script>",
+                            headers={"etag": '"v2"'})
+        monkeypatch.setattr(monitor, "_html_parser_class", None)
+        assert monitor.fetch_text_http("https://example.com/tos") == "Terms"
+        assert monitor._http_validators["https://example.com/tos"] == {"etag": '"v2"'}
+
+    def test_not_modified(self, monkeypatch):
+        session = self._patch_session(monkeypatch, status_code=304)
+        monitor._http_validators["https://example.com/tos"] = {"etag": '"v1"'}
+        with pytest.raises(monitor.NotModified):
+            monitor.fetch_text_http("https://example.com/tos")
+        assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_body_encoding_sniffed_without_charset(self, monkeypatch):
+        session = self._patch_session(monkeypatch, headers={"content-type": "text/html"})
+        session.get.return_value.apparent_encoding = "utf-8"
+        monitor.fetch_text_http("https://example.com/tos")
+        assert session.get.return_value.encoding == "utf-8"
+
+    def test_declared_charset_is_kept(self, monkeypatch):
+        session = self._patch_session(
+            monkeypatch, headers={"content-type": "text/html; charset=windows-1252"}
+        )
+        session.get.return_value.encoding = "windows-1252"
+        monitor.fetch_text_http("https://example.com/tos")
+        assert session.get.return_value.encoding == "windows-1252"
+
+
+class TestFetchTextAuto:
+    URL = "https://example.com/tos"
+
+    def _patch(self, monkeypatch, http):
+        browser_calls = []
+
+        def browser(url):
+            browser_calls.append(url)
+            return "rendered"
+
+        monkeypatch.setattr(monitor, "fetch_text_http", http)
+        monkeypatch.setattr(monitor, "fetch_text", browser)
+        monkeypatch.setattr(monitor, "_http_validators", {})
+        return browser_calls
+
+    def test_static_page_skips_browser(self, monkeypatch):
+        page = "x" * monitor.AUTO_MIN_TEXT_CHARS
+        browser_calls = self._patch(monkeypatch, lambda url: page)
+        assert monitor.fetch_text_auto(self.URL) == page
+        assert browser_calls == []
+
+    def test_short_text_falls_back_to_browser(self, monkeypatch):
+        def http(url):
+            monitor._http_validators[url] = {"etag": '"shell"'}
+            return "Please enable JavaScript"
+
+        browser_calls = self._patch(monkeypatch, http)
+        assert monitor.fetch_text_auto(self.URL) == "rendered"
+        assert browser_calls == [self.URL]
+        assert self.URL not in monitor._http_validators
+
+    def test_http_error_falls_back_to_browser(self, monkeypatch):
+        def http(url):
+            raise RuntimeError("403 Forbidden")
+
+        browser_calls = self._patch(monkeypatch, http)
+        assert monitor.fetch_text_auto(self.URL) == "rendered"
+        assert browser_calls == [self.URL]
+
+    def test_not_modified_propagates(self, monkeypatch):
+        def http(url):
+            raise monitor.NotModified(url)
+
+        browser_calls = self._patch(monkeypatch, http)
+        with pytest.raises(monitor.NotModified):
+            monitor.fetch_text_auto(self.URL)
+        assert browser_calls == []
+
+    def test_auto_engine_routed_through_fetch_text_auto(self, monkeypatch):
+        monkeypatch.setattr(monitor, "fetch_text", lambda url: f"browser {url}")
+        monkeypatch.setattr(monitor, "fetch_text_auto", lambda url: f"auto {url}")
+        results = monitor.fetch_and_process(
+            ["a", "b"], lambda index, text: text, engines=["auto", "browser"]
+        )
+        assert results == ["auto a", "browser b"]
+
+
+class TestOpenAIRateLimit:
+    def _fake_clock(self, monkeypatch):
+        clock = {"now": 1000.0}
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock["now"] += seconds
+
+        monkeypatch.setattr(monitor.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(monitor.time, "sleep", sleep)
+        monkeypatch.setattr(monitor, "_openai_window", monitor.deque())
+        return clock, sleeps
+
+    def test_waits_when_request_budget_exhausted(self, monkeypatch):
+        clock, sleeps = self._fake_clock(monkeypatch)
+        monkeypatch.setattr(monitor, "OPENAI_MAX_RPM", 2)
+        monitor._reserve_openai_capacity(10)
+        clock["now"] += 5
+        monitor._reserve_openai_capacity(10)
+        assert sleeps == []
+        monitor._reserve_openai_capacity(10)
+        assert sleeps == [55]
+
+    def test_waits_when_token_budget_exhausted(self, monkeypatch):
+        clock, sleeps = self._fake_clock(monkeypatch)
+        monkeypatch.setattr(monitor, "OPENAI_MAX_TPM", 1000)
+        monitor._reserve_openai_capacity(600)
+        monitor._reserve_openai_capacity(300)
+        assert sleeps == []
+        monitor._reserve_openai_capacity(300)
+        assert sleeps == [60]
+
+    def test_oversized_request_not_blocked_forever(self, monkeypatch):
+        clock, sleeps = self._fake_clock(monkeypatch)
+        monkeypatch.setattr(monitor, "OPENAI_MAX_TPM", 100)
+        monitor._reserve_openai_capacity(5000)
+        assert sleeps == []
+
+    def test_openai_post_reserves_estimated_tokens(self, monkeypatch):
+        reserved = []
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "ok"}}]
+        }
+        monkeypatch.setattr(monitor, "_http_session", session)
+        monkeypatch.setattr(monitor, "_openai_replies", {})
+        monkeypatch.setattr(monitor, "_reserve_openai_capacity", reserved.append)
+        assert monitor._openai_post([{"role": "user", "content": "x" * 400}], max_tokens=64) == "ok"
+        body = session.post.call_args.kwargs["data"]
+        assert reserved == [len(body) // 4 + 64]
+
+    def test_concurrent_identical_requests_post_once(self, monkeypatch):
+        def post(*args, **kwargs):
+            time.sleep(0.02)
+            resp = MagicMock()
+            resp.json.return_value = {"choices": [{"message": {"content": "overview"}}]}
+            return resp
+
+        session = MagicMock()
+        session.post.side_effect = post
+        monkeypatch.setattr(monitor, "_http_session", session)
+        monkeypatch.setattr(monitor, "_openai_replies", {})
+        monkeypatch.setattr(monitor, "_openai_key_locks", {})
+        replies = []
+        threads = [
+            threading.Thread(
+                target=lambda: replies.append(
+                    monitor._openai_post([{"role": "user", "content": "same ToS"}])
+                )
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert replies == ["overview"] * 4
+        assert session.post.call_count == 1
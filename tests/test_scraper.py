@@ -6,6 +6,8 @@
 """
 import importlib.util
 import sys
+import threading
+import time
 import types
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -55,10 +57,18 @@ def tmp_env(tmp_path, monkeypatch):
     monkeypatch.setattr(scraper_monitor, "DATA_RESULTS_PATH", tmp_path / "data" / "results.json")
     monkeypatch.setattr(scraper_monitor, "PUBLIC_RESULTS_PATH", tmp_path / "public" / "data" / "results.json")
     monkeypatch.setattr(scraper_monitor, "TOS_DIR", tmp_path / "terms_of_service")
+    monkeypatch.setattr(scraper_monitor, "AI_CACHE_DIR", tmp_path / "data" / "ai_cache")
     scraper_monitor.ensure_dirs()
     return tmp_path
 
 
+def _raising(exc: BaseException):
+    """Return a stub that raises *exc* whenever it is called."""
+    def stub(*args, **kwargs):
+        raise exc
+    return stub
+
+
 # ---------------------------------------------------------------------------
 # SHA-256 hashing
 # ---------------------------------------------------------------------------
@@ -189,9 +199,16 @@ class TestCallOpenAIDiffSummary:
         monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
         monkeypatch.setattr(scraper_monitor, "_openai_post", lambda msgs, **kw: "Not valid JSON response")
         result = scraper_monitor.call_openai_diff_summary("diff text")
-        # Should not raise; should fall back to raw text
+        # Should not raise; should fall back to raw text, marked as a failure
         assert isinstance(result, dict)
-        assert "Privacy" in result
+        assert "Not valid JSON response" in result["Privacy"]
+        assert not scraper_monitor._ai_summary_cacheable(result)
+
+    def test_non_object_json_treated_as_unparseable(self, monkeypatch):
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_openai_post", lambda msgs, **kw: '["Changed"]')
+        result = scraper_monitor.call_openai_diff_summary("diff text")
+        assert result["Privacy"].startswith(scraper_monitor.AI_FAILURE_PREFIX)
 
     def test_handles_openai_exception(self, monkeypatch):
         monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
@@ -203,6 +220,107 @@ class TestCallOpenAIDiffSummary:
         assert "AI analysis failed" in result.get("Privacy", "")
 
 
+class TestOpenAIPostSession:
+    def test_posts_through_shared_session(self, monkeypatch):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "  reply  "}}]
+        }
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_http_session", session)
+        assert scraper_monitor._openai_post([{"role": "user", "content": "hi"}]) == "reply"
+        assert scraper_monitor._openai_post([{"role": "user", "content": "again"}]) == "reply"
+        assert session.post.call_count == 2
+
+    def test_identical_requests_answered_once_per_run(self, monkeypatch):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "choices": [{"message": {"content": "overview"}}]
+        }
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_http_session", session)
+        monkeypatch.setattr(scraper_monitor, "_openai_replies", {})
+        messages = [{"role": "user", "content": "full ToS text"}]
+        assert scraper_monitor._openai_post(messages) == "overview"
+        assert scraper_monitor._openai_post(messages) == "overview"
+        assert session.post.call_count == 1
+        # A different token budget is a different request.
+        scraper_monitor._openai_post(messages, max_tokens=64)
+        assert session.post.call_count == 2
+
+    def test_failed_requests_are_not_remembered(self, monkeypatch):
+        session = MagicMock()
+        session.post.return_value.raise_for_status.side_effect = RuntimeError("429")
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_http_session", session)
+        monkeypatch.setattr(scraper_monitor, "_openai_replies", {})
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                scraper_monitor._openai_post([{"role": "user", "content": "hi"}])
+        assert session.post.call_count == 2
+
+    def test_in_flight_requests_are_bounded(self, monkeypatch):
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def post(*args, **kwargs):
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.02)
+            with lock:
+                state["now"] -= 1
+            resp = MagicMock()
+            resp.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+            return resp
+
+        session = MagicMock()
+        session.post.side_effect = post
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_http_session", session)
+        monkeypatch.setattr(scraper_monitor, "_openai_replies", {})
+        monkeypatch.setattr(scraper_monitor, "_openai_slots", threading.BoundedSemaphore(2))
+        threads = [
+            threading.Thread(
+                target=scraper_monitor._openai_post,
+                args=([{"role": "user", "content": f"req {i}"}],),
+            )
+            for i in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert session.post.call_count == 6
+        assert state["peak"] <= 2
+
+    def test_companies_sharing_a_url_share_openai_requests(self, tmp_env, monkeypatch):
+        bodies = []
+        lock = threading.Lock()
+
+        def post(url, headers=None, data=None, timeout=None):
+            with lock:
+                bodies.append(data)
+            time.sleep(0.02)  # keep the two companies' requests overlapping
+            resp = MagicMock()
+            resp.json.return_value = {"choices": [{"message": {"content": "[]"}}]}
+            return resp
+
+        session = MagicMock()
+        session.post.side_effect = post
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_http_session", session)
+        monkeypatch.setattr(scraper_monitor, "fetch_text", lambda url: "Shared terms of service text.")
+        monkeypatch.setattr(scraper_monitor, "load_config", lambda: [
+            {"name": "ParentCo", "tosUrl": "https://example.com/tos", "category": "Test"},
+            {"name": "NewSub", "tosUrl": "https://example.com/tos", "category": "Test"},
+        ])
+        results = scraper_monitor.monitor()
+        assert [c["name"] for c in results["companies"]] == ["ParentCo", "NewSub"]
+        assert bodies
+        assert len(bodies) == len(set(bodies)), "identical OpenAI requests were posted twice"
+
+
 # ---------------------------------------------------------------------------
 # History management
 # ---------------------------------------------------------------------------
@@ -319,6 +437,27 @@ class TestValidateResults:
         results["companies"][0]["history"][0]["verdict"] = "Good"
         scraper_monitor.validate_results(results)
 
+    def test_checks_written_payload_instead_of_reserialising(self, tmp_env, monkeypatch):
+        results = self._make_valid_results()
+        payload = scraper_monitor.write_results(results)
+        assert scraper_monitor.DATA_RESULTS_PATH.read_bytes() == payload
+
+        def fail_dumps(*args, **kwargs):
+            raise AssertionError("results should not be serialised again")
+
+        def fail_loads(*args, **kwargs):
+            raise AssertionError("written payload should not be parsed again")
+
+        monkeypatch.setattr(scraper_monitor, "_json_dumps", fail_dumps)
+        monkeypatch.setattr(scraper_monitor, "_json_loads", fail_loads)
+        scraper_monitor.validate_results(results, payload)
+
+    def test_unparseable_payload_is_not_written(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(scraper_monitor, "_json_dumps", lambda *args, **kwargs: b"{not json")
+        with pytest.raises(ValueError):
+            scraper_monitor.write_results(self._make_valid_results())
+        assert not scraper_monitor.DATA_RESULTS_PATH.exists()
+
 
 # ---------------------------------------------------------------------------
 # Monitor integration: history accumulation
@@ -386,6 +525,52 @@ class TestMonitorHistoryAccumulation:
         assert company["history"][1]["previous_hash"] is not None
         assert company["history"][1]["previous_hash"] == company["history"][0]["current_hash"]
 
+    def test_unparseable_diff_summary_is_not_cached(self, tmp_env, monkeypatch):
+        texts = iter([
+            "ToS version 1 with privacy policy details about data collection.",
+            "ToS version 2 with arbitration clause and waived class action rights.",
+        ])
+        monkeypatch.setattr(scraper_monitor, "load_config", self._make_company_config)
+        monkeypatch.setattr(scraper_monitor, "fetch_text", lambda url, **kw: next(texts))
+        monkeypatch.setattr(scraper_monitor, "call_openai_first_summary",
+                            lambda text: {"Privacy": "v1", "DataOwnership": "ok", "UserRights": "ok"})
+        scraper_monitor.write_results(scraper_monitor.monitor())
+
+        monkeypatch.setattr(scraper_monitor, "OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(scraper_monitor, "_openai_post", lambda msgs, **kw: "Sorry, here is prose")
+        company = next(c for c in scraper_monitor.monitor()["companies"] if c["name"] == "TestCo")
+        assert len(company["history"]) == 2
+        assert not list(scraper_monitor.AI_CACHE_DIR.glob("*.json"))
+
+    def test_not_modified_keeps_history_without_reading_snapshot(self, tmp_env, monkeypatch):
+        monkeypatch.setattr(scraper_monitor, "load_config", self._make_company_config)
+        monkeypatch.setattr(scraper_monitor, "fetch_text", lambda url, **kw: "ToS version 1")
+        monkeypatch.setattr(scraper_monitor, "call_openai_first_summary",
+                            lambda text: {"Privacy": "v1", "DataOwnership": "ok", "UserRights": "ok"})
+        scraper_monitor.write_results(scraper_monitor.monitor())
+
+        def not_modified(url, **kw):
+            raise scraper_monitor.NotModified(url)
+
+        def fail_read(name):
+            raise AssertionError("snapshot should not be read on HTTP 304")
+
+        monkeypatch.setattr(scraper_monitor, "fetch_text", not_modified)
+        monkeypatch.setattr(scraper_monitor, "read_snapshot", fail_read)
+        company = next(c for c in scraper_monitor.monitor()["companies"] if c["name"] == "TestCo")
+        assert len(company["history"]) == 1
+        assert company["latestSummary"].startswith("[Privacy]: v1")
+
+    def test_new_company_on_shared_url_is_fetched_unconditionally(self, tmp_env):
+        url = "https://example.com/tos"
+        scraper_monitor.write_snapshot("ParentCo", "ToS version 1")
+        scraper_monitor.write_snapshot_meta("ParentCo", {"etag": '"v1"'})
+        scraper_monitor._seed_http_validators([
+            {"name": "ParentCo", "tosUrl": url, "engine": "http"},
+            {"name": "NewSub", "tosUrl": url, "engine": "http"},
+        ])
+        assert url not in scraper_monitor._http_validators
+
     def test_results_have_schema_version_2(self, tmp_env, monkeypatch):
         monkeypatch.setattr(scraper_monitor, "load_config", self._make_company_config)
         monkeypatch.setattr(scraper_monitor, "fetch_text", lambda url, **kw: "ToS content")
@@ -473,6 +658,24 @@ class TestComputeChangeMagnitude:
         assert 0.0 < result <= 100.0
 
 
+class TestLoadConfig:
+    def _write_config(self, tmp_path, monkeypatch, companies):
+        import json
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"companies": companies}))
+        monkeypatch.setattr(scraper_monitor, "CONFIG_PATH", config_path)
+
+    def test_known_engines_accepted(self, tmp_path, monkeypatch):
+        companies = [{"name": "A"}, {"name": "B", "engine": "http"}, {"name": "C", "engine": "auto"}]
+        self._write_config(tmp_path, monkeypatch, companies)
+        assert scraper_monitor.load_config() == companies
+
+    def test_unknown_engine_rejected(self, tmp_path, monkeypatch):
+        self._write_config(tmp_path, monkeypatch, [{"name": "Typo", "engine": "htpp"}])
+        with pytest.raises(ValueError, match="'Typo' has unknown engine 'htpp'"):
+            scraper_monitor.load_config()
+
+
 class TestLoadWatchlist:
     def test_loads_terms_from_file(self, tmp_path, monkeypatch):
         import json
@@ -1733,7 +1936,7 @@ class TestMonitorCurrentFields:
         ])
         # AI should NOT be called when text is unchanged and fields exist
         monkeypatch.setattr(scraper_monitor, "call_openai_overview",
-                            lambda t: (_ for _ in ()).throw(AssertionError("Should not call OpenAI")))
+                            lambda t: pytest.fail("Should not call OpenAI"))
 
         results = scraper_monitor.monitor()
         company = results["companies"][0]
@@ -1807,8 +2010,7 @@ class TestMonitorCurrentFields:
         }
         scraper_monitor.write_results(existing)
 
-        monkeypatch.setattr(scraper_monitor, "fetch_text",
-                            lambda url: (_ for _ in ()).throw(ConnectionError("timeout")))
+        monkeypatch.setattr(scraper_monitor, "fetch_text", _raising(ConnectionError("timeout")))
         monkeypatch.setattr(scraper_monitor, "load_config", lambda: [
             {"name": "TestCo", "tosUrl": "https://example.com/tos", "category": "Test"}
         ])